@@ -9,6 +9,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -58,6 +59,7 @@ from dbt.events.types import (
     ConstraintNotSupported,
     ConstraintNotEnforced,
 )
+from dbt.tracing import traced
 from dbt.utils import filter_null_values, executor, cast_to_str, AttrDict
 
 from dbt.adapters.base.connections import Connection, AdapterResponse, BaseConnectionManager
@@ -77,6 +79,9 @@ GET_CATALOG_MACRO_NAME = "get_catalog"
 GET_CATALOG_RELATIONS_MACRO_NAME = "get_catalog_relations"
 FRESHNESS_MACRO_NAME = "collect_freshness"
 
+# The most relations to get the catalog of in one get_catalog_relations query
+CATALOG_RELATIONS_BATCH_SIZE = 100
+
 
 class ConstraintSupport(str, Enum):
     ENFORCED = "enforced"
@@ -92,11 +97,15 @@ def _expect_row_value(key: str, row: agate.Row):
     return row[key]
 
 
+def _catalog_used_schemas(manifest: Manifest) -> FrozenSet[Tuple[str, str]]:
+    return frozenset((d.lower(), s.lower()) for d, s in manifest.get_used_schemas())
+
+
 def _catalog_filter_schemas(manifest: Manifest) -> Callable[[agate.Row], bool]:
     """Return a function that takes a row and decides if the row should be
     included in the catalog output.
     """
-    schemas = frozenset((d.lower(), s.lower()) for d, s in manifest.get_used_schemas())
+    schemas = _catalog_used_schemas(manifest)
 
     def test(row: agate.Row) -> bool:
         table_database = _expect_row_value("table_database", row)
@@ -282,6 +291,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             yield
 
     @available.parse(lambda *a, **k: ("", empty_table()))
+    @traced("execute", "adapter")
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False, limit: Optional[int] = None
     ) -> Tuple[AdapterResponse, agate.Table]:
@@ -309,6 +319,24 @@ class BaseAdapter(metaclass=AdapterMeta):
         """
         raise NotImplementedError("`validate_sql` is not implemented for this adapter!")
 
+    @available.parse_none
+    def load_seed_rows(
+        self, relation: BaseRelation, column_list: str, agate_table: agate.Table
+    ) -> Optional[str]:
+        """Load the rows of a seed into the (empty) relation in bulk, if the
+        adapter has a faster way to do that than the batched inserts of the
+        default load_csv_rows macro. (passable)
+
+        :param relation: The seed's table.
+        :param column_list: The quoted column names, separated by commas.
+        :param agate_table: The seed from load_agate_table. Use
+            agate_helper.iter_row_batches to read its rows, since it may only
+            hold a sample of them.
+        :return: The statement used to load the rows, or None if the rows
+            should be inserted instead.
+        """
+        return None
+
     @available.parse(lambda *a, **k: [])
     def get_column_schema_from_query(self, sql: str) -> List[BaseColumn]:
         """Get a list of the Columns with names and data types from the given sql."""
@@ -1114,7 +1142,27 @@ class BaseAdapter(metaclass=AdapterMeta):
             table.column_names,
             text_only_columns=["table_database", "table_schema", "table_name"],
         )
-        return table.where(_catalog_filter_schemas(manifest))
+        # This is table.where(_catalog_filter_schemas(manifest)), but looks up
+        # the columns by index, which is much faster than by name
+        if not table.rows:
+            return table
+        for key in ("table_database", "table_schema"):
+            if key not in table.column_names:
+                raise DbtInternalError(
+                    'Got a row without "{}" column, columns: {}'.format(key, table.column_names)
+                )
+        database_index = table.column_names.index("table_database")
+        schema_index = table.column_names.index("table_schema")
+        schemas = _catalog_used_schemas(manifest)
+        rows = [
+            row
+            for row in table.rows
+            # the schema may be present but None, which is not an error and
+            # should be filtered out
+            if row[schema_index] is not None
+            and (row[database_index].lower(), row[schema_index].lower()) in schemas
+        ]
+        return agate.Table(rows, table.column_names, table.column_types, _is_fork=True)
 
     def _get_one_catalog(
         self,
@@ -1156,43 +1204,86 @@ class BaseAdapter(metaclass=AdapterMeta):
         results = self._catalog_filter_table(table, manifest)  # type: ignore[arg-type]
         return results
 
-    def get_catalog(
-        self, manifest: Manifest, selected_nodes: Optional[Set] = None
-    ) -> Tuple[agate.Table, List[Exception]]:
-
-        with executor(self.config) as tpe:
-            futures: List[Future[agate.Table]] = []
-            catalog_relations = self._get_catalog_relations(manifest, selected_nodes)
-            relation_count = len(catalog_relations)
-            if relation_count <= 100 and self.has_feature(AdapterFeature.CatalogByRelations):
-                relations_by_schema = self._get_catalog_relations_by_info_schema(catalog_relations)
-                for info_schema in relations_by_schema:
-                    name = ".".join([str(info_schema.database), "information_schema"])
-                    relations = relations_by_schema[info_schema]
+    def _submit_catalog_queries(
+        self,
+        tpe,
+        manifest: Manifest,
+        selected_nodes: Optional[Set] = None,
+        by_relations: bool = False,
+    ) -> List[Future[agate.Table]]:
+        futures: List[Future[agate.Table]] = []
+        catalog_relations = self._get_catalog_relations(manifest, selected_nodes)
+        relation_count = len(catalog_relations)
+        if (by_relations or relation_count <= CATALOG_RELATIONS_BATCH_SIZE) and self.has_feature(
+            AdapterFeature.CatalogByRelations
+        ):
+            relations_by_schema = self._get_catalog_relations_by_info_schema(catalog_relations)
+            for info_schema in relations_by_schema:
+                name = ".".join([str(info_schema.database), "information_schema"])
+                relations = relations_by_schema[info_schema]
+                for start in range(0, len(relations), CATALOG_RELATIONS_BATCH_SIZE):
                     fut = tpe.submit_connected(
                         self,
                         name,
                         self._get_one_catalog_by_relations,
                         info_schema,
-                        relations,
+                        relations[start : start + CATALOG_RELATIONS_BATCH_SIZE],
                         manifest,
                     )
                     futures.append(fut)
-            else:
-                schema_map: SchemaSearchMap = self._get_catalog_schemas(manifest)
-                for info, schemas in schema_map.items():
-                    if len(schemas) == 0:
-                        continue
-                    name = ".".join([str(info.database), "information_schema"])
-                    fut = tpe.submit_connected(
-                        self, name, self._get_one_catalog, info, schemas, manifest
-                    )
-                    futures.append(fut)
+        else:
+            schema_map: SchemaSearchMap = self._get_catalog_schemas(manifest)
+            for info, schemas in schema_map.items():
+                if len(schemas) == 0:
+                    continue
+                name = ".".join([str(info.database), "information_schema"])
+                fut = tpe.submit_connected(
+                    self, name, self._get_one_catalog, info, schemas, manifest
+                )
+                futures.append(fut)
+        return futures
 
+    def get_catalog(
+        self, manifest: Manifest, selected_nodes: Optional[Set] = None
+    ) -> Tuple[agate.Table, List[Exception]]:
+
+        with executor(self.config) as tpe:
+            futures = self._submit_catalog_queries(tpe, manifest, selected_nodes)
             catalogs, exceptions = catch_as_completed(futures)
 
         return catalogs, exceptions
 
+    def iter_catalog(
+        self,
+        manifest: Manifest,
+        selected_nodes: Optional[Set] = None,
+        by_relations: bool = False,
+    ) -> Iterator[Union[agate.Table, Exception]]:
+        """Like get_catalog, but yield the table of each catalog query as soon
+        as it completes instead of merging them, so the caller can process
+        each one while the others run and drop it afterwards. Queries that
+        fail yield their exception.
+
+        If 'by_relations' is set, only the selected relations are queried, no
+        matter how many there are, which requires the CatalogByRelations
+        feature. Otherwise adapters that override get_catalog yield its merged
+        table, followed by its exceptions.
+        """
+        if by_relations:
+            if not self.has_feature(AdapterFeature.CatalogByRelations):
+                raise DbtInternalError(
+                    f"The {self.type()} adapter can't get the catalog of specific relations"
+                )
+        elif type(self).get_catalog is not BaseAdapter.get_catalog:
+            catalogs, exceptions = self.get_catalog(manifest, selected_nodes)
+            yield catalogs
+            yield from exceptions
+            return
+
+        with executor(self.config) as tpe:
+            futures = self._submit_catalog_queries(tpe, manifest, selected_nodes, by_relations)
+            yield from iter_as_completed(futures)
+
     def cancel_open_connections(self):
         """Cancel all open connections."""
         return self.connections.cancel_open()
@@ -1555,23 +1646,37 @@ join diff_count using (id)
 """.strip()
 
 
-def catch_as_completed(
+def iter_as_completed(
     futures,  # typing: List[Future[agate.Table]]
-) -> Tuple[agate.Table, List[Exception]]:
-    # catalogs: agate.Table = agate.Table(rows=[])
-    tables: List[agate.Table] = []
-    exceptions: List[Exception] = []
-
+) -> Iterator[Union[agate.Table, Exception]]:
+    """Yield the table of each future as it completes, or its exception if it
+    failed. Completed futures are removed from 'futures', so their tables can
+    be freed once the caller is done with them.
+    """
     for future in as_completed(futures):
+        futures.remove(future)
         exc = future.exception()
         # we want to re-raise on ctrl+c and BaseException
         if exc is None:
-            catalog = future.result()
-            tables.append(catalog)
+            yield future.result()
         elif isinstance(exc, KeyboardInterrupt) or not isinstance(exc, Exception):
             raise exc
         else:
             warn_or_error(CatalogGenerationError(exc=str(exc)))
             # exc is not None, derives from Exception, and isn't ctrl+c
-            exceptions.append(exc)
+            yield exc
+
+
+def catch_as_completed(
+    futures,  # typing: List[Future[agate.Table]]
+) -> Tuple[agate.Table, List[Exception]]:
+    # catalogs: agate.Table = agate.Table(rows=[])
+    tables: List[agate.Table] = []
+    exceptions: List[Exception] = []
+
+    for result in iter_as_completed(futures):
+        if isinstance(result, Exception):
+            exceptions.append(result)
+        else:
+            tables.append(result)
     return merge_tables(tables), exceptions
@@ -11,6 +11,7 @@ from dbt.contracts.connection import Connection, ConnectionState, AdapterRespons
 from dbt.events.functions import fire_event
 from dbt.events.types import ConnectionUsed, SQLQuery, SQLCommit, SQLQueryStatus
 from dbt.events.contextvars import get_node_info
+from dbt.tracing import span
 from dbt.utils import cast_to_str
 
 
@@ -77,7 +78,8 @@ class SQLConnectionManager(BaseConnectionManager):
             pre = time.time()
 
             cursor = connection.handle.cursor()
-            cursor.execute(sql, bindings)
+            with span("query", "warehouse", connection=connection.name):
+                cursor.execute(sql, bindings)
 
             fire_event(
                 SQLQueryStatus(
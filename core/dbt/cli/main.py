@@ -22,6 +22,7 @@ from dbt.contracts.results import (
     RunExecutionResult,
 )
 from dbt.events.base_types import EventMsg
+from dbt.parser.watch import watch_project
 from dbt.task.build import BuildTask
 from dbt.task.clean import CleanTask
 from dbt.task.clone import CloneTask
@@ -122,6 +123,7 @@ class dbtRunner:
 # approach from https://github.com/pallets/click/issues/108#issuecomment-280489786
 def global_flags(func):
     @p.cache_selected_only
+    @p.compile_cache
     @p.debug
     @p.deprecated_print
     @p.enable_legacy_logger
@@ -133,6 +135,7 @@ def global_flags(func):
     @p.log_level_file
     @p.log_path
     @p.macro_debugging
+    @p.parse_workers
     @p.partial_parse
     @p.partial_parse_file_path
     @p.partial_parse_file_diff
@@ -144,6 +147,8 @@ def global_flags(func):
     @p.send_anonymous_usage_stats
     @p.single_threaded
     @p.static_parser
+    @p.template_cache
+    @p.trace_file
     @p.use_colors
     @p.use_colors_file
     @p.use_experimental_parser
@@ -180,6 +185,8 @@ def cli(ctx, **kwargs):
 @cli.command("build")
 @click.pass_context
 @global_flags
+@p.concurrency_limits
+@p.critical_path_scheduling
 @p.defer
 @p.deprecated_defer
 @p.exclude
@@ -194,6 +201,7 @@ def cli(ctx, **kwargs):
 @p.select
 @p.selector
 @p.show
+@p.skip_unchanged_seeds
 @p.state
 @p.defer_state
 @p.deprecated_state
@@ -258,11 +266,13 @@ def docs(ctx, **kwargs):
 @click.pass_context
 @global_flags
 @p.compile_docs
+@p.compile_workers
 @p.defer
 @p.deprecated_defer
 @p.exclude
 @p.favor_state
 @p.deprecated_favor_state
+@p.incremental_catalog
 @p.profile
 @p.profiles_dir
 @p.project_dir
@@ -329,6 +339,7 @@ def docs_serve(ctx, **kwargs):
 @cli.command("compile")
 @click.pass_context
 @global_flags
+@p.compile_workers
 @p.defer
 @p.deprecated_defer
 @p.exclude
@@ -573,6 +584,8 @@ cli.add_command(ls, "ls")
 @p.target_path
 @p.threads
 @p.vars
+@p.watch
+@p.watch_interval
 @requires.postflight
 @requires.preflight
 @requires.profile
@@ -582,6 +595,10 @@ cli.add_command(ls, "ls")
 def parse(ctx, **kwargs):
     """Parses the project and provides information on performance"""
     # manifest generation and writing happens in @requires.manifest
+    if ctx.obj["flags"].watch:
+        ctx.obj["manifest"] = watch_project(
+            ctx.obj["runtime_config"], ctx.obj["manifest"], ctx.obj["flags"].watch_interval
+        )
     return ctx.obj["manifest"], True
 
 
@@ -589,6 +606,8 @@ def parse(ctx, **kwargs):
 @cli.command("run")
 @click.pass_context
 @global_flags
+@p.concurrency_limits
+@p.critical_path_scheduling
 @p.defer
 @p.deprecated_defer
 @p.favor_state
@@ -729,6 +748,8 @@ def run_operation(ctx, **kwargs):
 @cli.command("seed")
 @click.pass_context
 @global_flags
+@p.concurrency_limits
+@p.critical_path_scheduling
 @p.exclude
 @p.full_refresh
 @p.profile
@@ -737,6 +758,7 @@ def run_operation(ctx, **kwargs):
 @p.select
 @p.selector
 @p.show
+@p.skip_unchanged_seeds
 @p.state
 @p.defer_state
 @p.deprecated_state
@@ -766,6 +788,8 @@ def seed(ctx, **kwargs):
 @cli.command("snapshot")
 @click.pass_context
 @global_flags
+@p.concurrency_limits
+@p.critical_path_scheduling
 @p.defer
 @p.deprecated_defer
 @p.exclude
@@ -857,6 +881,8 @@ cli.commands["source"].add_command(snapshot_freshness, "snapshot-freshness")  #
 @cli.command("test")
 @click.pass_context
 @global_flags
+@p.concurrency_limits
+@p.critical_path_scheduling
 @p.defer
 @p.deprecated_defer
 @p.exclude
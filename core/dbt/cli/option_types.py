@@ -56,6 +56,26 @@ class WarnErrorOptionsType(YAML):
         )
 
 
+class ConcurrencyLimitsType(YAML):
+    """The Click ConcurrencyLimits type. Converts YAML strings into a dict of
+    selection criteria to positive integers."""
+
+    name = "ConcurrencyLimitsType"
+
+    def convert(self, value, param, ctx):
+        # this function is being used by param in click
+        limits = super().convert(value, param, ctx)
+
+        for criteria, limit in limits.items():
+            if not isinstance(criteria, str):
+                self.fail(f"Concurrency limit key '{criteria}' is not a string", param, ctx)
+            if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+                self.fail(
+                    f"Concurrency limit for '{criteria}' must be a positive integer", param, ctx
+                )
+        return limits
+
+
 class Truthy(ParamType):
     """The Click Truthy type.  Converts strings into a "truthy" type"""
 
@@ -2,7 +2,13 @@ from pathlib import Path
 
 import click
 from dbt.cli.options import MultiOption
-from dbt.cli.option_types import YAML, ChoiceTuple, WarnErrorOptionsType, Package
+from dbt.cli.option_types import (
+    YAML,
+    ChoiceTuple,
+    ConcurrencyLimitsType,
+    WarnErrorOptionsType,
+    Package,
+)
 from dbt.cli.resolvers import default_project_dir, default_profiles_dir
 from dbt.version import get_version_information
 
@@ -54,6 +60,29 @@ compile_inject_ephemeral_ctes = click.option(
     default=True,
 )
 
+compile_cache = click.option(
+    "--compile-cache/--no-compile-cache",
+    envvar="DBT_COMPILE_CACHE",
+    help="Reuse the rendered code of nodes whose code, config, refs and macros haven't changed since the last invocation, from a cache in the target directory.",
+    default=False,
+)
+
+compile_workers = click.option(
+    "--compile-workers",
+    envvar="DBT_COMPILE_WORKERS",
+    help="Render the selected nodes in this many worker processes before compiling them. By default, nodes are rendered by the compile threads.",
+    default=None,
+    type=click.INT,
+)
+
+concurrency_limits = click.option(
+    "--concurrency-limits",
+    envvar="DBT_CONCURRENCY_LIMITS",
+    default="{}",
+    help="""Limit how many of the selected nodes matching a selection method can run at the same time, on top of --threads. This argument should be a YAML string mapping single selection criteria to positive integers, eg. '{"resource_type:snapshot": 2, "config.materialized:table": 8}'""",
+    type=ConcurrencyLimitsType(),
+)
+
 config_dir = click.option(
     "--config-dir",
     envvar=None,
@@ -61,6 +90,13 @@ config_dir = click.option(
     is_flag=True,
 )
 
+critical_path_scheduling = click.option(
+    "--critical-path-scheduling/--no-critical-path-scheduling",
+    envvar="DBT_CRITICAL_PATH_SCHEDULING",
+    help="Run the nodes on the slowest remaining chain of nodes first, using the execution times in the run_results.json of the --state directory. Without run history, nodes are ordered by depth as usual.",
+    default=False,
+)
+
 debug = click.option(
     "--debug/--no-debug",
     "-d/ ",
@@ -141,6 +177,13 @@ indirect_selection = click.option(
     default="eager",
 )
 
+incremental_catalog = click.option(
+    "--incremental-catalog/--no-incremental-catalog",
+    envvar="DBT_INCREMENTAL_CATALOG",
+    help="Update the previous catalog.json with only the relations built by the command in run_results.json, and the ones missing from the catalog. Relations changed by earlier commands or outside of dbt aren't updated. Needs an adapter that can get the catalog of specific relations.",
+    default=False,
+)
+
 lock = click.option(
     "--lock",
     envvar=None,
@@ -270,6 +313,14 @@ output_path = click.option(
     default=None,
 )
 
+parse_workers = click.option(
+    "--parse-workers",
+    envvar="DBT_PARSE_WORKERS",
+    help="Render SQL models, snapshots and analyses in this many worker processes while parsing. By default, files are parsed serially.",
+    default=None,
+    type=click.INT,
+)
+
 partial_parse = click.option(
     "--partial-parse/--no-partial-parse",
     envvar="DBT_PARTIAL_PARSE",
@@ -471,6 +522,13 @@ single_threaded = click.option(
     hidden=True,
 )
 
+skip_unchanged_seeds = click.option(
+    "--skip-unchanged-seeds/--no-skip-unchanged-seeds",
+    envvar="DBT_SKIP_UNCHANGED_SEEDS",
+    help="Don't reload seeds whose file and config haven't changed since they were last loaded by dbt seed or dbt build, as recorded in target/seed_state.json. They are reported as succeeding with no changes. Changes made to the seed tables in other ways aren't detected.",
+    default=False,
+)
+
 skip_profile_setup = click.option(
     "--skip-profile-setup",
     "-s",
@@ -569,6 +627,20 @@ target_path = click.option(
     type=click.Path(),
 )
 
+template_cache = click.option(
+    "--template-cache/--no-template-cache",
+    envvar="DBT_TEMPLATE_CACHE",
+    help="Store the compiled code of Jinja templates in the target directory, so that later invocations don't compile them again.",
+    default=False,
+)
+
+trace_file = click.option(
+    "--trace-file",
+    envvar="DBT_TRACE_FILE",
+    help="Record the time spent parsing, compiling, running nodes, querying the warehouse and writing artifacts, on each thread, and write it to the specified file as a Chrome trace. Example: `--trace-file trace.json`",
+    type=click.Path(exists=False),
+)
+
 upgrade = click.option(
     "--upgrade",
     envvar=None,
@@ -634,6 +706,22 @@ version_check = click.option(
     default=True,
 )
 
+watch = click.option(
+    "--watch",
+    envvar=None,
+    help="Keep the parsed project in memory and reparse it whenever project files change, until interrupted.",
+    is_flag=True,
+    default=False,
+)
+
+watch_interval = click.option(
+    "--watch-interval",
+    envvar=None,
+    help="How often, in seconds, to check for changed files when running with --watch.",
+    type=click.FLOAT,
+    default=1.0,
+)
+
 warn_error = click.option(
     "--warn-error",
     envvar="DBT_WARN_ERROR",
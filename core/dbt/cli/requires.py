@@ -7,8 +7,10 @@ from dbt.cli.exceptions import (
     ResultExit,
 )
 from dbt.cli.flags import Flags
+from dbt.clients.jinja import set_template_bytecode_cache
 from dbt.config import RuntimeConfig
 from dbt.config.runtime import load_project, load_profile, UnsetProfile
+from dbt.constants import TEMPLATE_CACHE_DIR_NAME
 from dbt.events.base_types import EventLevel
 from dbt.events.functions import fire_event, LOG_VERSION, set_invocation_id, setup_event_logger
 from dbt.events.types import (
@@ -23,6 +25,7 @@ from dbt.events.types import MainEncounteredError, MainStackTrace
 from dbt.exceptions import Exception as DbtException, DbtProjectError, FailFastError
 from dbt.parser.manifest import ManifestLoader, write_manifest
 from dbt.profiler import profiler
+from dbt.tracing import tracing
 from dbt.tracking import active_user, initialize_from_flags, track_run
 from dbt.utils import cast_dict_to_dict_of_strings
 from dbt.plugins import set_up_plugin_manager, get_plugin_manager
@@ -30,6 +33,7 @@ from dbt.plugins import set_up_plugin_manager, get_plugin_manager
 from click import Context
 from functools import update_wrapper
 import importlib.util
+import os
 import time
 import traceback
 
@@ -69,6 +73,12 @@ def preflight(func):
         if flags.RECORD_TIMING_INFO:
             ctx.with_resource(profiler(enable=True, outfile=flags.RECORD_TIMING_INFO))
 
+        # Tracing
+        if flags.TRACE_FILE:
+            ctx.with_resource(
+                tracing(enable=True, outfile=flags.TRACE_FILE, name=f"dbt {flags.WHICH}")
+            )
+
         # Adapter management
         ctx.with_resource(adapter_management())
 
@@ -186,6 +196,13 @@ def project(func):
         )
         ctx.obj["project"] = project
 
+        # Compiled templates are reused by later invocations
+        set_template_bytecode_cache(
+            os.path.join(project.project_target_path, TEMPLATE_CACHE_DIR_NAME)
+            if flags.TEMPLATE_CACHE
+            else None
+        )
+
         # Plugins
         set_up_plugin_manager(project_name=project.project_name)
 
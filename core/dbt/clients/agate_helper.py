@@ -1,11 +1,14 @@
 from codecs import BOM_UTF8
 
 import agate
+import csv
 import datetime
+import decimal
 import isodate
 import json
+import math
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Union, Optional, Any, Sequence, Tuple
 
 from dbt.exceptions import DbtRuntimeError
 
@@ -90,7 +93,120 @@ def table_from_rows(
         # literal 'null' strings to a None representation.
         column_types = build_type_tester(text_only_columns, string_null_values=())
 
-    return agate.Table(rows, column_names, column_types=column_types)
+    column_names = list(column_names)
+    if not column_names:
+        return agate.Table(rows, column_names, column_types=column_types)
+
+    num_columns = len(column_names)
+    padded_rows = []
+    for index, row in enumerate(rows):
+        if isinstance(row, agate.MappedSequence):
+            # the values of a row from another table
+            row = row.values()
+        row_length = len(row)
+        if row_length > num_columns:
+            raise ValueError(
+                f"Row {index} has {row_length} values, but Table only has {num_columns} columns."
+            )
+        elif row_length < num_columns:
+            row = list(row) + [None] * (num_columns - row_length)
+        padded_rows.append(row)
+    if padded_rows:
+        columns: List[Sequence[Any]] = list(zip(*padded_rows))
+    else:
+        columns = [() for _ in column_names]
+    return _table_from_columns(columns, column_names, column_types)
+
+
+# Values of these types are equal only when they're the same value, so the
+# type test and cast of one apply to all of them
+_CACHED_CAST_TYPES = (str, int, bool, type(None))
+
+
+def _table_from_columns(
+    columns: Sequence[Sequence[Any]], column_names: Sequence[str], type_tester: agate.TypeTester
+) -> agate.Table:
+    """Make the same table as agate.Table(rows, column_names, type_tester),
+    but a column at a time: each distinct value is only tested and cast
+    once, and the table is made from the cast rows without casting them
+    again (like merge_tables).
+    """
+    names = tuple(agate.utils.deduplicate(column_names, column_names=True))
+    forced = type_tester._force
+    column_types = []
+    cast_columns = []
+    for name, values in zip(names, columns):
+        if name in forced:
+            column_type = forced[name]
+        else:
+            column_type = _infer_column_type(values, type_tester._possible_types)
+        column_types.append(column_type)
+        cast_columns.append(_cast_column(column_type, values, name))
+
+    rows = [agate.Row(values, names) for values in zip(*cast_columns)]
+    return agate.Table(rows, names, column_types, _is_fork=True)
+
+
+def _infer_column_type(
+    values: Sequence[Any], possible_types: Sequence[agate.data_types.DataType]
+) -> agate.data_types.DataType:
+    # This is agate.TypeTester.run for one column. The order the values are
+    # tested in doesn't change the result, so each distinct value is tested
+    # once.
+    hypotheses = list(possible_types)
+    for value in _distinct_values(values):
+        if len(hypotheses) == 1:
+            break
+        hypotheses = [t for t in hypotheses if t.test(value)]
+    # Select in prefer order
+    return next(t for t in possible_types if t in hypotheses)
+
+
+def _distinct_values(values: Sequence[Any]) -> Iterator[Any]:
+    for value_type in set(map(type, values)):
+        if value_type in _CACHED_CAST_TYPES:
+            yield from {value for value in values if type(value) is value_type}
+        else:
+            yield from (value for value in values if type(value) is value_type)
+
+
+def _casts_to_itself(column_type: agate.data_types.DataType, values: Sequence[Any]) -> bool:
+    # Whether casting the values to the column type returns them unchanged,
+    # which is true of most results from a database
+    value_types = set(map(type, values))
+    value_types.discard(type(None))
+    if type(column_type) is agate.data_types.Text:
+        return not (column_type.cast_nulls and column_type.null_values) and value_types <= {str}
+    elif type(column_type) is Integer:
+        return value_types <= {int}
+    elif type(column_type) is Number:
+        return value_types <= {decimal.Decimal}
+    return False
+
+
+def _cast_column(
+    column_type: agate.data_types.DataType, values: Sequence[Any], name: str
+) -> List[Any]:
+    if _casts_to_itself(column_type, values):
+        return list(values)
+
+    cast = column_type.cast
+    # the cast values of each type, so True and 1 are kept apart
+    cast_values: Dict[type, Dict[Any, Any]] = {t: {} for t in _CACHED_CAST_TYPES}
+    result = []
+    for index, value in enumerate(values):
+        cache = cast_values.get(type(value))
+        if cache is not None and value in cache:
+            result.append(cache[value])
+            continue
+        try:
+            cast_value = cast(value)
+        except agate.exceptions.CastError as exc:
+            raise agate.exceptions.CastError(f"{exc} Error at row {index} column {name}.")
+        if cache is not None:
+            cache[value] = cast_value
+        result.append(cast_value)
+    return result
 
 
 def table_from_data(data, column_names: Iterable[str]) -> agate.Table:
@@ -116,25 +232,32 @@ def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
     None (eg. '' or 'null' will retain their string literal representations).
     """
 
-    rows = []
-    text_only_columns = set()
-    for _row in data:
-        row = []
-        for col_name in column_names:
-            value = _row[col_name]
-            if isinstance(value, (dict, list, tuple)):
-                # Represent container types as json strings
-                value = json.dumps(value, cls=dbt.utils.JSONEncoder)
-                text_only_columns.add(col_name)
-            elif isinstance(value, str):
-                text_only_columns.add(col_name)
-            row.append(value)
+    column_names = list(column_names)
+    if not column_names:
+        return table_from_rows(
+            rows=[[] for _ in data], column_names=column_names, text_only_columns=()
+        )
 
-        rows.append(row)
-
-    return table_from_rows(
-        rows=rows, column_names=column_names, text_only_columns=text_only_columns
-    )
+    columns = []
+    text_only_columns = set()
+    for col_name in column_names:
+        values = [_row[col_name] for _row in data]
+        value_types = set(map(type, values))
+        if any(issubclass(t, (dict, list, tuple)) for t in value_types):
+            # Represent container types as json strings
+            values = [
+                json.dumps(value, cls=dbt.utils.JSONEncoder)
+                if isinstance(value, (dict, list, tuple))
+                else value
+                for value in values
+            ]
+            text_only_columns.add(col_name)
+        elif any(issubclass(t, str) for t in value_types):
+            text_only_columns.add(col_name)
+        columns.append(values)
+
+    type_tester = build_type_tester(text_only_columns, string_null_values=())
+    return _table_from_columns(columns, column_names, type_tester)
 
 
 def empty_table():
@@ -154,7 +277,190 @@ def from_csv(abspath, text_columns, delimiter=","):
     with open(abspath, encoding="utf-8") as fp:
         if fp.read(1) != BOM:
             fp.seek(0)
-        return agate.Table.from_csv(fp, column_types=type_tester, delimiter=delimiter)
+        table = agate.Table.from_csv(fp, column_types=type_tester, delimiter=delimiter)
+    table.row_count = len(table.rows)
+    table.row_batches = lambda batch_size: _batches(table.rows, batch_size)
+    return table
+
+
+# The number of rows of a streamed seed that are kept in memory, besides the
+# rows with the extreme values of each column
+SEED_SAMPLE_SIZE = 1000
+
+
+def from_csv_sample(abspath, text_columns, delimiter=",", sample_size=SEED_SAMPLE_SIZE):
+    """Like from_csv, but only the first 'sample_size' rows, and the rows
+    with the smallest, largest, longest and most precise value of each column,
+    are loaded into the table. The column types are the same as from_csv
+    would infer from all the rows, and the sample has the same MaxPrecision,
+    MaxLength, Min and Max as the whole column, so it can be used to pick the
+    database types. The rows of the whole file are read in batches with
+    table.row_batches(batch_size), and table.row_count is the number of rows.
+    """
+    seed_csv = SeedCsv(abspath, text_columns, delimiter)
+    table = seed_csv.sample_table(sample_size)
+    table.row_count = seed_csv.row_count
+    table.row_batches = seed_csv.row_batches
+    return table
+
+
+def iter_row_batches(table: agate.Table, batch_size: int) -> Iterator[List[Sequence[Any]]]:
+    """The rows of a table from from_csv or from_csv_sample, or of any other
+    agate table, in lists of 'batch_size' rows
+    """
+    if hasattr(table, "row_batches"):
+        return table.row_batches(batch_size)
+    return _batches(table.rows, batch_size)
+
+
+def _batches(rows: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class SeedCsv:
+    """A csv file that is read a row at a time instead of being loaded into
+    an agate.Table, so that large seeds don't have to fit in memory. The
+    file is parsed like agate.Table.from_csv does, and the column types are
+    inferred from all the rows with the same rules.
+    """
+
+    def __init__(self, abspath: str, text_columns: Iterable[str], delimiter: str = ",") -> None:
+        self.abspath = abspath
+        self.delimiter = delimiter
+        self.type_tester = build_type_tester(text_columns=text_columns)
+        self.column_names: Tuple[str, ...] = ()
+        self.row_count = 0
+        self._column_types: Optional[Tuple[agate.data_types.DataType, ...]] = None
+
+    def _raw_rows(self) -> Iterator[List[str]]:
+        with open(self.abspath, encoding="utf-8", newline="") as fp:
+            if fp.read(1) != BOM:
+                fp.seek(0)
+            reader = csv.reader(fp, delimiter=self.delimiter)
+            header = next(reader, None)
+            self.column_names = (
+                tuple(agate.utils.deduplicate(header, column_names=True)) if header else ()
+            )
+            num_columns = len(self.column_names)
+            for index, row in enumerate(reader):
+                if len(row) > num_columns:
+                    raise ValueError(
+                        f"Row {index} has {len(row)} values, but Table only has "
+                        f"{num_columns} columns."
+                    )
+                yield row
+
+    @property
+    def column_types(self) -> Tuple[agate.data_types.DataType, ...]:
+        if self._column_types is None:
+            self._column_types = self._infer_column_types()
+        return self._column_types
+
+    def _infer_column_types(self) -> Tuple[agate.data_types.DataType, ...]:
+        # This is agate.TypeTester.run, without keeping the rows
+        possible_types = self.type_tester._possible_types
+        forced = self.type_tester._force
+        hypotheses: List[Optional[List[agate.data_types.DataType]]] = []
+        for row in self._raw_rows():
+            if not hypotheses:
+                hypotheses = [
+                    None if name in forced else list(possible_types) for name in self.column_names
+                ]
+            for i, value in enumerate(row):
+                types = hypotheses[i]
+                if types is None or len(types) == 1:
+                    continue
+                hypotheses[i] = [t for t in types if t.test(value)]
+        if not hypotheses:
+            # no rows
+            hypotheses = [
+                None if name in forced else list(possible_types) for name in self.column_names
+            ]
+
+        column_types = []
+        for name, types in zip(self.column_names, hypotheses):
+            if types is None:
+                column_types.append(forced[name])
+            else:
+                # Select in prefer order
+                column_types.append(next(t for t in possible_types if t in types))
+        return tuple(column_types)
+
+    def _cast_rows(self) -> Iterator[Tuple[List[str], Tuple[Any, ...]]]:
+        column_types = self.column_types
+        cast_funcs = [t.cast for t in column_types]
+        num_columns = len(column_types)
+        for index, raw_row in enumerate(self._raw_rows()):
+            if len(raw_row) < num_columns:
+                raw_row = raw_row + [None] * (num_columns - len(raw_row))  # type: ignore
+            try:
+                values = tuple(cast(value) for cast, value in zip(cast_funcs, raw_row))
+            except agate.exceptions.CastError as exc:
+                raise agate.exceptions.CastError(f"{exc} Error at row {index}.")
+            yield raw_row, values
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        for _, values in self._cast_rows():
+            yield values
+
+    def row_batches(self, batch_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+        return _batches(self.rows(), batch_size)
+
+    def sample_table(self, sample_size: int = SEED_SAMPLE_SIZE) -> agate.Table:
+        column_types = self.column_types
+        extremes: List[Dict[str, Tuple[Any, int, List[str]]]] = [{} for _ in column_types]
+        sample: Dict[int, List[str]] = {}
+        row_count = 0
+        for index, (raw_row, values) in enumerate(self._cast_rows()):
+            row_count += 1
+            if index < sample_size:
+                sample[index] = raw_row
+            for i, value in enumerate(values):
+                for key, metric in _extreme_metrics(column_types[i], value):
+                    current = extremes[i].get(key)
+                    if current is None or metric > current[0]:
+                        extremes[i][key] = (metric, index, raw_row)
+        self.row_count = row_count
+
+        for column_extremes in extremes:
+            for _, index, raw_row in column_extremes.values():
+                sample[index] = raw_row
+        rows = [sample[index] for index in sorted(sample)]
+        return agate.Table(rows, self.column_names, column_types)
+
+
+def _extreme_metrics(column_type: agate.data_types.DataType, value: Any):
+    """The measures of a value to maximize, so that the sample of a seed has
+    the same aggregates as the whole column.
+    """
+    if value is None:
+        yield "null", 0
+    elif isinstance(column_type, agate.data_types.Number):
+        if math.isnan(value) or math.isinf(value):
+            return
+        yield "max", value
+        yield "min", -value
+        # see agate.utils.max_precision
+        _, digits, exponent = value.normalize().as_tuple()
+        yield "decimal_places", -exponent
+        yield "whole_places", len(digits) + exponent
+    elif isinstance(column_type, agate.data_types.Text):
+        yield "length", len(value)
+    elif isinstance(column_type, (agate.data_types.Date, agate.data_types.DateTime)):
+        # compare the distance from the earliest date, which can be negated
+        if isinstance(value, datetime.datetime):
+            distance = value.replace(tzinfo=None) - datetime.datetime.min
+        else:
+            distance = value - datetime.date.min
+        yield "max", distance
+        yield "min", -distance
 
 
 class _NullMarker:
@@ -215,7 +521,7 @@ def _merged_column_types(tables: List[agate.Table]) -> Dict[str, agate.data_type
             column_name: str = table.column_names[i]
             column_type: NullableAgateType = table.column_types[i]
             # avoid over-sensitive type inference
-            if all(x is None for x in table.columns[column_name]):
+            if all(row.values()[i] is None for row in table.rows):
                 column_type = _NullMarker()
             new_columns[column_name] = column_type
 
@@ -232,11 +538,17 @@ def merge_tables(tables: List[agate.Table]) -> agate.Table:
 
     rows: List[agate.Row] = []
     for table in tables:
-        if table.column_names == column_names and table.column_types == column_types:
+        if table.column_names == column_names:
+            # the values aren't cast to the merged types, so the rows can be
+            # reused whenever the columns are in the same order
             rows.extend(table.rows)
         else:
+            indexes = [
+                table.column_names.index(name) if name in table.column_names else None
+                for name in column_names
+            ]
             for row in table.rows:
-                data = [row.get(name, None) for name in column_names]
+                data = [None if index is None else row[index] for index in indexes]
                 rows.append(agate.Row(data, column_names))
     # _is_fork to tell agate that we already made things into `Row`s.
     return agate.Table(rows, column_names, column_types, _is_fork=True)
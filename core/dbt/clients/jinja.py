@@ -1,19 +1,39 @@
 import codecs
+import hashlib
+import importlib.metadata
 import linecache
 import os
 import re
+import sys
 import tempfile
 import threading
 from ast import literal_eval
+from collections import ChainMap
 from contextlib import contextmanager
 from itertools import chain, islice
-from typing import List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple, Callable
+from typing import (
+    List,
+    Union,
+    Set,
+    Optional,
+    Dict,
+    Any,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Type,
+    NoReturn,
+    Tuple,
+    Callable,
+)
 
 import jinja2
+import jinja2.bccache
 import jinja2.ext
 import jinja2.nativetypes  # type: ignore
 import jinja2.nodes
 import jinja2.parser
+import jinja2.runtime
 import jinja2.sandbox
 
 from dbt.utils import (
@@ -42,6 +62,7 @@ from dbt.exceptions import (
 )
 from dbt.flags import get_flags
 from dbt.node_types import ModelLanguage
+from dbt.version import __version__ as dbt_version
 
 
 SUPPORTED_LANG_ARG = jinja2.nodes.Name("supported_languages", "param")
@@ -106,6 +127,19 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
 
         return super()._compile(source, filename)  # type: ignore
 
+    def compile(self, source, name=None, filename=None, raw=False, defer_init=False):
+        """Look for the compiled code of the template in the template
+        bytecode cache before compiling it, and store it there afterwards."""
+        cache = template_bytecode_cache
+        if cache is None or raw or not isinstance(source, str) or get_flags().MACRO_DEBUGGING:
+            return super().compile(source, name, filename, raw, defer_init)
+
+        bucket = cache.get_source_bucket(self, source, name, defer_init)
+        if bucket.code is None:
+            bucket.code = super().compile(source, name, filename, raw, defer_init)
+            cache.dump_bytecode(bucket)
+        return bucket.code
+
 
 class NativeSandboxEnvironment(MacroFuzzEnvironment):
     code_generator_class = jinja2.nativetypes.NativeCodeGenerator
@@ -190,6 +224,20 @@ class NativeSandboxTemplate(jinja2.nativetypes.NativeTemplate):  # mypy: ignore
 NativeSandboxEnvironment.template_class = NativeSandboxTemplate  # type: ignore
 
 
+def new_template_context(template, ctx: Mapping[str, Any]) -> jinja2.runtime.Context:
+    """Create the jinja Context to render 'template' with 'ctx'. Unlike
+    Template.render and Template.make_module, this doesn't copy 'ctx' and
+    the template's globals into a new dict, which would look up every key in
+    a LazyContext. Only the names that the template uses are looked up."""
+    return jinja2.runtime.new_context(  # type: ignore[attr-defined]
+        template.environment,
+        template.name,
+        template.blocks,
+        ChainMap(ctx, template.globals),  # type: ignore[arg-type]
+        shared=True,
+    )
+
+
 class TemplateCache:
     def __init__(self) -> None:
         self.file_cache: Dict[str, jinja2.Template] = {}
@@ -215,10 +263,119 @@ class TemplateCache:
 
 template_cache = TemplateCache()
 
+# The size of the template bytecode cache, in bytes, above which the least
+# recently used templates are removed
+TEMPLATE_BYTECODE_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
+
+class TemplateBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Stores the compiled code of templates in a directory, so that
+    templates are only compiled again when their source or the versions of
+    dbt, jinja or python change. Files are replaced atomically, so the
+    directory can be shared by concurrent invocations and worker processes.
+
+    When the files take up more than 'max_size' bytes, the least recently
+    used ones are removed until they take up three quarters of it.
+    """
+
+    def __init__(self, directory: str, max_size: int = TEMPLATE_BYTECODE_CACHE_MAX_SIZE) -> None:
+        super().__init__(directory, "%s.cache")
+        self.max_size = max_size
+        # the compiled code also depends on these
+        self.versions = (
+            dbt_version,
+            importlib.metadata.version("jinja2"),
+            sys.implementation.cache_tag,
+        )
+        self.size = sum(size for _, size, _ in self._files())
+        if self.size > self.max_size:
+            self.prune()
+
+    def _files(self) -> List[Tuple[float, int, str]]:
+        # (modification time, size, path) for every file in the cache
+        files: List[Tuple[float, int, str]] = []
+        if not os.path.isdir(self.directory):
+            return files
+        for entry in os.scandir(self.directory):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # removed by another process
+                continue
+            if entry.is_file():
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _path(self, bucket: jinja2.bccache.Bucket) -> str:
+        return os.path.join(self.directory, self.pattern % bucket.key)
+
+    def get_source_bucket(
+        self, environment: jinja2.Environment, source: str, name: Optional[str], defer_init: bool
+    ) -> jinja2.bccache.Bucket:
+        """Return the bucket for the given template source, with the
+        compiled code loaded if it's in the cache."""
+        key = hashlib.sha256()
+        for part in (
+            *self.versions,
+            type(environment).__qualname__,
+            ",".join(sorted(environment.extensions)),
+            repr(name),
+            repr(defer_init),
+            source,
+        ):
+            key.update(str(part).encode("utf-8"))
+            key.update(b"\0")
+        bucket = jinja2.bccache.Bucket(environment, key.hexdigest(), key.hexdigest())
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            # the modification time is when the template was last used
+            try:
+                os.utime(self._path(bucket))
+            except OSError:
+                pass
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        # the directory is created when the first template is stored, and
+        # may have been removed since by 'dbt clean'
+        os.makedirs(self.directory, exist_ok=True)
+        super().dump_bytecode(bucket)
+        try:
+            self.size += os.path.getsize(self._path(bucket))
+        except OSError:
+            return
+        if self.size > self.max_size:
+            self.prune()
+
+    def prune(self) -> None:
+        files = sorted(self._files())
+        self.size = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self.size <= self.max_size * 3 // 4:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
+
+
+template_bytecode_cache: Optional[TemplateBytecodeCache] = None
+
+
+def set_template_bytecode_cache(directory: Optional[str]) -> None:
+    """Store the compiled code of templates in 'directory', or only in memory
+    if it's None."""
+    global template_bytecode_cache
+    template_bytecode_cache = TemplateBytecodeCache(directory) if directory else None
+
 
 class BaseMacroGenerator:
-    def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
-        self.context: Optional[Dict[str, Any]] = context
+    def __init__(self, context: Optional[Mapping[str, Any]] = None) -> None:
+        self.context: Optional[Mapping[str, Any]] = context
 
     def get_template(self):
         raise NotImplementedError("get_template not implemented!")
@@ -229,13 +386,13 @@ class BaseMacroGenerator:
     def get_macro(self):
         name = self.get_name()
         template = self.get_template()
-        # make the module. previously we set both vars and local, but that's
-        # redundant: They both end up in the same place
-        # make_module is in jinja2.environment. It returns a TemplateModule
-        module = template.make_module(vars=self.context, shared=False)
-        macro = module.__dict__[get_dbt_macro_name(name)]
-        module.__dict__.update(self.context)
-        return macro
+        # make the module. This is what template.make_module does, without
+        # copying the context into the module's jinja Context.
+        assert self.context is not None
+        module = jinja2.environment.TemplateModule(
+            template, new_template_context(template, self.context)
+        )
+        return module.__dict__[get_dbt_macro_name(name)]
 
     @contextmanager
     def exception_handler(self) -> Iterator[None]:
@@ -281,7 +438,7 @@ class MacroGenerator(BaseMacroGenerator):
     def __init__(
         self,
         macro,
-        context: Optional[Dict[str, Any]] = None,
+        context: Optional[Mapping[str, Any]] = None,
         node: Optional[Any] = None,
         stack: Optional[MacroStack] = None,
     ) -> None:
@@ -337,7 +494,7 @@ class QueryStringGenerator(BaseMacroGenerator):
         env = get_environment()
         self.template = env.from_string(
             self.template_str,
-            globals=self.context,
+            globals=context,
         )
 
     def get_name(self) -> str:
@@ -529,7 +686,7 @@ def parse(string):
 
 def get_template(
     string: str,
-    ctx: Dict[str, Any],
+    ctx: Mapping[str, Any],
     node=None,
     capture_macros: bool = False,
     native: bool = False,
@@ -538,12 +695,20 @@ def get_template(
         env = get_environment(node, capture_macros, native=native)
 
         template_source = str(string)
-        return env.from_string(template_source, globals=ctx)
+        return env.from_string(template_source, globals=ctx)  # type: ignore[arg-type]
 
 
-def render_template(template, ctx: Dict[str, Any], node=None) -> str:
+def render_template(template, ctx: Mapping[str, Any], node=None) -> str:
     with catch_jinja(node):
-        return template.render(ctx)
+        # this is what template.render does, without copying the context
+        context = new_template_context(template, ctx)
+        try:
+            rendered = template.root_render_func(context)
+            if isinstance(template, NativeSandboxTemplate):
+                return quoted_native_concat(rendered)
+            return template.environment.concat(rendered)
+        except Exception:
+            return template.environment.handle_exception()
 
 
 def _requote_result(raw_value: str, rendered: str) -> str:
@@ -570,7 +735,7 @@ _render_cache: Dict[str, Any] = dict()
 
 def get_rendered(
     string: str,
-    ctx: Dict[str, Any],
+    ctx: Mapping[str, Any],
     node=None,
     capture_macros: bool = False,
     native: bool = False,
@@ -637,7 +802,7 @@ GENERIC_TEST_KWARGS_NAME = "_dbt_generic_test_kwargs"
 
 
 def add_rendered_test_kwargs(
-    context: Dict[str, Any],
+    context: MutableMapping[str, Any],
     node: GenericTestNode,
     capture_macros: bool = False,
 ) -> None:
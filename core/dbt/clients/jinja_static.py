@@ -1,15 +1,58 @@
+from typing import List, Optional
+
 import jinja2
 from dbt.clients.jinja import get_environment
 from dbt.exceptions import MacroNamespaceNotStringError, MacroNameNotStringError
 
+# The kinds of calls returned by extract_macro_calls. A 'call' is the name of
+# a function or macro that is called, a 'dispatch_name' is a macro name passed
+# to adapter.dispatch and a 'dispatch' is the adapter.dispatch call itself,
+# with the macro name and namespace to dispatch.
+MACRO_CALL = "call"
+DISPATCH_NAME = "dispatch_name"
+DISPATCH = "dispatch"
+
+StaticMacroCall = List[Optional[str]]
+
 
 def statically_extract_macro_calls(string, ctx, db_wrapper=None):
+    return resolve_macro_calls(extract_macro_calls(string), ctx, db_wrapper)
+
+
+def resolve_macro_calls(calls: List[StaticMacroCall], ctx, db_wrapper=None):
+    """Return the names of the macros that the 'calls' found by
+    extract_macro_calls could call, given the context and the adapter."""
+    standard_calls = ["source", "ref", "config"]
+    possible_macro_calls = []
+    for kind, func_name, *extra in calls:
+        if kind == DISPATCH_NAME:
+            possible_macro_calls.append(func_name)
+        elif kind == DISPATCH:
+            macro_namespace = extra[0]
+            if db_wrapper:
+                macro = db_wrapper.dispatch(func_name, macro_namespace=macro_namespace).macro
+                possible_macro_calls.append(f"{macro.package_name}.{macro.name}")
+            elif macro_namespace:  # this is only for tests/unit/test_macro_calls.py
+                possible_macro_calls.append(f"{macro_namespace}.{func_name}")
+        elif func_name in standard_calls:
+            continue
+        elif ctx.get(func_name):
+            continue
+        elif func_name not in possible_macro_calls:
+            possible_macro_calls.append(func_name)
+
+    return possible_macro_calls
+
+
+def extract_macro_calls(string: str) -> List[StaticMacroCall]:
+    """Return the calls in the Jinja 'string', in the order they appear.
+    These only depend on 'string', so they can be saved and resolved later.
+    """
     # set 'capture_macros' to capture undefined
     env = get_environment(None, capture_macros=True)
     parsed = env.parse(string)
 
-    standard_calls = ["source", "ref", "config"]
-    possible_macro_calls = []
+    calls: List[StaticMacroCall] = []
     for func_call in parsed.find_all(jinja2.nodes.Call):
         func_name = None
         if hasattr(func_call, "node") and hasattr(func_call.node, "name"):
@@ -40,10 +83,7 @@ def statically_extract_macro_calls(string, ctx, db_wrapper=None):
                 macro_name = func_call.node.attr
                 if package_name == "adapter":
                     if macro_name == "dispatch":
-                        ad_macro_calls = statically_parse_adapter_dispatch(
-                            func_call, ctx, db_wrapper
-                        )
-                        possible_macro_calls.extend(ad_macro_calls)
+                        calls.extend(statically_parse_adapter_dispatch(func_call))
                     else:
                         # This skips calls such as adapter.parse_index
                         continue
@@ -53,15 +93,9 @@ def statically_extract_macro_calls(string, ctx, db_wrapper=None):
                 continue
         if not func_name:
             continue
-        if func_name in standard_calls:
-            continue
-        elif ctx.get(func_name):
-            continue
-        else:
-            if func_name not in possible_macro_calls:
-                possible_macro_calls.append(func_name)
+        calls.append([MACRO_CALL, func_name])
 
-    return possible_macro_calls
+    return calls
 
 
 # Call(
@@ -87,8 +121,8 @@ def statically_extract_macro_calls(string, ctx, db_wrapper=None):
 #   dyn_args=None,
 #   dyn_kwargs=None
 # )
-def statically_parse_adapter_dispatch(func_call, ctx, db_wrapper):
-    possible_macro_calls = []
+def statically_parse_adapter_dispatch(func_call) -> List[StaticMacroCall]:
+    calls: List[StaticMacroCall] = []
     # This captures an adapter.dispatch('<macro_name>') call.
 
     func_name = None
@@ -96,7 +130,7 @@ def statically_parse_adapter_dispatch(func_call, ctx, db_wrapper):
     if len(func_call.args) > 0:
         func_name = func_call.args[0].value
     if func_name:
-        possible_macro_calls.append(func_name)
+        calls.append([DISPATCH_NAME, func_name])
 
     # packages positional argument
     macro_namespace = None
@@ -115,7 +149,7 @@ def statically_parse_adapter_dispatch(func_call, ctx, db_wrapper):
                 # This will remain to enable static resolution
                 if type(kwarg.value).__name__ == "Const":
                     func_name = kwarg.value.value
-                    possible_macro_calls.append(func_name)
+                    calls.append([DISPATCH_NAME, func_name])
                 else:
                     raise MacroNameNotStringError(kwarg_value=kwarg.value.value)
             elif kwarg.key == "macro_namespace":
@@ -137,16 +171,5 @@ def statically_parse_adapter_dispatch(func_call, ctx, db_wrapper):
             # This will remain to enable static resolution
             macro_namespace = packages_arg.value
 
-    if db_wrapper:
-        macro = db_wrapper.dispatch(func_name, macro_namespace=macro_namespace).macro
-        func_name = f"{macro.package_name}.{macro.name}"
-        possible_macro_calls.append(func_name)
-    else:  # this is only for tests/unit/test_macro_calls.py
-        if macro_namespace:
-            packages = [macro_namespace]
-        else:
-            packages = []
-        for package_name in packages:
-            possible_macro_calls.append(f"{package_name}.{func_name}")
-
-    return possible_macro_calls
+    calls.append([DISPATCH, func_name, macro_namespace])
+    return calls
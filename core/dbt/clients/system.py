@@ -11,7 +11,7 @@ import subprocess
 import sys
 import tarfile
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, NoReturn, Optional, Tuple, Type, Union
 
 import dbt.exceptions
 import requests
@@ -163,11 +163,19 @@ def supports_symlinks() -> bool:
 
 
 def write_file(path: str, contents: str = "") -> bool:
+    return write_file_chunks(path, [str(contents)])
+
+
+def write_file_chunks(path: str, chunks: Iterable[str]) -> bool:
+    """Write the chunks to the file in turn, so that the whole contents don't
+    need to be in memory at once.
+    """
     path = convert_path(path)
     try:
         make_directory(os.path.dirname(path))
         with open(path, "w", encoding="utf-8") as f:
-            f.write(str(contents))
+            for chunk in chunks:
+                f.write(chunk)
     except Exception as exc:
         # note that you can't just catch FileNotFound, because sometimes
         # windows apparently raises something else.
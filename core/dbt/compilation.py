@@ -1,14 +1,20 @@
 import argparse
+import hashlib
 import json
+import multiprocessing
 
 import networkx as nx  # type: ignore
 import os
 import pickle
+import re
 
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, MutableMapping, Tuple, Optional
 
 from dbt.flags import get_flags
+from dbt.version import __version__
 from dbt.adapters.factory import get_adapter
 from dbt.clients import jinja
 from dbt.clients.system import make_directory
@@ -28,10 +34,12 @@ from dbt.exceptions import (
     DbtRuntimeError,
 )
 from dbt.graph import Graph
+from dbt.events.base_types import EventLevel
 from dbt.events.functions import fire_event, get_invocation_id
 from dbt.events.types import FoundStats, Note, WritingInjectedSQLForNode
 from dbt.events.contextvars import get_node_info
 from dbt.node_types import NodeType, ModelLanguage
+from dbt.tracing import traced
 from dbt.events.format import pluralize
 import dbt.tracking
 import dbt.task.list as list_task
@@ -39,6 +47,11 @@ import sqlparse
 
 graph_file_name = "graph.gpickle"
 
+_WITH_KEYWORD = re.compile(r"\bwith\b", re.IGNORECASE)
+
+# Don't bother starting processes for a handful of nodes
+MIN_NODES_FOR_PARALLEL_COMPILE = 2
+
 
 def print_compile_stats(stats):
     names = {
@@ -97,16 +110,19 @@ def _generate_stats(manifest: Manifest):
     return stats
 
 
-def _add_prepended_cte(prepended_ctes, new_cte):
-    for cte in prepended_ctes:
-        if cte.id == new_cte.id and new_cte.sql:
-            cte.sql = new_cte.sql
-            return
-    if new_cte.sql:
-        prepended_ctes.append(new_cte)
+def _add_prepended_cte(prepended_ctes: Dict[str, InjectedCTE], new_cte: InjectedCTE) -> None:
+    if not new_cte.sql:
+        return
+    cte = prepended_ctes.get(new_cte.id)
+    if cte is not None:
+        cte.sql = new_cte.sql
+    else:
+        prepended_ctes[new_cte.id] = new_cte
 
 
-def _extend_prepended_ctes(prepended_ctes, new_prepended_ctes):
+def _extend_prepended_ctes(
+    prepended_ctes: Dict[str, InjectedCTE], new_prepended_ctes: List[InjectedCTE]
+) -> None:
     for new_cte in new_prepended_ctes:
         _add_prepended_cte(prepended_ctes, new_cte)
 
@@ -288,7 +304,7 @@ class Compiler:
         node: ManifestSQLNode,
         manifest: Manifest,
         extra_context: Dict[str, Any],
-    ) -> Dict[str, Any]:
+    ) -> MutableMapping[str, Any]:
 
         context = generate_runtime_model_context(node, self.config, manifest)
         context.update(extra_context)
@@ -311,11 +327,17 @@ class Compiler:
         extra_context: Optional[Dict[str, Any]],
     ) -> Tuple[ManifestSQLNode, List[InjectedCTE]]:
         """This method is called by the 'compile_node' method. Starting
-        from the node that it is passed in, it will recursively call
-        itself using the 'extra_ctes'.  The 'ephemeral' models do
-        not produce SQL that is executed directly, instead they
-        are rolled up into the models that refer to them by
+        from the node that it is passed in, it compiles the ephemeral
+        models in its 'extra_ctes', and the ones they depend on. The
+        'ephemeral' models do not produce SQL that is executed directly,
+        instead they are rolled up into the models that refer to them by
         inserting CTEs into the SQL.
+
+        The ephemeral models are visited depth first, without recursion,
+        and each one has its ctes injected after the ephemeral models it
+        depends on. Their extra_ctes then hold the complete, ordered list
+        of ctes they need, so every ephemeral model is resolved once, and
+        the nodes that refer to it only extend their list with it.
         """
         if model.compiled_code is None:
             raise DbtRuntimeError("Cannot inject ctes into an uncompiled node", model)
@@ -328,22 +350,40 @@ class Compiler:
         if model.extra_ctes_injected:
             return (model, model.extra_ctes)
 
-        # Just to make it plain that nothing is actually injected for this case
-        if len(model.extra_ctes) == 0:
-            # SeedNodes don't have compilation attributes
-            if not isinstance(model, SeedNode):
-                model.extra_ctes_injected = True
-            return (model, [])
+        stack: List[ManifestSQLNode] = [model]
+        while stack:
+            current = stack[-1]
+            unresolved = self._next_unresolved_cte_model(current, manifest)
+            if unresolved is not None:
+                # This is an ephemeral parsed model that we can compile.
+                # Render the raw_code and set compiled to True. It's resolved
+                # on a later pass, after the models it depends on.
+                if not unresolved.compiled:
+                    self._compile_code(unresolved, manifest, extra_context)
+                stack.append(unresolved)
+                continue
+
+            stack.pop()
+            self._inject_ctes(current, manifest)
+            if current is not model:
+                # Write compiled SQL file
+                self._write_node(current)
 
-        # This stores the ctes which will all be recursively
-        # gathered and then "injected" into the model.
-        prepended_ctes: List[InjectedCTE] = []
+        # if model.extra_ctes is not set to prepended ctes, something went wrong
+        return model, model.extra_ctes
 
+    def _next_unresolved_cte_model(
+        self, model: ManifestSQLNode, manifest: Manifest
+    ) -> Optional[ManifestSQLNode]:
+        """The first ephemeral model in model.extra_ctes that hasn't had its
+        own ctes injected yet"""
         # extra_ctes are added to the model by
         # RuntimeRefResolver.create_relation, which adds an
         # extra_cte for every model relation which is an
         # ephemeral model. InjectedCTEs have a unique_id and sql.
-        # extra_ctes start out with sql set to None, and the sql is set in this loop.
+        # extra_ctes start out with sql set to None, and the sql is set by _inject_ctes.
+        if model.extra_ctes_injected:
+            return None
         for cte in model.extra_ctes:
             if cte.id not in manifest.nodes:
                 raise DbtInternalError(
@@ -356,25 +396,31 @@ class Compiler:
             if not cte_model.is_ephemeral_model:
                 raise DbtInternalError(f"{cte.id} is not ephemeral")
 
-            # This model has already been compiled and extra_ctes_injected, so it's been
-            # through here before. We already checked above for extra_ctes_injected, but
-            # checking again because updates maybe have happened in another thread.
-            if cte_model.compiled is True and cte_model.extra_ctes_injected is True:
-                new_prepended_ctes = cte_model.extra_ctes
+            # Checking both, because updates maybe have happened in another thread.
+            if not (cte_model.compiled is True and cte_model.extra_ctes_injected is True):
+                return cte_model
+        return None
 
-            # if the cte_model isn't compiled, i.e. first time here
-            else:
-                # This is an ephemeral parsed model that we can compile.
-                # Render the raw_code and set compiled to True
-                cte_model = self._compile_code(cte_model, manifest, extra_context)
-                # recursively call this method, sets extra_ctes_injected to True
-                cte_model, new_prepended_ctes = self._recursively_prepend_ctes(
-                    cte_model, manifest, extra_context
-                )
-                # Write compiled SQL file
-                self._write_node(cte_model)
+    def _inject_ctes(self, model: ManifestSQLNode, manifest: Manifest) -> None:
+        """Inject the ctes of the ephemeral models in model.extra_ctes, which
+        have all had their own ctes injected, into the model's compiled_code"""
+        if model.extra_ctes_injected:
+            return
 
-            _extend_prepended_ctes(prepended_ctes, new_prepended_ctes)
+        # Just to make it plain that nothing is actually injected for this case
+        if len(model.extra_ctes) == 0:
+            # SeedNodes don't have compilation attributes
+            if not isinstance(model, SeedNode):
+                model.extra_ctes_injected = True
+            return
+
+        # This stores the ctes which will all be gathered and then "injected"
+        # into the model, by unique_id and in order.
+        prepended_ctes: Dict[str, InjectedCTE] = {}
+        for cte in model.extra_ctes:
+            cte_model = manifest.nodes[cte.id]
+            assert not isinstance(cte_model, SeedNode)
+            _extend_prepended_ctes(prepended_ctes, cte_model.extra_ctes)
 
             new_cte_name = self.add_ephemeral_prefix(cte_model.name)
             rendered_sql = cte_model._pre_injected_sql or cte_model.compiled_code
@@ -384,17 +430,15 @@ class Compiler:
 
         # Check again before updating for multi-threading
         if not model.extra_ctes_injected:
+            assert model.compiled_code is not None
             injected_sql = inject_ctes_into_sql(
                 model.compiled_code,
-                prepended_ctes,
+                list(prepended_ctes.values()),
             )
             model.extra_ctes_injected = True
             model._pre_injected_sql = model.compiled_code
             model.compiled_code = injected_sql
-            model.extra_ctes = prepended_ctes
-
-        # if model.extra_ctes is not set to prepended ctes, something went wrong
-        return model, model.extra_ctes
+            model.extra_ctes = list(prepended_ctes.values())
 
     # Sets compiled_code and compiled flag in the ManifestSQLNode passed in,
     # creates a "context" dictionary for jinja rendering,
@@ -409,6 +453,30 @@ class Compiler:
         if extra_context is None:
             extra_context = {}
 
+        cache: Optional[CompiledCodeCache] = manifest._compiled_code_cache
+        # The node was already rendered by a compile worker process
+        rendered = manifest._rendered_nodes.pop(node.unique_id, None)
+        if rendered is None and cache is not None:
+            rendered = cache.get(node, manifest, self.config)
+            if rendered is not None:
+                rendered.apply(node)
+                return node
+
+        if rendered is not None:
+            rendered.apply(node)
+        else:
+            self._render_code(node, manifest, extra_context)
+
+        if cache is not None:
+            cache.put(node, manifest, self.config)
+        return node
+
+    def _render_code(
+        self,
+        node: ManifestSQLNode,
+        manifest: Manifest,
+        extra_context: Dict[str, Any],
+    ) -> None:
         if node.language == ModelLanguage.python:
             context = self._create_node_context(node, manifest, extra_context)
 
@@ -442,11 +510,10 @@ class Compiler:
             relation_name = str(relation_cls.create_from(self.config, node))
             node.relation_name = relation_name
 
-        return node
-
     # This method doesn't actually "compile" any of the nodes. That is done by the
     # "compile_node" method. This creates a Linker and builds the networkx graph,
     # writes out the graph.gpickle file, and prints the stats, returning a Graph object.
+    @traced("compile", "compile")
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
         linker = Linker()
@@ -541,6 +608,355 @@ class Compiler:
         return node
 
 
+@dataclass
+class RenderedNode:
+    """The result of rendering the code of one node in a compile worker
+    process. The ctes of ephemeral models are injected later, in the main
+    process, when the node is compiled."""
+
+    unique_id: str
+    compiled_code: Optional[str] = None
+    # ctes for the ephemeral models the node refs, without sql
+    extra_ctes: List[InjectedCTE] = field(default_factory=list)
+    relation_name: Optional[str] = None
+    # macros called while rendering are added to depends_on
+    macros: List[str] = field(default_factory=list)
+    # The worker couldn't render the node. It is rendered in the main process,
+    # so that errors are raised with the usual exception types and messages.
+    failed: bool = False
+
+    def apply(self, node: ManifestSQLNode) -> None:
+        node.compiled_code = self.compiled_code
+        node.compiled = True
+        node.extra_ctes = self.extra_ctes
+        node.relation_name = self.relation_name
+        for macro in self.macros:
+            node.depends_on.add_macro(macro)
+
+
+# The compiler and manifest used by worker processes. They're set in the main
+# process before the pool is created, and inherited by the (forked) workers
+# along with the adapter and its relation cache.
+_worker_compiler: Optional[Tuple[Compiler, Manifest]] = None
+
+
+def parallel_compile_supported() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _render_node_in_worker(unique_id: str) -> RenderedNode:
+    assert _worker_compiler is not None
+    compiler, manifest = _worker_compiler
+    node = manifest.nodes[unique_id]
+    assert not isinstance(node, SeedNode)
+    try:
+        with get_adapter(compiler.config).connection_for(node):
+            compiler._compile_code(node, manifest, {})
+    except Exception:
+        return RenderedNode(unique_id=unique_id, failed=True)
+    return RenderedNode(
+        unique_id=unique_id,
+        compiled_code=node.compiled_code,
+        extra_ctes=node.extra_ctes,
+        relation_name=node.relation_name,
+        macros=node.depends_on.macros,
+    )
+
+
+def nodes_to_render(manifest: Manifest, unique_ids: Iterable[str]) -> List[str]:
+    """The nodes in 'unique_ids' that have code to render, and the ephemeral
+    models they depend on, which are compiled into their ctes."""
+    to_render: List[str] = []
+    seen = set()
+    stack = [uid for uid in unique_ids if uid in manifest.nodes]
+    stack.reverse()
+    while stack:
+        unique_id = stack.pop()
+        if unique_id in seen:
+            continue
+        seen.add(unique_id)
+        node = manifest.nodes[unique_id]
+        if isinstance(node, SeedNode):
+            continue
+        to_render.append(unique_id)
+        for parent_id in node.depends_on.nodes:
+            parent = manifest.nodes.get(parent_id)
+            if parent is not None and parent.is_ephemeral_model:
+                stack.append(parent_id)
+    return to_render
+
+
+def render_nodes_in_parallel(
+    compiler: Compiler, manifest: Manifest, unique_ids: List[str], workers: int
+) -> None:
+    """Render the code of the given nodes in a pool of worker processes.
+
+    The results are kept on the manifest, and Compiler.compile_node uses them
+    instead of rendering the nodes again, so the ctes of ephemeral models are
+    still resolved and injected as in a serial compile.
+    """
+    global _worker_compiler
+
+    workers = min(workers, len(unique_ids))
+    chunksize = max(1, len(unique_ids) // (workers * 4))
+    fire_event(
+        Note(msg=f"Rendering {len(unique_ids)} nodes in {workers} processes"),
+        level=EventLevel.DEBUG,
+    )
+
+    _worker_compiler = (compiler, manifest)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            results = executor.map(_render_node_in_worker, unique_ids, chunksize=chunksize)
+            for result in results:
+                if not result.failed:
+                    manifest._rendered_nodes[result.unique_id] = result
+    finally:
+        _worker_compiler = None
+
+
+# Names in the rendering context that make a node's code depend on more than
+# its inputs: the database, the time or environment of the run, or the rest of
+# the project. They also cover side effects like logging. Nodes that use them,
+# directly or in the macros they call, are always rendered.
+NONDETERMINISTIC_CONTEXT_NAMES = frozenset(
+    {
+        "INVOCATION_COMMAND",
+        "adapter",
+        # macros looked up by name aren't in depends_on
+        "context",
+        "dbt_metadata_envs",
+        "env_var",
+        "exceptions",
+        "graph",
+        "invocation_args_dict",
+        "invocation_id",
+        "load_relation",
+        "load_result",
+        "log",
+        "modules",
+        "print",
+        "run_query",
+        "run_started_at",
+        "selected_resources",
+        "statement",
+        "store_raw_result",
+        "store_result",
+        "submit_python_job",
+        "write",
+    }
+)
+
+# The flags that can change how nodes render, which are part of the
+# invocation key. Templates that use 'flags' in any other way, such as reading
+# another flag or passing the object around, aren't cached.
+CACHE_KEY_FLAGS = ("DEFER", "FAVOR_STATE", "FULL_REFRESH", "STORE_FAILURES")
+_CACHE_KEY_FLAG_READ = re.compile(r"\bflags\s*\.\s*(?:{})\b".format("|".join(CACHE_KEY_FLAGS)))
+
+# adapter.dispatch only picks a macro, which is part of the fingerprint
+_DISPATCH_CALL = re.compile(r"\badapter\s*\.\s*dispatch\b")
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Node fields that are set by compiling the node
+_COMPILED_NODE_FIELDS = (
+    "compiled",
+    "compiled_code",
+    "compiled_path",
+    "build_path",
+    "created_at",
+    "depends_on",
+    "extra_ctes",
+    "extra_ctes_injected",
+    "relation_name",
+)
+
+
+def _is_nondeterministic(code: str) -> bool:
+    code = _CACHE_KEY_FLAG_READ.sub("", _DISPATCH_CALL.sub("", code))
+    names = set(_IDENTIFIER.findall(code))
+    return "flags" in names or not NONDETERMINISTIC_CONTEXT_NAMES.isdisjoint(names)
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class CompiledCodeCache:
+    """The rendered code of nodes from previous invocations, stored in the
+    target directory.
+
+    An entry is used in place of rendering a node when its fingerprint still
+    matches. The fingerprint covers the node itself (its raw code, config and
+    refs), the relations its refs and sources resolve to, the macros it calls
+    (and the macros they call), and the vars, target and CACHE_KEY_FLAGS of
+    the invocation. Nodes that use run_query, run_started_at or other names
+    in NONDETERMINISTIC_CONTEXT_NAMES, or read other flags, are not cached.
+    """
+
+    def __init__(self, path: str, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = entries or {}
+        self.modified = False
+        self._invocation_key: Optional[str] = None
+        # macro unique_id -> sha of the macro_sql, or None if nondeterministic
+        self._macro_digests: Dict[str, Optional[str]] = {}
+        # dispatched macro name (without the prefix) -> macro unique_ids
+        self._dispatch_candidates: Optional[Dict[str, List[str]]] = None
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledCodeCache":
+        entries = None
+        if os.path.exists(path):
+            try:
+                with open(path) as fp:
+                    contents = json.load(fp)
+                if contents.get("dbt_version") == __version__:
+                    entries = contents["nodes"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                fire_event(
+                    Note(msg=f"Could not read the compile cache at {path}, ignoring it"),
+                    level=EventLevel.DEBUG,
+                )
+        return cls(path, entries)
+
+    def write(self, manifest: Manifest) -> None:
+        if not self.modified:
+            return
+        nodes = {
+            unique_id: entry
+            for unique_id, entry in self.entries.items()
+            if unique_id in manifest.nodes
+        }
+        make_directory(os.path.dirname(self.path))
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump({"dbt_version": __version__, "nodes": nodes}, fp)
+        os.replace(tmp_path, self.path)
+        self.modified = False
+
+    def invocation_key(self, config, manifest: Manifest) -> str:
+        if self._invocation_key is None:
+            flags = get_flags()
+            self._invocation_key = _digest(
+                {
+                    "adapter_type": config.credentials.type,
+                    "target": config.to_target_dict(),
+                    "vars": config.vars.to_dict(),
+                    "cli_vars": config.cli_vars,
+                    "quoting": config.quoting,
+                    "dispatch": config.dispatch,
+                    "flags": {name: getattr(flags, name, None) for name in CACHE_KEY_FLAGS},
+                    # adding or removing a macro can change which one is called
+                    "macros": sorted(manifest.macros),
+                }
+            )
+        return self._invocation_key
+
+    def _dispatch_candidates_for(self, manifest: Manifest, name: str) -> List[str]:
+        if self._dispatch_candidates is None:
+            candidates: Dict[str, List[str]] = defaultdict(list)
+            for macro in manifest.macros.values():
+                _, _, base_name = macro.name.partition("__")
+                if base_name:
+                    candidates[base_name].append(macro.unique_id)
+            self._dispatch_candidates = candidates
+        _, _, base_name = name.partition("__")
+        return self._dispatch_candidates.get(base_name, []) if base_name else []
+
+    def _macro_digest(self, manifest: Manifest, unique_id: str) -> Optional[str]:
+        if unique_id not in self._macro_digests:
+            macro = manifest.macros.get(unique_id)
+            if macro is None or _is_nondeterministic(macro.macro_sql):
+                self._macro_digests[unique_id] = None
+            else:
+                self._macro_digests[unique_id] = hashlib.sha256(
+                    macro.macro_sql.encode("utf-8")
+                ).hexdigest()
+        return self._macro_digests[unique_id]
+
+    def _macros_digest(self, manifest: Manifest, macros: Iterable[str]) -> Optional[str]:
+        # the macros, the macros they call, and all implementations of the
+        # macros they dispatch to, since the dispatch search order isn't known
+        digests: Dict[str, str] = {}
+        stack = list(macros)
+        while stack:
+            unique_id = stack.pop()
+            if unique_id in digests:
+                continue
+            digest = self._macro_digest(manifest, unique_id)
+            if digest is None:
+                return None
+            digests[unique_id] = digest
+            macro = manifest.macros[unique_id]
+            stack.extend(macro.depends_on.macros)
+            stack.extend(self._dispatch_candidates_for(manifest, macro.name))
+        return _digest(digests)
+
+    def fingerprint(
+        self, node: ManifestSQLNode, manifest: Manifest, config, macros: Iterable[str]
+    ) -> Optional[str]:
+        """The fingerprint of the inputs to rendering 'node', or None if it
+        can't be cached."""
+        if node.language != ModelLanguage.sql or _is_nondeterministic(node.raw_code):
+            return None
+        macros_digest = self._macros_digest(manifest, macros)
+        if macros_digest is None:
+            return None
+
+        node_dict = node.to_dict(omit_none=True)
+        for name in _COMPILED_NODE_FIELDS:
+            node_dict.pop(name, None)
+        parents = []
+        for unique_id in node.depends_on.nodes:
+            parent = manifest.nodes.get(unique_id) or manifest.sources.get(unique_id)
+            defer_relation = getattr(parent, "defer_relation", None)
+            parents.append(
+                (
+                    unique_id,
+                    getattr(parent, "name", None),
+                    getattr(parent, "relation_name", None),
+                    getattr(parent, "is_ephemeral_model", False),
+                    defer_relation.relation_name if defer_relation else None,
+                )
+            )
+        return _digest([self.invocation_key(config, manifest), node_dict, parents, macros_digest])
+
+    def get(self, node: ManifestSQLNode, manifest: Manifest, config) -> Optional[RenderedNode]:
+        entry = self.entries.get(node.unique_id)
+        if entry is None:
+            return None
+        # rendering can call macros that parsing didn't see
+        macros = sorted(set(entry["macros"]) | set(node.depends_on.macros))
+        if self.fingerprint(node, manifest, config, macros) != entry["fingerprint"]:
+            return None
+        return RenderedNode(
+            unique_id=node.unique_id,
+            compiled_code=entry["compiled_code"],
+            extra_ctes=[InjectedCTE(id=cte["id"], sql=cte["sql"]) for cte in entry["extra_ctes"]],
+            relation_name=entry["relation_name"],
+            macros=entry["macros"],
+        )
+
+    def put(self, node: ManifestSQLNode, manifest: Manifest, config) -> None:
+        macros = sorted(node.depends_on.macros)
+        fingerprint = self.fingerprint(node, manifest, config, macros)
+        if fingerprint is None:
+            self.entries.pop(node.unique_id, None)
+            return
+        self.entries[node.unique_id] = {
+            "fingerprint": fingerprint,
+            "compiled_code": node.compiled_code,
+            "extra_ctes": [{"id": cte.id, "sql": cte.sql} for cte in node.extra_ctes],
+            "relation_name": node.relation_name,
+            "macros": macros,
+        }
+        self.modified = True
+
+
 def inject_ctes_into_sql(sql: str, ctes: List[InjectedCTE]) -> str:
     """
     `ctes` is a list of InjectedCTEs like:
@@ -573,6 +989,62 @@ def inject_ctes_into_sql(sql: str, ctes: List[InjectedCTE]) -> str:
     if len(ctes) == 0:
         return sql
 
+    position = _cte_insert_position(sql)
+    if position is None:
+        return _inject_ctes_with_sqlparse(sql, ctes)
+
+    insert_at, has_with = position
+    injected_ctes = ", ".join(c.sql for c in ctes)
+    if has_with:
+        # [with][joined_ctes][, ][original_sql]
+        return f"{sql[:insert_at]}{injected_ctes}, {sql[insert_at:]}"
+    # [with][joined_ctes][original_sql]
+    return f"{sql[:insert_at]}with{injected_ctes} {sql[insert_at:]}"
+
+
+def _cte_insert_position(sql: str) -> Optional[Tuple[int, bool]]:
+    """Find where to inject ctes into 'sql', and whether it already starts
+    with a 'with' clause, by only tokenizing the start of the statement.
+    Returns None when the whole statement has to be parsed to tell: when
+    there is more than one statement, or a 'with' further in."""
+    if ";" in sql:
+        return None
+
+    position = 0
+    first_position: Optional[int] = None
+    # the keyword that the ctes are injected after: 'with' or 'recursive'
+    with_keyword: Optional[str] = None
+    for ttype, value in sqlparse.lexer.tokenize(sql):
+        if ttype in sqlparse.tokens.Whitespace:
+            pass
+        elif (
+            with_keyword == "WITH"
+            and ttype in sqlparse.tokens.Keyword
+            and value.upper() == "RECURSIVE"
+        ):
+            with_keyword = "RECURSIVE"
+        elif with_keyword is not None:
+            # the ctes go before the next token after the keyword
+            return position, True
+        else:
+            if first_position is None:
+                # a missing 'with' is added before comments, but an existing
+                # one can follow them
+                first_position = position
+            if ttype in sqlparse.tokens.Keyword and value.upper() == "WITH":
+                with_keyword = "WITH"
+            elif ttype not in sqlparse.tokens.Comment:
+                if _WITH_KEYWORD.search(sql, position):
+                    return None
+                return first_position, False
+        position += len(value)
+
+    if with_keyword is not None:
+        return position, True
+    return None
+
+
+def _inject_ctes_with_sqlparse(sql: str, ctes: List[InjectedCTE]) -> str:
     parsed_stmts = sqlparse.parse(sql)
     parsed = parsed_stmts[0]
 
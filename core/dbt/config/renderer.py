@@ -1,4 +1,4 @@
-from typing import Dict, Any, Tuple, Optional, Union, Callable
+from typing import Dict, Any, Tuple, Optional, Union, Callable, Mapping
 import re
 import os
 from datetime import date
@@ -17,7 +17,7 @@ Keypath = Tuple[Union[str, int], ...]
 
 
 class BaseRenderer:
-    def __init__(self, context: Dict[str, Any]) -> None:
+    def __init__(self, context: Mapping[str, Any]) -> None:
         self.context = context
 
     @property
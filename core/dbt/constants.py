@@ -16,4 +16,6 @@ PACKAGE_LOCK_FILE_NAME = "package-lock.yml"
 MANIFEST_FILE_NAME = "manifest.json"
 SEMANTIC_MANIFEST_FILE_NAME = "semantic_manifest.json"
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+TEMPLATE_CACHE_DIR_NAME = "template_cache"
+COMPILE_CACHE_FILE_NAME = "compile_cache.json"
 PACKAGE_LOCK_HASH_KEY = "sha1_hash"
@@ -2,7 +2,19 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Callable, Dict, NoReturn, Optional, Mapping, Iterable, Set, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NoReturn,
+    Optional,
+    Mapping,
+    MutableMapping,
+    Iterable,
+    Iterator,
+    Set,
+    List,
+)
 import threading
 
 from dbt.flags import get_flags
@@ -165,7 +177,7 @@ class Var:
         if not isinstance(raw, str):
             return raw
 
-        return get_rendered(raw, dict(self._context))
+        return get_rendered(raw, self._context)
 
     def __call__(self, var_name: str, default: Any = _VAR_NOTSET) -> Any:
         if self.has_var(var_name):
@@ -176,6 +188,86 @@ class Var:
             return self.get_missing_var(var_name)
 
 
+# The members of a context, which are created the first time they're looked
+# up and then cached.
+class ContextBuiltins(Mapping):
+    def __init__(self, context: BaseContext) -> None:
+        self._context = context
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        value = self._context._context_members_[key]
+        if hasattr(value, "__get__"):
+            # handle properties, bound methods, etc
+            value = value.__get__(self._context)
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._context._context_members_)
+
+    def __len__(self) -> int:
+        return len(self._context._context_members_)
+
+
+# The dictionary that templates are rendered with. Instead of creating every
+# context member and macro for every node, keys are resolved by the context
+# the first time they're looked up and then cached, so a model that only
+# calls 'ref' and 'config' doesn't pay for the rest. Keys that are set
+# override the context's own keys, as updating a dict would.
+class LazyContext(MutableMapping):
+    def __init__(self, context: BaseContext) -> None:
+        self._context = context
+        self._values: Dict[str, Any] = {}
+        self._deleted: Set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        value = self._context.resolve_context_key(key)
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore[index]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        seen: Set[str] = set(self._deleted)
+        for keys in (self._values, self._context.context_keys()):
+            for key in keys:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> "LazyContext":
+        # jinja copies the context to build the template locals of a traceback
+        copied = LazyContext(self._context)
+        copied._values = dict(self._values)
+        copied._deleted = set(self._deleted)
+        return copied
+
+
 class BaseContext(metaclass=ContextMeta):
     # Set by ContextMeta
     _context_members_: Dict[str, Any]
@@ -183,25 +275,30 @@ class BaseContext(metaclass=ContextMeta):
 
     # subclass is TargetContext
     def __init__(self, cli_vars: Dict[str, Any]) -> None:
-        self._ctx: Dict[str, Any] = {}
+        self._ctx: LazyContext = LazyContext(self)
+        self._builtins: ContextBuiltins = ContextBuiltins(self)
         self.cli_vars: Dict[str, Any] = cli_vars
         self.env_vars: Dict[str, Any] = {}
 
     def generate_builtins(self) -> Dict[str, Any]:
-        builtins: Dict[str, Any] = {}
-        for key, value in self._context_members_.items():
-            if hasattr(value, "__get__"):
-                # handle properties, bound methods, etc
-                value = value.__get__(self)
-            builtins[key] = value
-        return builtins
+        return dict(self._builtins)
+
+    def context_keys(self) -> Iterator[str]:
+        yield "context"
+        yield "builtins"
+        yield from self._context_members_
+
+    def resolve_context_key(self, key: str) -> Any:
+        """Return the value of 'key' in the dictionary returned by 'to_dict',
+        or raise a KeyError."""
+        if key == "context":
+            return self._ctx
+        elif key == "builtins":
+            return self._builtins
+        return self._builtins[key]
 
     # no dbtClassMixin so this is not an actual override
-    def to_dict(self) -> Dict[str, Any]:
-        self._ctx["context"] = self._ctx
-        builtins = self.generate_builtins()
-        self._ctx["builtins"] = builtins
-        self._ctx.update(builtins)
+    def to_dict(self) -> LazyContext:
         return self._ctx
 
     @contextproperty()
@@ -708,7 +805,7 @@ class BaseContext(metaclass=ContextMeta):
         return utils.md5(value)
 
 
-def generate_base_context(cli_vars: Dict[str, Any]) -> Dict[str, Any]:
+def generate_base_context(cli_vars: Dict[str, Any]) -> MutableMapping[str, Any]:
     ctx = BaseContext(cli_vars)
     # This is not a Mashumaro to_dict call
     return ctx.to_dict()
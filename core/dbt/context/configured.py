@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, MutableMapping, Optional
 
 from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER
 from dbt.contracts.connection import AdapterRequiredConfig
@@ -34,7 +34,7 @@ class FQNLookup:
 class ConfiguredVar(Var):
     def __init__(
         self,
-        context: Dict[str, Any],
+        context: Mapping[str, Any],
         config: AdapterRequiredConfig,
         project_name: str,
     ):
@@ -122,13 +122,13 @@ def generate_schema_yml_context(
     config: AdapterRequiredConfig,
     project_name: str,
     schema_yaml_vars: Optional[SchemaYamlVars] = None,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = SchemaYamlContext(config, project_name, schema_yaml_vars)
     return ctx.to_dict()
 
 
 def generate_macro_context(
     config: AdapterRequiredConfig,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = MacroResolvingContext(config)
     return ctx.to_dict()
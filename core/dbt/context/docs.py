@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, MutableMapping, Union
 
 from dbt.exceptions import (
     DocTargetNotFoundError,
@@ -80,7 +80,7 @@ def generate_runtime_docs_context(
     target: Any,
     manifest: Manifest,
     current_project: str,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = DocsRuntimeContext(config, target, manifest, current_project)
     # This is not a Mashumaro to_dict call
     return ctx.to_dict()
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set
+from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set, Tuple
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.nodes import Macro
@@ -6,9 +6,10 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.exceptions import DuplicateMacroNameError, PackageNotFoundForMacroError
 
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = Mapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
 FullNamespace = Dict[str, NamespaceMember]
+MacroLayoutNamespace = Dict[str, Macro]
 
 
 # The point of this class is to collect the various macros
@@ -60,6 +61,9 @@ class MacroNamespace(Mapping):
     def __len__(self):
         return len(self._keys())
 
+    def __contains__(self, key: object) -> bool:
+        return any(key in dct for dct in self._search_order())
+
     def __getitem__(self, key: str) -> NamespaceMember:
         for dct in self._search_order():
             if key in dct:
@@ -78,6 +82,98 @@ class MacroNamespace(Mapping):
             raise PackageNotFoundForMacroError(package_name)
 
 
+# The MacroGenerators for the macros in a MacroNamespaceLayout, bound to
+# one context. A generator is only created the first time its macro is
+# looked up, since most nodes only call a few of the macros in the manifest.
+class BoundMacros:
+    def __init__(
+        self,
+        macros: List[Macro],
+        ctx: Mapping[str, Any],
+        node: Optional[Any],
+        thread_ctx: MacroStack,
+    ) -> None:
+        self.macros = macros
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        self.generators: List[Optional[MacroGenerator]] = [None] * len(macros)
+
+    def get(self, position: int) -> MacroGenerator:
+        generator = self.generators[position]
+        if generator is None:
+            generator = MacroGenerator(self.macros[position], self.ctx, self.node, self.thread_ctx)
+            self.generators[position] = generator
+        return generator
+
+
+# A FlatNamespace of the macros in a BoundMacros, so a macro that's in more
+# than one namespace has one MacroGenerator.
+class BoundMacroNamespace(Mapping):
+    def __init__(self, positions: Dict[str, int], macros: BoundMacros) -> None:
+        self.positions = positions
+        self.macros = macros
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        return self.macros.get(self.positions[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.positions)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+# The macros that each name in a MacroNamespace resolves to, for one
+# search package. This doesn't depend on the node, so it's built once per
+# manifest and search package and shared by every context for that package.
+# 'bind' creates the MacroNamespace for a single context.
+class MacroNamespaceLayout:
+    def __init__(
+        self,
+        global_namespace: MacroLayoutNamespace,  # root package macros
+        local_namespace: MacroLayoutNamespace,  # packages for *this* node
+        global_project_namespace: MacroLayoutNamespace,  # internal packages
+        packages: Dict[str, MacroLayoutNamespace],  # non-internal packages
+    ) -> None:
+        # every macro in the namespace once, by position
+        self.macros: List[Macro] = []
+        positions: Dict[str, int] = {}
+
+        def index_namespace(namespace: MacroLayoutNamespace) -> Dict[str, int]:
+            items = {}
+            for name, macro in namespace.items():
+                if macro.unique_id not in positions:
+                    positions[macro.unique_id] = len(self.macros)
+                    self.macros.append(macro)
+                items[name] = positions[macro.unique_id]
+            return items
+
+        self.global_namespace = index_namespace(global_namespace)
+        self.local_namespace = index_namespace(local_namespace)
+        self.global_project_namespace = index_namespace(global_project_namespace)
+        self.packages = {
+            package: index_namespace(namespace) for package, namespace in packages.items()
+        }
+
+    def bind(
+        self, ctx: Mapping[str, Any], node: Optional[Any], thread_ctx: MacroStack
+    ) -> MacroNamespace:
+        macros = BoundMacros(self.macros, ctx, node, thread_ctx)
+        return MacroNamespace(
+            global_namespace=BoundMacroNamespace(self.global_namespace, macros),
+            local_namespace=BoundMacroNamespace(self.local_namespace, macros),
+            global_project_namespace=BoundMacroNamespace(self.global_project_namespace, macros),
+            packages={
+                package: BoundMacroNamespace(positions, macros)
+                for package, positions in self.packages.items()
+            },
+        )
+
+
 # This class builds the MacroNamespace by adding macros to
 # internal_packages or packages, and locals/globals.
 # Call 'build_namespace' to return a MacroNamespace.
@@ -96,24 +192,24 @@ class MacroNamespaceBuilder:
         # internal packages comes from get_adapter_package_names
         self.internal_package_names = set(internal_packages)
         self.internal_package_names_order = internal_packages
-        # macro_func is added here if in root package, since
+        # macro is added here if in root package, since
         # the root package acts as a "global" namespace, overriding
         # everything else except local external package macro calls
-        self.globals: FlatNamespace = {}
-        # macro_func is added here if it's the package for this node
-        self.locals: FlatNamespace = {}
-        # Create a dictionary of [package name][macro name] =
-        #     MacroGenerator object which acts like a function
-        self.internal_packages: Dict[str, FlatNamespace] = {}
-        self.packages: Dict[str, FlatNamespace] = {}
+        self.globals: MacroLayoutNamespace = {}
+        # macro is added here if it's the package for this node
+        self.locals: MacroLayoutNamespace = {}
+        # Create a dictionary of [package name][macro name] = Macro,
+        # which are bound to MacroGenerator objects that act like functions
+        # when the namespace is built
+        self.internal_packages: Dict[str, MacroLayoutNamespace] = {}
+        self.packages: Dict[str, MacroLayoutNamespace] = {}
         self.thread_ctx = thread_ctx
         self.node = node
 
     def _add_macro_to(
         self,
-        hierarchy: Dict[str, FlatNamespace],
+        hierarchy: Dict[str, MacroLayoutNamespace],
         macro: Macro,
-        macro_func: MacroGenerator,
     ):
         if macro.package_name in hierarchy:
             namespace = hierarchy[macro.package_name]
@@ -122,49 +218,66 @@ class MacroNamespaceBuilder:
             hierarchy[macro.package_name] = namespace
 
         if macro.name in namespace:
-            raise DuplicateMacroNameError(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
+            raise DuplicateMacroNameError(namespace[macro.name], macro, macro.package_name)
+        hierarchy[macro.package_name][macro.name] = macro
 
-    def add_macro(self, macro: Macro, ctx: Dict[str, Any]):
+    def add_macro(self, macro: Macro):
         macro_name: str = macro.name
 
-        # MacroGenerator is in clients/jinja.py
-        # a MacroGenerator object is a callable object that will
-        # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
-
         # internal macros (from plugins) will be processed separately from
         # project macros, so store them in a different place
         if macro.package_name in self.internal_package_names:
-            self._add_macro_to(self.internal_packages, macro, macro_func)
+            self._add_macro_to(self.internal_packages, macro)
         else:
             # if it's not an internal package
-            self._add_macro_to(self.packages, macro, macro_func)
+            self._add_macro_to(self.packages, macro)
             # add to locals if it's the package this node is in
             if macro.package_name == self.search_package:
-                self.locals[macro_name] = macro_func
+                self.locals[macro_name] = macro
             # add to globals if it's in the root package
             elif macro.package_name == self.root_package:
-                self.globals[macro_name] = macro_func
+                self.globals[macro_name] = macro
 
-    def add_macros(self, macros: Iterable[Macro], ctx: Dict[str, Any]):
+    def add_macros(self, macros: Iterable[Macro]):
         for macro in macros:
-            self.add_macro(macro, ctx)
+            self.add_macro(macro)
 
-    def build_namespace(self, macros: Iterable[Macro], ctx: Dict[str, Any]) -> MacroNamespace:
-        self.add_macros(macros, ctx)
+    def build_layout(self, macros: Iterable[Macro]) -> MacroNamespaceLayout:
+        self.add_macros(macros)
 
         # Iterate in reverse-order and overwrite: the packages that are first
         # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
+        global_project_namespace: MacroLayoutNamespace = {}
         for pkg in reversed(self.internal_package_names_order):
             if pkg in self.internal_packages:
                 # add the macros pointed to by this package name
                 global_project_namespace.update(self.internal_packages[pkg])
 
-        return MacroNamespace(
+        return MacroNamespaceLayout(
             global_namespace=self.globals,  # root package macros
             local_namespace=self.locals,  # packages for *this* node
             global_project_namespace=global_project_namespace,  # internal packages
             packages=self.packages,  # non internal_packages
         )
+
+    def build_namespace(self, macros: Iterable[Macro], ctx: Mapping[str, Any]) -> MacroNamespace:
+        return self.build_layout(macros).bind(ctx, self.node, self.thread_ctx)
+
+    def _layout_key(self) -> Tuple[str, ...]:
+        return (self.root_package, self.search_package, *self.internal_package_names_order)
+
+    def build_manifest_namespace(self, manifest: Any, ctx: Mapping[str, Any]) -> MacroNamespace:
+        """Build the namespace for all of the macros in the manifest. The
+        layout is cached on the manifest, so only the MacroGenerators for this
+        context are created, as they're looked up. Adding a macro to the manifest clears the cache,
+        and removing one changes the number of macros."""
+        layouts: Dict[Tuple[str, ...], Tuple[int, MacroNamespaceLayout]]
+        layouts = manifest._macro_namespace_layouts
+        key = self._layout_key()
+        macro_count = len(manifest.macros)
+        if key in layouts and layouts[key][0] == macro_count:
+            layout = layouts[key][1]
+        else:
+            layout = self.build_layout(manifest.macros.values())
+            layouts[key] = (macro_count, layout)
+        return layout.bind(ctx, self.node, self.thread_ctx)
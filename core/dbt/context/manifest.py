@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Iterator, List
 
 from dbt.clients.jinja import MacroStack
 from dbt.contracts.connection import AdapterRequiredConfig
@@ -40,7 +40,7 @@ class ManifestContext(ConfiguredContext):
         # this takes all the macros in the manifest and adds them
         # to the MacroNamespaceBuilder stored in self.namespace
         builder = self._get_namespace_builder()
-        return builder.build_namespace(self.manifest.macros.values(), self._ctx)
+        return builder.build_manifest_namespace(self.manifest, self._ctx)
 
     def _get_namespace_builder(self) -> MacroNamespaceBuilder:
         # avoid an import loop
@@ -55,17 +55,25 @@ class ManifestContext(ConfiguredContext):
             None,
         )
 
-    # This does not use the Mashumaro code
-    def to_dict(self):
-        dct = super().to_dict()
-        # This moves all of the macros in the 'namespace' into top level
-        # keys in the manifest dictionary
+    # The macros in the 'namespace' are top level keys in the context
+    # dictionary, and override the context members.
+    def context_keys(self) -> Iterator[str]:
+        yield from super().context_keys()
         if isinstance(self.namespace, TestMacroNamespace):
-            dct.update(self.namespace.local_namespace)
-            dct.update(self.namespace.project_namespace)
+            yield from self.namespace.local_namespace
+            yield from self.namespace.project_namespace
         else:
-            dct.update(self.namespace)
-        return dct
+            yield from self.namespace
+
+    def resolve_context_key(self, key: str) -> Any:
+        if isinstance(self.namespace, TestMacroNamespace):
+            if key in self.namespace.project_namespace:
+                return self.namespace.project_namespace[key]
+            elif key in self.namespace.local_namespace:
+                return self.namespace.local_namespace[key]
+        elif key in self.namespace:
+            return self.namespace[key]
+        return super().resolve_context_key(key)
 
     @contextproperty()
     def context_macro_stack(self):
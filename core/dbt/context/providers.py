@@ -11,6 +11,8 @@ from typing import (
     Type,
     Iterable,
     Mapping,
+    MutableMapping,
+    Set,
 )
 from typing_extensions import Protocol
 
@@ -60,6 +62,7 @@ from dbt.exceptions import (
     MetricArgsError,
     MissingConfigError,
     OperationsCannotRefEphemeralNodesError,
+    PackageNotFoundForMacroError,
     PackageNotInDepsError,
     ParsingError,
     RefBadContextError,
@@ -111,6 +114,9 @@ class BaseDatabaseWrapper:
         self._adapter = adapter
         self.Relation = RelationProxy(adapter)
         self._namespace = namespace
+        # packages in the dispatch search order that have no macros. Raising
+        # the error for these on every dispatch call is expensive.
+        self._packages_not_found: Set[Optional[str]] = set()
 
     def __getattr__(self, name):
         raise NotImplementedError("subclasses need to implement this")
@@ -180,13 +186,17 @@ class BaseDatabaseWrapper:
         for package_name in search_packages:
             for prefix in self._get_adapter_macro_prefixes():
                 search_name = f"{prefix}__{macro_name}"
-                try:
-                    # this uses the namespace from the context
-                    macro = self._namespace.get_from_package(package_name, search_name)
-                except CompilationError:
-                    # Only raise CompilationError if macro is not found in
-                    # any package
-                    macro = None
+                macro = None
+                if package_name not in self._packages_not_found:
+                    try:
+                        # this uses the namespace from the context
+                        macro = self._namespace.get_from_package(package_name, search_name)
+                    except PackageNotFoundForMacroError:
+                        self._packages_not_found.add(package_name)
+                    except CompilationError:
+                        # Only raise CompilationError if macro is not found in
+                        # any package
+                        pass
 
                 if package_name is None:
                     attempts.append(search_name)
@@ -625,7 +635,7 @@ class RuntimeMetricResolver(BaseMetricResolver):
 class ModelConfiguredVar(Var):
     def __init__(
         self,
-        context: Dict[str, Any],
+        context: Mapping[str, Any],
         config: RuntimeConfig,
         node: Resource,
     ) -> None:
@@ -859,7 +869,13 @@ class ProviderContext(ManifestContext):
             raise CompilationError(message_if_exception, self.model)
 
     @contextmember()
-    def load_agate_table(self) -> agate.Table:
+    def load_agate_table(self, streaming: bool = False) -> agate.Table:
+        """Load the seed's csv file into an agate table. With 'streaming', if
+        the rows are loaded by the default load_csv_rows macro, which reads
+        them with table.row_batches, the table only has a sample of the rows
+        (see agate_helper.from_csv_sample), so large seeds aren't loaded into
+        memory.
+        """
         if not isinstance(self.model, SeedNode):
             raise LoadAgateTableNotSeedError(self.model.resource_type, node=self.model)
 
@@ -877,12 +893,31 @@ class ProviderContext(ManifestContext):
         column_types = self.model.config.column_types
         delimiter = self.model.config.delimiter
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types, delimiter=delimiter)
+            if streaming and self._load_csv_rows_streams():
+                table = agate_helper.from_csv_sample(
+                    path, text_columns=column_types, delimiter=delimiter
+                )
+            else:
+                table = agate_helper.from_csv(path, text_columns=column_types, delimiter=delimiter)
         except ValueError as e:
             raise LoadAgateTableValueError(e, node=self.model)
         table.original_abspath = os.path.abspath(path)
         return table
 
+    def _load_csv_rows_streams(self) -> bool:
+        # Adapters and projects that override load_csv_rows, or the default__
+        # implementation it dispatches to, may read all of agate_table.rows.
+        # The seed materialization calls load_csv_rows from the context, so
+        # that's the one to check.
+        load_csv_rows = self._ctx.get("load_csv_rows")
+        if (
+            not isinstance(load_csv_rows, MacroGenerator)
+            or load_csv_rows.macro.unique_id != "macro.dbt.load_csv_rows"
+        ):
+            return False
+        macro = self.db_wrapper.dispatch("load_csv_rows", "dbt").macro
+        return macro.unique_id == "macro.dbt.default__load_csv_rows"
+
     @contextproperty()
     def ref(self) -> Callable:
         """The most important function in dbt is `ref()`; it's impossible to
@@ -1490,7 +1525,7 @@ def generate_parser_model_context(
     config: RuntimeConfig,
     manifest: Manifest,
     context_config: ContextConfig,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     # The __init__ method of ModelContext also initializes
     # a ManifestContext object which creates a MacroNamespaceBuilder
     # which adds every macro in the Manifest.
@@ -1504,7 +1539,7 @@ def generate_generate_name_macro_context(
     macro: Macro,
     config: RuntimeConfig,
     manifest: Manifest,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = MacroContext(macro, config, manifest, GenerateNameProvider(), None)
     return ctx.to_dict()
 
@@ -1513,7 +1548,7 @@ def generate_runtime_model_context(
     model: ManifestNode,
     config: RuntimeConfig,
     manifest: Manifest,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = ModelContext(model, config, manifest, RuntimeProvider(), None)
     return ctx.to_dict()
 
@@ -1523,7 +1558,7 @@ def generate_runtime_macro_context(
     config: RuntimeConfig,
     manifest: Manifest,
     package_name: Optional[str],
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = MacroContext(macro, config, manifest, OperationProvider(), package_name)
     return ctx.to_dict()
 
@@ -1722,7 +1757,7 @@ def generate_test_context(
     manifest: Manifest,
     context_config: ContextConfig,
     macro_resolver: MacroResolver,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     ctx = TestContext(model, config, manifest, ParseProvider(), context_config, macro_resolver)
     # The 'to_dict' method in ManifestContext moves all of the macro names
     # in the macro 'namespace' up to top level keys
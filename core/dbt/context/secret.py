@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, MutableMapping, Optional
 
 from .base import BaseContext, contextmember
 
@@ -53,7 +53,7 @@ class SecretContext(BaseContext):
             raise EnvVarMissingError(var)
 
 
-def generate_secret_context(cli_vars: Dict[str, Any]) -> Dict[str, Any]:
+def generate_secret_context(cli_vars: Dict[str, Any]) -> MutableMapping[str, Any]:
     ctx = SecretContext(cli_vars)
     # This is not a Mashumaro to_dict call
     return ctx.to_dict()
@@ -783,6 +783,27 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    # built and used by dbt.context.macros.MacroNamespaceBuilder
+    _macro_namespace_layouts: Dict[Any, Any] = field(
+        default_factory=dict,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    # node code rendered by compile worker processes, see dbt.compilation
+    _rendered_nodes: Dict[str, Any] = field(
+        default_factory=dict,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    # macro_sql checksum -> the calls in it found by jinja_static.extract_macro_calls,
+    # saved with the partial parsing file, see ManifestLoader.macro_depends_on
+    _macro_calls: Dict[str, Any] = field(
+        default_factory=dict,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    # set while nodes are being compiled with --compile-cache
+    _compiled_code_cache: Optional[Any] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -1308,6 +1329,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             raise DuplicateMacroInPackageError(macro=macro, macro_mapping=self.macros)
 
         self.macros[macro.unique_id] = macro
+        self._macro_namespace_layouts.clear()
         source_file.macros.append(macro.unique_id)
 
     def has_file(self, source_file: SourceFile) -> bool:
@@ -1437,6 +1459,8 @@ class MacroManifest(MacroMethods):
     def __init__(self, macros) -> None:
         self.macros = macros
         self.metadata = ManifestMetadata()
+        # built and used by dbt.context.macros.MacroNamespaceBuilder
+        self._macro_namespace_layouts: Dict[Any, Any] = {}
         # This is returned by the 'graph' context property
         # in the ProviderContext class.
         self.flat_graph: Dict[str, Any] = {}
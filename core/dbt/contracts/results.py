@@ -1,3 +1,4 @@
+import json
 import threading
 
 from dbt.contracts.graph.unparsed import FreshnessThreshold
@@ -15,7 +16,8 @@ from dbt.events.types import TimingInfoCollected
 from dbt.events.contextvars import get_node_info
 from dbt.events.helpers import datetime_to_json_string
 from dbt.logger import TimingProcessor
-from dbt.utils import lowercase, cast_to_str, cast_to_int
+from dbt.tracing import span
+from dbt.utils import lowercase, cast_to_str, cast_to_int, JSONEncoder
 from dbt.dataclass_schema import dbtClassMixin, StrEnum
 
 import agate
@@ -26,6 +28,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -33,7 +36,7 @@ from typing import (
     Union,
 )
 
-from dbt.clients.system import write_json
+from dbt.clients.system import write_file_chunks, write_json
 
 
 @dataclass
@@ -508,3 +511,23 @@ class CatalogArtifact(CatalogResults, ArtifactMixin):
             errors=errors,
             _compile_results=compile_results,
         )
+
+    def write(self, path: str):
+        # The catalog can be very large, so it's serialized a table at a time
+        # rather than all at once. The output is the same as to_dict's.
+        with span("write artifact", "artifacts", path=path):
+            write_file_chunks(path, self._json_chunks())
+
+    def _json_chunks(self) -> Iterator[str]:
+        def dumps(value: Any) -> str:
+            return json.dumps(value, cls=JSONEncoder)
+
+        yield '{"metadata": ' + dumps(self.metadata.to_dict(omit_none=False))
+        for key, tables in (("nodes", self.nodes), ("sources", self.sources)):
+            yield f', "{key}": {{'
+            separator = ""
+            for unique_id, table in tables.items():
+                yield f"{separator}{dumps(unique_id)}: {dumps(table.to_dict(omit_none=False))}"
+                separator = ", "
+            yield "}"
+        yield f', "errors": {dumps(self.errors)}}}'
@@ -8,6 +8,7 @@ from dbt.exceptions import (
     DbtRuntimeError,
     IncompatibleSchemaError,
 )
+from dbt.tracing import span
 from dbt.version import __version__
 
 from dbt.events.functions import get_invocation_id, get_metadata_vars
@@ -63,7 +64,8 @@ class Mergeable(Replaceable):
 
 class Writable:
     def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))  # type: ignore
+        with span("write artifact", "artifacts", path=path):
+            write_json(path, self.to_dict(omit_none=False))  # type: ignore
 
 
 class AdditionalPropertiesMixin:
@@ -1,5 +1,5 @@
-from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
+from array import array
+from typing import Dict, List, Set, Iterable, Iterator, Optional, NewType, Tuple
 import networkx as nx  # type: ignore
 from functools import partial
 
@@ -8,13 +8,212 @@ from dbt.exceptions import DbtInternalError
 UniqueId = NewType("UniqueId", str)
 
 
+class IndexedGraph:
+    """A read-only copy of a networkx DiGraph that is faster to traverse.
+
+    Unique ids are interned to integers (their position in 'unique_ids'),
+    and the successors and predecessors of every node are stored in
+    compressed sparse row form: the edges leaving node i are at positions
+    offsets[i] to offsets[i + 1] of the targets array. Each edge also has a
+    small integer code for its 'edge_type', so traversals can skip edges of
+    some types by passing a bitmask of the codes they follow.
+    """
+
+    def __init__(self, graph) -> None:
+        self.unique_ids: List[UniqueId] = list(graph.nodes())
+        self.index: Dict[UniqueId, int] = {
+            unique_id: idx for idx, unique_id in enumerate(self.unique_ids)
+        }
+        # edge_type -> code. Edges without an edge_type have the code 0.
+        self.edge_type_codes: Dict[Optional[str], int] = {None: 0}
+
+        succ_offsets = array("i", [0])
+        succ_targets = array("i")
+        succ_codes = array("B")
+        for _, neighbors in graph.adjacency():
+            for target, data in neighbors.items():
+                succ_targets.append(self.index[target])
+                succ_codes.append(self._edge_type_code(data.get("edge_type")))
+            succ_offsets.append(len(succ_targets))
+        self._succ = (succ_offsets, succ_targets, succ_codes)
+        self._pred = self._reverse(succ_offsets, succ_targets, succ_codes)
+
+    def _edge_type_code(self, edge_type: Optional[str]) -> int:
+        if edge_type not in self.edge_type_codes:
+            self.edge_type_codes[edge_type] = len(self.edge_type_codes)
+        return self.edge_type_codes[edge_type]
+
+    def _reverse(self, offsets: array, targets: array, codes: array) -> Tuple[array, array, array]:
+        # a counting sort of the edges by their target
+        node_count = len(self.unique_ids)
+        rev_offsets = array("i", [0]) * (node_count + 1)
+        for target in targets:
+            rev_offsets[target + 1] += 1
+        for idx in range(node_count):
+            rev_offsets[idx + 1] += rev_offsets[idx]
+        rev_sources = array("i", [0]) * len(targets)
+        rev_codes = array("B", [0]) * len(targets)
+        position = rev_offsets[:-1]
+        for source in range(node_count):
+            for edge in range(offsets[source], offsets[source + 1]):
+                target = targets[edge]
+                rev_sources[position[target]] = source
+                rev_codes[position[target]] = codes[edge]
+                position[target] += 1
+        return rev_offsets, rev_sources, rev_codes
+
+    def __len__(self) -> int:
+        return len(self.unique_ids)
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self.index
+
+    def edge_mask(self, exclude_edge_types: Iterable[str] = ()) -> int:
+        """A bitmask of the edge type codes to follow in a traversal"""
+        mask = (1 << len(self.edge_type_codes)) - 1
+        for edge_type in exclude_edge_types:
+            if edge_type in self.edge_type_codes:
+                mask &= ~(1 << self.edge_type_codes[edge_type])
+        return mask
+
+    def node_index(self, unique_id: UniqueId) -> int:
+        try:
+            return self.index[unique_id]
+        except KeyError:
+            raise DbtInternalError(f"Node {unique_id} not found in the graph!")
+
+    def successors(self, unique_id: UniqueId) -> List[UniqueId]:
+        offsets, targets, _ = self._succ
+        idx = self.node_index(unique_id)
+        return [self.unique_ids[target] for target in targets[offsets[idx] : offsets[idx + 1]]]
+
+    def reachable(
+        self,
+        sources: Iterable[UniqueId],
+        reverse: bool = False,
+        max_depth: Optional[int] = None,
+        edge_mask: int = -1,
+    ) -> Set[UniqueId]:
+        """Return the nodes reachable from any of 'sources' in at most
+        'max_depth' steps, following only edges whose type is in 'edge_mask'.
+        With 'reverse', edges are followed backwards (to the ancestors).
+
+        All the sources are traversed together, breadth first, so every node
+        is expanded once, at its shortest distance from any source. A source
+        is only included if it's reachable from another source.
+        """
+        offsets, targets, codes = self._pred if reverse else self._succ
+        frontier = list({self.node_index(unique_id) for unique_id in sources})
+        expanded = set(frontier)
+        reached: Set[int] = set()
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            next_frontier = []
+            for idx in frontier:
+                for edge in range(offsets[idx], offsets[idx + 1]):
+                    if not (edge_mask >> codes[edge]) & 1:
+                        continue
+                    target = targets[edge]
+                    reached.add(target)
+                    if target not in expanded:
+                        expanded.add(target)
+                        next_frontier.append(target)
+            frontier = next_frontier
+            depth += 1
+        return {self.unique_ids[idx] for idx in reached}
+
+    def subset_edges(self, selected: Set[UniqueId]) -> List[Tuple[UniqueId, UniqueId]]:
+        """Return the edges of the graph over just the 'selected' nodes: there
+        is an edge from a to b if b can be reached from a without passing
+        through any other selected node.
+
+        The selected nodes reachable from each unselected node are computed
+        once, in a depth first traversal, and shared by all its predecessors.
+        """
+        offsets, targets, _ = self._succ
+        is_selected = bytearray(len(self.unique_ids))
+        for unique_id in selected:
+            is_selected[self.node_index(unique_id)] = 1
+        # unselected node -> the selected nodes it leads to
+        leads_to: Dict[int, Set[int]] = {}
+
+        def collapse(start: int) -> Set[int]:
+            # iterative depth first traversal; the stack holds the current
+            # path, with the position of the next edge to follow from each node
+            on_path = {start}
+            stack = [(start, offsets[start])]
+            while stack:
+                idx, edge = stack[-1]
+                next_node = None
+                while edge < offsets[idx + 1]:
+                    target = targets[edge]
+                    edge += 1
+                    if not (is_selected[target] or target in leads_to or target in on_path):
+                        next_node = target
+                        break
+                if next_node is not None:
+                    stack[-1] = (idx, edge)
+                    stack.append((next_node, offsets[next_node]))
+                    on_path.add(next_node)
+                    continue
+                stack.pop()
+                on_path.discard(idx)
+                successors = targets[offsets[idx] : offsets[idx + 1]]
+                leads_to[idx] = self._merge_targets(successors, is_selected, leads_to)
+            return leads_to[start]
+
+        edges: List[Tuple[UniqueId, UniqueId]] = []
+        for source, source_selected in enumerate(is_selected):
+            if not source_selected:
+                continue
+            successors = targets[offsets[source] : offsets[source + 1]]
+            for target in successors:
+                if not is_selected[target] and target not in leads_to:
+                    collapse(target)
+            for target in sorted(self._merge_targets(successors, is_selected, leads_to)):
+                if target != source:
+                    edges.append((self.unique_ids[source], self.unique_ids[target]))
+        return edges
+
+    @staticmethod
+    def _merge_targets(
+        successors: Iterable[int], is_selected: bytearray, leads_to: Dict[int, Set[int]]
+    ) -> Set[int]:
+        merged: Optional[Set[int]] = None
+        shared = True
+        for target in successors:
+            # nodes on a cycle may not have been resolved yet
+            reached = {target} if is_selected[target] else leads_to.get(target, set())
+            if merged is None:
+                # reuse the successor's set if it's the only one, to save
+                # memory on long chains of unselected nodes
+                merged = reached
+            elif reached is not merged and not reached <= merged:
+                if shared:
+                    merged = set(merged)
+                    shared = False
+                merged |= reached
+        return merged if merged is not None else set()
+
+
 class Graph:
     """A wrapper around the networkx graph that understands SelectionCriteria
     and how they interact with the graph.
+
+    Traversals use an IndexedGraph that is built from the networkx graph the
+    first time it's needed, so the networkx graph must not be modified after
+    the Graph has been used for selection.
     """
 
     def __init__(self, graph) -> None:
         self.graph = graph
+        self._indexed: Optional[IndexedGraph] = None
+
+    @property
+    def indexed(self) -> IndexedGraph:
+        if self._indexed is None:
+            self._indexed = IndexedGraph(self.graph)
+        return self._indexed
 
     def nodes(self) -> Set[UniqueId]:
         return set(self.graph.nodes())
@@ -27,20 +226,20 @@ class Graph:
 
     def ancestors(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes having a path to `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise DbtInternalError(f"Node {node} not found in the graph!")
-        filtered_graph = self.exclude_edge_type("parent_test")
-        return {
-            child
-            for _, child in nx.bfs_edges(filtered_graph, node, reverse=True, depth_limit=max_depth)
-        }
+        return self.indexed.reachable(
+            [node],
+            reverse=True,
+            max_depth=max_depth,
+            edge_mask=self.indexed.edge_mask(exclude_edge_types=["parent_test"]),
+        )
 
     def descendants(self, node: UniqueId, max_depth: Optional[int] = None) -> Set[UniqueId]:
         """Returns all nodes reachable from `node` in `graph`"""
-        if not self.graph.has_node(node):
-            raise DbtInternalError(f"Node {node} not found in the graph!")
-        filtered_graph = self.exclude_edge_type("parent_test")
-        return {child for _, child in nx.bfs_edges(filtered_graph, node, depth_limit=max_depth)}
+        return self.indexed.reachable(
+            [node],
+            max_depth=max_depth,
+            edge_mask=self.indexed.edge_mask(exclude_edge_types=["parent_test"]),
+        )
 
     def exclude_edge_type(self, edge_type_to_exclude):
         return nx.subgraph_view(
@@ -58,23 +257,26 @@ class Graph:
     def select_children(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        descendants: Set[UniqueId] = set()
-        for node in selected:
-            descendants.update(self.descendants(node, max_depth))
-        return descendants
+        return self.indexed.reachable(
+            selected,
+            max_depth=max_depth,
+            edge_mask=self.indexed.edge_mask(exclude_edge_types=["parent_test"]),
+        )
 
     def select_parents(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        ancestors: Set[UniqueId] = set()
-        for node in selected:
-            ancestors.update(self.ancestors(node, max_depth))
-        return ancestors
+        return self.indexed.reachable(
+            selected,
+            reverse=True,
+            max_depth=max_depth,
+            edge_mask=self.indexed.edge_mask(exclude_edge_types=["parent_test"]),
+        )
 
     def select_successors(self, selected: Set[UniqueId]) -> Set[UniqueId]:
         successors: Set[UniqueId] = set()
         for node in selected:
-            successors.update(self.graph.successors(node))
+            successors.update(self.indexed.successors(node))
         return successors
 
     def get_subset_graph(self, selected: Iterable[UniqueId]) -> "Graph":
@@ -83,53 +285,28 @@ class Graph:
         removed nodes are preserved as explicit new edges.
         """
 
-        new_graph = self.graph.copy()
         include_nodes = set(selected)
-
-        still_removing = True
-        while still_removing:
-            nodes_to_remove = list(
-                node
-                for node in new_graph
-                if node not in include_nodes
-                and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
-            )
-            if len(nodes_to_remove) == 0:
-                still_removing = False
-            else:
-                new_graph.remove_nodes_from(nodes_to_remove)
-
-        # sort remaining nodes by degree
-        remaining_nodes = list(new_graph.nodes())
-        remaining_nodes.sort(
-            key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node)
-        )
-
-        for node in remaining_nodes:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target)
-                    for source, target in new_edges
-                    if source != target and not new_graph.has_edge(source, target)
-                ]  # removes cyclic refs and edges already existing in new graph
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.indexed:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is it disabled?".format(node)
                 )
 
+        new_graph = nx.DiGraph()
+        new_graph.add_nodes_from(
+            (node, data) for node, data in self.graph.nodes(data=True) if node in include_nodes
+        )
+        # edges between selected nodes keep their attributes, like edge_type
+        adjacency = self.graph.adj
+        new_graph.add_edges_from(
+            (source, target, adjacency[source].get(target) or {})
+            for source, target in self.indexed.subset_edges(include_nodes)
+        )
+
         return Graph(new_graph)
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
         return Graph(self.graph.subgraph(nodes))
 
     def get_dependent_nodes(self, node: UniqueId):
-        return nx.descendants(self.graph, node)
+        return self.indexed.reachable([node])
@@ -1,8 +1,10 @@
+import heapq
 import networkx as nx  # type: ignore
 import threading
 
-from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from dataclasses import dataclass
+from queue import Empty
+from typing import AbstractSet, Dict, Set, List, Generator, Mapping, Optional, Sequence, Tuple
 
 from .graph import UniqueId
 from dbt.contracts.graph.nodes import (
@@ -15,32 +17,80 @@ from dbt.contracts.graph.manifest import Manifest
 from dbt.node_types import NodeType
 
 
+@dataclass
+class ConcurrencyLimit:
+    """At most `limit` of `nodes` may be in progress at the same time."""
+
+    name: str
+    limit: int
+    nodes: AbstractSet[UniqueId]
+
+
 class GraphQueue:
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
 
-    This queue is thread-safe for `mark_done` calls, though you must ensure
-    that separate threads do not call `.empty()` or `__len__()` and `.get()` at
-    the same time, as there is an unlocked race!
+    Each node keeps a count of its unfinished parents. When a node is marked
+    as done, the counts of its children are decremented, and children that
+    reach zero are added to the set of nodes that are ready to run. The graph
+    itself is not modified.
+
+    Nodes that are covered by a concurrency limit are only handed out while
+    fewer than `limit` of that limit's nodes are in progress. Ready nodes over
+    their limit wait in a separate heap for each limit until one of its nodes
+    is done.
+
+    All methods are thread-safe, and any number of threads may call `get()`
+    concurrently. `get()` returns None once every node has been handed out.
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]) -> None:
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        execution_times: Optional[Mapping[str, float]] = None,
+        concurrency_limits: Sequence[ConcurrencyLimit] = (),
+    ) -> None:
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
-        # store the queue as a priority queue.
-        self.inner: PriorityQueue = PriorityQueue()
-        # things that have been popped off the queue but not finished
-        # and worker thread reservations
+        # store the 'score' of each node as a number. Lower is higher priority.
+        self._scores: Mapping[str, float]
+        if execution_times and any(node in execution_times for node in self.graph):
+            self._scores = self._get_critical_path_scores(self.graph, execution_times)
+        else:
+            self._scores = self._get_scores(self.graph)
+        # the number of unfinished parents of each node that isn't ready yet
+        self._unfinished_parents: Dict[UniqueId, int] = {}
+        # a heap of (score, node) for nodes whose parents are all done
+        self._ready: List[Tuple[float, UniqueId]] = []
+        for node, degree in self.graph.in_degree():
+            if degree:
+                self._unfinished_parents[node] = degree
+            else:
+                self._ready.append((self._scores[node], node))
+        heapq.heapify(self._ready)
+        # things that have been handed out but not finished
         self.in_progress: Set[UniqueId] = set()
-        # things that are in the queue
-        self.queued: Set[UniqueId] = set()
-        # this lock controls most things
+        # the limits that apply to each node, and the nodes of each limit
+        # that are in progress or ready but waiting for one to finish
+        self._node_limits: Dict[UniqueId, List[ConcurrencyLimit]] = {}
+        self._limit_in_progress: Dict[str, int] = {}
+        self._limit_waiting: Dict[str, List[Tuple[float, UniqueId]]] = {}
+        # the limit that released each ready node from its waiting heap
+        self._released_by: Dict[UniqueId, str] = {}
+        for concurrency_limit in concurrency_limits:
+            self._limit_in_progress[concurrency_limit.name] = 0
+            self._limit_waiting[concurrency_limit.name] = []
+            for node in concurrency_limit.nodes:
+                self._node_limits.setdefault(node, []).append(concurrency_limit)
+        # the number of nodes that haven't been handed out yet
+        self._remaining = len(self.graph)
+        self._finished = 0
+        # this lock controls everything, and is held only briefly
         self.lock = threading.Lock()
-        # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
-        # populate the initial queue
-        self._find_new_additions(list(self.graph.nodes()))
+        # notified when a node becomes ready, or the last node is handed out
+        self._node_ready = threading.Condition(self.lock)
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -80,7 +130,7 @@ class GraphQueue:
             yield zero_indegree
             new_zero_indegree = []
             for v in zero_indegree:
-                for _, child in graph.edges(v):
+                for child in graph.successors(v):
                     indegree_map[child] -= 1
                     if not indegree_map[child]:
                         new_zero_indegree.append(child)
@@ -90,6 +140,8 @@ class GraphQueue:
         """Scoring nodes for processing order.
 
         Scores are calculated by the graph depth level. Lowest score (0) should be processed first.
+        A node's level only depends on its ancestors, so the levels are the same whether the
+        connected components of the graph are sorted separately or together.
 
         Args:
             graph: The graph to be scored.
@@ -97,36 +149,116 @@ class GraphQueue:
         Returns:
             A dictionary consisting of `node name`:`score` pairs.
         """
-        # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
-
-        # score all nodes in all subgraphs
         scores = {}
-        for subgraph in subgraphs:
-            grouped_nodes = self._grouped_topological_sort(subgraph)
-            for level, group in enumerate(grouped_nodes):
-                for node in group:
-                    scores[node] = level
+        for level, group in enumerate(self._grouped_topological_sort(graph)):
+            for node in group:
+                scores[node] = level
 
         return scores
 
-    def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
-        """Get a node off the inner priority queue. By default, this blocks.
+    def _get_critical_path_scores(
+        self, graph: nx.DiGraph, execution_times: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Scoring nodes by the remaining critical path.
+
+        The score of a node is the negated duration of the slowest chain of
+        nodes that starts at it, so nodes on the longest path through the graph
+        are processed first. Durations come from a previous run. Nodes that
+        weren't in that run are assumed to take the mean of the known durations.
+
+        Args:
+            graph: The graph to be scored.
+            execution_times: A dictionary of `node name`:`seconds` pairs.
+
+        Returns:
+            A dictionary consisting of `node name`:`score` pairs.
+        """
+        known = [execution_times[node] for node in graph if node in execution_times]
+        default = sum(known) / len(known)
 
-        This takes the lock, but only for part of it.
+        remaining: Dict[str, float] = {}
+        for node in reversed(list(nx.topological_sort(graph))):
+            longest_successor = max(
+                (remaining[successor] for successor in graph.successors(node)), default=0.0
+            )
+            remaining[node] = execution_times.get(node, default) + longest_successor
 
-        :param block: If True, block until the inner queue has data
-        :param timeout: If set, block for timeout seconds waiting for data.
-        :return: The node as present in the manifest.
+        return {node: -duration for node, duration in remaining.items()}
 
-        See `queue.PriorityQueue` for more information on `get()` behavior and
-        exceptions.
+    def get(
+        self, block: bool = True, timeout: Optional[float] = None
+    ) -> Optional[GraphMemberNode]:
+        """Get the ready node with the lowest score, and mark it as in
+        progress. By default, this blocks until a node is ready.
+
+        This takes the lock.
+
+        :param block: If True, block until a node is ready
+        :param timeout: If set, block for timeout seconds waiting for a node.
+        :return: The node as present in the manifest. When blocking, None is
+            returned once every node has been handed out.
+        :raises queue.Empty: If no node was ready in time, or none is ready
+            and block is False.
         """
-        _, node_id = self.inner.get(block=block, timeout=timeout)
-        with self.lock:
-            self._mark_in_progress(node_id)
+        with self._node_ready:
+            node_id = self._pop_ready()
+            while node_id is None:
+                if not block:
+                    raise Empty
+                if not self._remaining:
+                    return None
+                if not self._node_ready.wait_for(
+                    lambda: self._ready or not self._remaining, timeout=timeout
+                ):
+                    raise Empty
+                node_id = self._pop_ready()
         return self.manifest.expect(node_id)
 
+    def _pop_ready(self) -> Optional[UniqueId]:
+        """Mark the ready node with the lowest score that isn't over a
+        concurrency limit as in progress, and return it. Nodes that are over a
+        limit are moved to that limit's waiting heap.
+
+        Callers must hold the lock.
+        """
+        while self._ready:
+            score, node_id = heapq.heappop(self._ready)
+            released_by = self._released_by.pop(node_id, None)
+            limits = self._node_limits.get(node_id, [])
+            full = next(
+                (lim for lim in limits if self._limit_in_progress[lim.name] >= lim.limit), None
+            )
+            if full is not None:
+                heapq.heappush(self._limit_waiting[full.name], (score, node_id))
+                if released_by is not None and released_by != full.name:
+                    # the slot it was released into is still free, so the
+                    # next node waiting for it gets a chance instead
+                    self._release_waiting(released_by)
+                continue
+            for concurrency_limit in limits:
+                self._limit_in_progress[concurrency_limit.name] += 1
+            self.in_progress.add(node_id)
+            self._remaining -= 1
+            if not self._remaining:
+                # wake up any other consumers, there is nothing left for them
+                self._node_ready.notify_all()
+            return node_id
+        return None
+
+    def _release_waiting(self, limit_name: str) -> bool:
+        """Move the waiting node of a limit with the lowest score to the ready
+        heap. Returns whether there was one.
+
+        Callers must hold the lock.
+        """
+        waiting = self._limit_waiting[limit_name]
+        if not waiting:
+            return False
+        score, node_id = heapq.heappop(waiting)
+        heapq.heappush(self._ready, (score, node_id))
+        self._released_by[node_id] = limit_name
+        return True
+
     def __len__(self) -> int:
         """The length of the queue is the number of tasks left for the queue to
         give out, regardless of where they are. Incomplete tasks are not part
@@ -135,36 +267,16 @@ class GraphQueue:
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return self._remaining
 
     def empty(self) -> bool:
-        """The graph queue is 'empty' if it all remaining nodes in the graph
-        are in progress.
+        """The graph queue is 'empty' if every node in the graph has been
+        handed out.
 
         This takes the lock.
         """
         return len(self) == 0
 
-    def _already_known(self, node: UniqueId) -> bool:
-        """Decide if a node is already known (either handed out as a task, or
-        in the queue).
-
-        Callers must hold the lock.
-
-        :param str node: The node ID to check
-        :returns bool: If the node is in progress/queued.
-        """
-        return node in self.in_progress or node in self.queued
-
-    def _find_new_additions(self, candidates) -> None:
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
-        """
-        for node in candidates:
-            if self.graph.in_degree(node) == 0 and not self._already_known(node):
-                self.inner.put((self._scores[node], node))
-                self.queued.add(node)
-
     def mark_done(self, node_id: UniqueId) -> None:
         """Given a node's unique ID, mark it as done.
 
@@ -174,33 +286,39 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
-            successors = list(self.graph.successors(node_id))
-            self.graph.remove_node(node_id)
-            self._find_new_additions(successors)
-            self.inner.task_done()
+            self._finished += 1
+            ready = 0
+            for concurrency_limit in self._node_limits.get(node_id, []):
+                self._limit_in_progress[concurrency_limit.name] -= 1
+                if self._release_waiting(concurrency_limit.name):
+                    ready += 1
+            for successor in self.graph.successors(node_id):
+                self._unfinished_parents[successor] -= 1
+                if not self._unfinished_parents[successor]:
+                    del self._unfinished_parents[successor]
+                    heapq.heappush(self._ready, (self._scores[successor], successor))
+                    ready += 1
+            if ready == 1:
+                self._node_ready.notify()
+            elif ready:
+                self._node_ready.notify_all()
             self.some_task_done.notify_all()
 
-    def _mark_in_progress(self, node_id: UniqueId) -> None:
-        """Mark the node as 'in progress'.
-
-        Callers must hold the lock.
-
-        :param str node_id: The node ID to mark as in progress.
-        """
-        self.queued.remove(node_id)
-        self.in_progress.add(node_id)
+    @property
+    def unfinished_tasks(self) -> int:
+        """The number of nodes that aren't done yet."""
+        return len(self.graph) - self._finished
 
     def join(self) -> None:
-        """Join the queue. Blocks until all tasks are marked as done.
-
-        Make sure not to call this before the queue reports that it is empty.
-        """
-        self.inner.join()
+        """Join the queue. Blocks until all tasks are marked as done."""
+        with self.lock:
+            self.some_task_done.wait_for(lambda: not self.unfinished_tasks)
 
     def wait_until_something_was_done(self) -> int:
         """Block until a task is done, then return the number of unfinished
-        tasks.
+        tasks. Returns immediately if all tasks are already done.
         """
         with self.lock:
-            self.some_task_done.wait()
-            return self.inner.unfinished_tasks
+            if self.unfinished_tasks:
+                self.some_task_done.wait()
+            return self.unfinished_tasks
@@ -1,12 +1,13 @@
-from typing import Set, List, Optional, Tuple
+from typing import Dict, Set, List, Mapping, Optional, Tuple
 
 from .graph import Graph, UniqueId
-from .queue import GraphQueue
+from .queue import ConcurrencyLimit, GraphQueue
 from .selector_methods import MethodManager
 from .selector_spec import SelectionCriteria, SelectionSpec, IndirectSelection
 
 from dbt.events.functions import fire_event, warn_or_error
-from dbt.events.types import SelectorReportInvalidSelector, NoNodesForSelectionCriteria
+from dbt.events.base_types import EventLevel
+from dbt.events.types import SelectorReportInvalidSelector, NoNodesForSelectionCriteria, Note
 from dbt.node_types import NodeType
 from dbt.exceptions import (
     DbtInternalError,
@@ -306,15 +307,64 @@ class NodeSelector(MethodManager):
 
         return filtered_nodes
 
-    def get_graph_queue(self, spec: SelectionSpec) -> GraphQueue:
+    def get_graph_queue(
+        self,
+        spec: SelectionSpec,
+        concurrency_limits: Optional[Mapping[str, int]] = None,
+        critical_path: bool = False,
+    ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
-        dependecies.
+        dependecies. With 'critical_path', nodes are scored by the execution
+        times of the previous run, if there is one.
         """
         selected_nodes = self.get_selected(spec)
         selected_resources.set_selected_resources(selected_nodes)
         new_graph = self.full_graph.get_subset_graph(selected_nodes)
         # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes)
+        return GraphQueue(
+            new_graph.graph,
+            self.manifest,
+            selected_nodes,
+            execution_times=self.get_previous_execution_times() if critical_path else None,
+            concurrency_limits=self.get_concurrency_limits(
+                selected_nodes, concurrency_limits or {}
+            ),
+        )
+
+    def get_concurrency_limits(
+        self, selected: Set[UniqueId], limits: Mapping[str, int]
+    ) -> List[ConcurrencyLimit]:
+        """Returns the selected nodes that each limit applies to. Limits are
+        keyed by a single selection criteria, like 'resource_type:snapshot' or
+        'config.materialized:table'. Graph operators and indirect selection
+        are ignored.
+        """
+        concurrency_limits = []
+        for raw, limit in limits.items():
+            criteria = SelectionCriteria.from_single_spec(
+                raw, indirect_selection=IndirectSelection.Empty
+            )
+            nodes = self.select_included(selected, criteria)
+            fire_event(
+                Note(msg=f"Concurrency limit {raw}: {limit} of {len(nodes)} selected nodes"),
+                level=EventLevel.DEBUG,
+            )
+            concurrency_limits.append(ConcurrencyLimit(name=raw, limit=limit, nodes=nodes))
+        return concurrency_limits
+
+    def get_previous_execution_times(self) -> Optional[Dict[str, float]]:
+        """Returns the execution times from the run_results.json in the state
+        directory, if there is one, for scheduling nodes on the critical path
+        first.
+        """
+        if self.previous_state is None or self.previous_state.results is None:
+            return None
+        # skipped nodes and nodes that failed before running have no useful time
+        return {
+            result.unique_id: result.execution_time
+            for result in self.previous_state.results.results
+            if result.execution_time > 0
+        }
 
 
 class ResourceTypeSelector(NodeSelector):
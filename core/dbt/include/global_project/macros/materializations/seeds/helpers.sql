@@ -94,11 +94,25 @@
   {% set batch_size = get_batch_size() %}
 
   {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+
+  {# Use the adapter's bulk load, if it has one #}
+  {% set bulk_load_sql = adapter.load_seed_rows(this, cols_sql, agate_table) %}
+  {% if bulk_load_sql %}
+    {{ return(bulk_load_sql) }}
+  {% endif %}
+
   {% set bindings = [] %}
 
   {% set statements = [] %}
 
-  {% for chunk in agate_table.rows | batch(batch_size) %}
+  {# tables from load_agate_table(streaming=true) only hold a sample of the rows #}
+  {% if agate_table.row_batches is defined %}
+    {% set batches = agate_table.row_batches(batch_size) %}
+  {% else %}
+    {% set batches = agate_table.rows | batch(batch_size) %}
+  {% endif %}
+
+  {% for chunk in batches %}
       {% set bindings = [] %}
 
       {% for row in chunk %}
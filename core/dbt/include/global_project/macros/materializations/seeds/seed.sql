@@ -9,7 +9,7 @@
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
   {%- set grant_config = config.get('grants') -%}
-  {%- set agate_table = load_agate_table() -%}
+  {%- set agate_table = load_agate_table(streaming=true) -%}
   -- grab current tables grants config for comparison later on
 
   {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
@@ -30,7 +30,7 @@
   {% endif %}
 
   {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
+  {% set rows_affected = agate_table.row_count %}
   {% set sql = load_csv_rows(model, agate_table) %}
 
   {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
@@ -1,7 +1,7 @@
 import abc
 import itertools
 import os
-from typing import List, Dict, Any, Generic, Optional, TypeVar
+from typing import List, Dict, Any, Generic, MutableMapping, Optional, TypeVar
 
 from dbt.dataclass_schema import ValidationError
 
@@ -26,6 +26,7 @@ from dbt.exceptions import (
 )
 from dbt import hooks
 from dbt.node_types import NodeType, ModelLanguage, AccessType
+from dbt.parser.perf import CONFIG, RENDER, timed_phase
 from dbt.parser.search import FileBlock
 
 # internally, the parser may store a less-restrictive type that will be
@@ -255,9 +256,12 @@ class ConfiguredParser(
             )
             raise DictParseError(exc, node=node)
 
-    def _context_for(self, parsed_node: IntermediateNode, config: ContextConfig) -> Dict[str, Any]:
+    def _context_for(
+        self, parsed_node: IntermediateNode, config: ContextConfig
+    ) -> MutableMapping[str, Any]:
         return generate_parser_model_context(parsed_node, self.root_project, self.manifest, config)
 
+    @timed_phase(RENDER)
     def render_with_context(self, parsed_node: IntermediateNode, config: ContextConfig):
         # Given the parsed node and a ContextConfig to use during parsing,
         # render the node's sql with macro capture enabled.
@@ -300,6 +304,7 @@ class ConfiguredParser(
 
         self._update_node_relation_name(parsed_node)
 
+    @timed_phase(CONFIG)
     def update_parsed_node_config(
         self,
         parsed_node: IntermediateNode,
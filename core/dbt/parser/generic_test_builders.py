@@ -5,6 +5,7 @@ from typing import (
     Dict,
     Any,
     Tuple,
+    Mapping,
     Optional,
     List,
 )
@@ -113,7 +114,7 @@ class TestBuilder(Generic[Testable]):
         test: Dict[str, Any],
         target: Testable,
         package_name: str,
-        render_ctx: Dict[str, Any],
+        render_ctx: Mapping[str, Any],
         column_name: Optional[str] = None,
         version: Optional[NodeVersion] = None,
     ) -> None:
@@ -23,7 +23,6 @@ from dbt.contracts.graph.semantic_manifest import SemanticManifest
 from dbt.events.base_types import EventLevel
 import json
 import pprint
-import msgpack
 
 import dbt.exceptions
 import dbt.tracking
@@ -61,7 +60,7 @@ from dbt.events.types import (
 from dbt.logger import DbtProcessState
 from dbt.node_types import NodeType, AccessType
 from dbt.clients.jinja import get_rendered, MacroStack
-from dbt.clients.jinja_static import statically_extract_macro_calls
+from dbt.clients.jinja_static import extract_macro_calls, resolve_macro_calls
 from dbt.clients.system import (
     make_directory,
     path_exists,
@@ -82,6 +81,15 @@ from dbt.parser.read_files import (
     ReadFiles,
 )
 from dbt.parser.partial import PartialParsing, special_override_macros
+from dbt.parser.partial_store import (  # noqa: F401
+    close_partial_parse_manifest,
+    extended_mashumaro_encoder,
+    extended_mashumuro_decoder,
+    extended_msgpack_decoder,
+    extended_msgpack_encoder,
+    load_partial_parse_manifest,
+    write_partial_parse_file,
+)
 from dbt.contracts.graph.manifest import (
     Manifest,
     Disabled,
@@ -116,6 +124,16 @@ from dbt.parser.docs import DocumentationParser
 from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
+from dbt.parser.parallel import (
+    PARALLEL_PARSER_TYPES,
+    MIN_FILES_FOR_PARALLEL_PARSE,
+    MIN_MACROS_FOR_PARALLEL_EXTRACT,
+    extract_macro_calls_in_parallel,
+    parallel_parse_supported,
+    parse_files_in_parallel,
+)
+from dbt.tracing import traced
+from dbt.parser.perf import FileParseInfo, parse_timing, time_file
 from dbt.parser.schemas import SchemaParser
 from dbt.parser.search import FileBlock
 from dbt.parser.seeds import SeedParser
@@ -131,36 +149,9 @@ from dbt_semantic_interfaces.type_enums import MetricType
 
 PARSING_STATE = DbtProcessState("parsing")
 PERF_INFO_FILE_NAME = "perf_info.json"
-
-
-def extended_mashumaro_encoder(data):
-    return msgpack.packb(data, default=extended_msgpack_encoder, use_bin_type=True)
-
-
-def extended_msgpack_encoder(obj):
-    if type(obj) is datetime.date:
-        date_bytes = msgpack.ExtType(1, obj.isoformat().encode())
-        return date_bytes
-    elif type(obj) is datetime.datetime:
-        datetime_bytes = msgpack.ExtType(2, obj.isoformat().encode())
-        return datetime_bytes
-
-    return obj
-
-
-def extended_mashumuro_decoder(data):
-    return msgpack.unpackb(data, ext_hook=extended_msgpack_decoder, raw=False)
-
-
-def extended_msgpack_decoder(code, data):
-    if code == 1:
-        d = datetime.date.fromisoformat(data.decode())
-        return d
-    elif code == 2:
-        dt = datetime.datetime.fromisoformat(data.decode())
-        return dt
-    else:
-        return msgpack.ExtType(code, data)
+FILE_PERF_INFO_FILE_NAME = "perf_info_files.json"
+# The number of slowest files to include in perf_info.json
+SLOWEST_FILES_COUNT = 10
 
 
 def version_to_str(version: Optional[Union[str, int]]) -> str:
@@ -211,6 +202,7 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     static_analysis_parsed_path_count: int = 0
     is_partial_parse_enabled: Optional[bool] = None
     is_static_analysis_enabled: Optional[bool] = None
+    parse_workers: Optional[int] = None
     read_files_elapsed: Optional[float] = None
     load_macros_elapsed: Optional[float] = None
     parse_project_elapsed: Optional[float] = None
@@ -218,6 +210,7 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     process_manifest_elapsed: Optional[float] = None
     load_all_elapsed: Optional[float] = None
     projects: List[ProjectLoaderInfo] = field(default_factory=list)
+    slowest_files: List[FileParseInfo] = field(default_factory=list)
     _project_index: Dict[str, ProjectLoaderInfo] = field(default_factory=dict)
 
     def __post_serialize__(self, dct):
@@ -235,6 +228,7 @@ class ManifestLoader:
         all_projects: Mapping[str, Project],
         macro_hook: Optional[Callable[[Manifest], Any]] = None,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
     ) -> None:
         self.root_project: RuntimeConfig = root_project
         self.all_projects: Mapping[str, Project] = all_projects
@@ -254,6 +248,8 @@ class ManifestLoader:
             self.macro_hook = macro_hook
 
         self._perf_info = self.build_perf_info()
+        # Per-file timings, slowest first. Only collected when writing perf info.
+        self._file_perf_info: List[FileParseInfo] = []
 
         # State check determines whether the saved_manifest and the current
         # manifest match well enough to do partial parsing
@@ -263,8 +259,17 @@ class ManifestLoader:
         self.partially_parsing = False
         self.partial_parser: Optional[PartialParsing] = None
 
-        # This is a saved manifest from a previous run that's used for partial parsing
-        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
+        # This is a saved manifest from a previous run that's used for partial parsing.
+        # A long running process (dbt parse --watch) can pass in the manifest it
+        # parsed last instead of reading it from the partial parse file.
+        # The macro calls saved with the last manifest. They're used even if
+        # the manifest can't be, since they only depend on the macro's SQL.
+        self.saved_macro_calls: Dict[str, Any] = {}
+        if saved_manifest is None:
+            saved_manifest = self.read_manifest_for_partial_parse()
+        else:
+            self.saved_macro_calls = saved_manifest._macro_calls
+        self.saved_manifest: Optional[Manifest] = saved_manifest
 
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
@@ -274,6 +279,7 @@ class ManifestLoader:
         config: RuntimeConfig,
         *,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
         reset: bool = False,
         write_perf_info=False,
     ) -> Manifest:
@@ -312,9 +318,16 @@ class ManifestLoader:
                 projects,
                 macro_hook=macro_hook,
                 file_diff=file_diff,
+                saved_manifest=saved_manifest,
             )
 
-            manifest = loader.load()
+            if write_perf_info:
+                # time the parsing of each file as well
+                with parse_timing() as parse_timer:
+                    manifest = loader.load()
+                loader._file_perf_info = parse_timer.slowest()
+            else:
+                manifest = loader.load()
 
             _check_manifest(manifest, config)
             manifest.build_flat_graph()
@@ -333,6 +346,7 @@ class ManifestLoader:
         return manifest
 
     # This is where the main action happens
+    @traced("load manifest", "parse")
     def load(self) -> Manifest:
         start_read_files = time.perf_counter()
 
@@ -605,6 +619,7 @@ class ManifestLoader:
                             )
                         )
 
+    @traced("load macros", "parse")
     def load_and_parse_macros(self, project_parser_files):
         for project in self.all_projects.values():
             if project.project_name not in project_parser_files:
@@ -614,7 +629,8 @@ class ManifestLoader:
                 parser = MacroParser(project, self.manifest)
                 for file_id in parser_files["MacroParser"]:
                     block = FileBlock(self.manifest.files[file_id])
-                    parser.parse_file(block)
+                    with time_file(file_id, block.file.parse_file_type):
+                        parser.parse_file(block)
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
             # generic tests hisotrically lived in the macros directoy but can now be nested
@@ -623,7 +639,8 @@ class ManifestLoader:
                 parser = GenericTestParser(project, self.manifest)
                 for file_id in parser_files["GenericTestParser"]:
                     block = FileBlock(self.manifest.files[file_id])
-                    parser.parse_file(block)
+                    with time_file(file_id, block.file.parse_file_type):
+                        parser.parse_file(block)
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
 
@@ -633,6 +650,11 @@ class ManifestLoader:
 
     # Parse the files in the 'parser_files' dictionary, for parsers listed in
     # 'parser_types'
+    @traced(
+        "parse project",
+        "parse",
+        lambda self, project, *args, **kwargs: {"project": project.project_name},
+    )
     def parse_project(
         self,
         project: Project,
@@ -643,6 +665,7 @@ class ManifestLoader:
         project_loader_info = self._perf_info._project_index[project.project_name]
         start_timer = time.perf_counter()
         total_parsed_path_count = 0
+        parse_workers = self.get_parse_workers()
 
         # Loop through parsers with loaded files.
         for parser_cls in parser_types:
@@ -657,21 +680,31 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
-                block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
-                    else:
-                        dct = block.file.dict_from_yaml
-                    # this is where the schema file gets parsed
-                    parser.parse_file(block, dct=dct)
-                    # Came out of here with UnpatchedSourceDefinition containing configs at the source level
-                    # and not configs at the table level (as expected)
-                else:
-                    parser.parse_file(block)
-                project_parsed_path_count += 1
+            if parse_workers > 1 and self.can_parse_in_parallel(
+                parser_cls, parser_files[parser_name]
+            ):
+                # Render the files in worker processes and merge the results
+                parse_files_in_parallel(parser, parser_files[parser_name], parse_workers)
+                project_parsed_path_count += len(parser_files[parser_name])
+            else:
+                if isinstance(parser, ModelParser):
+                    parser.extract_statically(parser_files[parser_name])
+                for file_id in parser_files[parser_name]:
+                    block = FileBlock(self.manifest.files[file_id])
+                    with time_file(file_id, block.file.parse_file_type):
+                        if isinstance(parser, SchemaParser):
+                            assert isinstance(block.file, SchemaSourceFile)
+                            if self.partially_parsing:
+                                dct = block.file.pp_dict
+                            else:
+                                dct = block.file.dict_from_yaml
+                            # this is where the schema file gets parsed
+                            parser.parse_file(block, dct=dct)
+                            # Came out of here with UnpatchedSourceDefinition containing configs at the source level
+                            # and not configs at the table level (as expected)
+                        else:
+                            parser.parse_file(block)
+                    project_parsed_path_count += 1
 
             # Save timing info
             project_loader_info.parsers.append(
@@ -706,6 +739,23 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    # The number of worker processes to use for rendering SQL files. 1 means
+    # that files are parsed serially in this process.
+    def get_parse_workers(self) -> int:
+        parse_workers = getattr(get_flags(), "PARSE_WORKERS", None) or 1
+        if parse_workers > 1 and not parallel_parse_supported():
+            fire_event(
+                Note(msg="Parallel parsing is not supported on this platform, parsing serially"),
+                level=EventLevel.DEBUG,
+            )
+            return 1
+        return parse_workers
+
+    def can_parse_in_parallel(self, parser_cls: Type[Parser], file_ids: List[str]) -> bool:
+        return (
+            parser_cls in PARALLEL_PARSER_TYPES and len(file_ids) >= MIN_FILES_FOR_PARALLEL_PARSE
+        )
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -720,11 +770,14 @@ class ManifestLoader:
         macro_namespace = TestMacroNamespace(self.macro_resolver, {}, None, MacroStack(), [])
         adapter = get_adapter(self.root_project)
         db_wrapper = ParseProvider().DatabaseWrapper(adapter, macro_namespace)
+        macro_calls = self.get_macro_calls()
         for macro in self.manifest.macros.values():
             if macro.created_at < self.started_at:
                 continue
-            possible_macro_calls = statically_extract_macro_calls(
-                macro.macro_sql, macro_ctx, db_wrapper
+            possible_macro_calls = resolve_macro_calls(
+                macro_calls[FileHash.from_contents(macro.macro_sql).checksum],
+                macro_ctx,
+                db_wrapper,
             )
             for macro_name in possible_macro_calls:
                 # adapter.dispatch calls can generate a call with the same name as the macro
@@ -738,6 +791,38 @@ class ManifestLoader:
                 if dep_macro_id:
                     macro.depends_on.add_macro(dep_macro_id)  # will check for dupes
 
+    # Return the calls in every macro in the manifest, by the checksum of its
+    # 'macro_sql'. Calls saved with the last manifest are reused, so only new
+    # or changed macros are parsed. The result is saved with this manifest.
+    def get_macro_calls(self) -> Dict[str, Any]:
+        saved_macro_calls = {**self.saved_macro_calls, **self.manifest._macro_calls}
+        macro_calls: Dict[str, Any] = {}
+        missing: Dict[str, str] = {}
+        for macro in self.manifest.macros.values():
+            checksum = FileHash.from_contents(macro.macro_sql).checksum
+            if checksum in saved_macro_calls:
+                macro_calls[checksum] = saved_macro_calls[checksum]
+            elif macro.created_at >= self.started_at:
+                missing[checksum] = macro.macro_sql
+
+        parse_workers = self.get_parse_workers()
+        if parse_workers > 1 and len(missing) >= MIN_MACROS_FOR_PARALLEL_EXTRACT:
+            calls = extract_macro_calls_in_parallel(list(missing.values()), parse_workers)
+            macro_calls.update(zip(missing, calls))
+        else:
+            for checksum, macro_sql in missing.items():
+                macro_calls[checksum] = extract_macro_calls(macro_sql)
+        fire_event(
+            Note(
+                msg=f"Extracted macro calls from {len(missing)} macros, "
+                f"{len(macro_calls) - len(missing)} were saved"
+            ),
+            level=EventLevel.DEBUG,
+        )
+        self.manifest._macro_calls = macro_calls
+        return macro_calls
+
+    @traced("write partial parse file", "artifacts")
     def write_manifest_for_partial_parse(self):
         path = os.path.join(self.root_project.project_target_path, PARTIAL_PARSE_FILE_NAME)
         try:
@@ -748,10 +833,8 @@ class ManifestLoader:
                     UnableToPartialParse(reason="saved manifest contained the wrong version")
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
             make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            write_partial_parse_file(self.manifest, path)
         except Exception:
             raise
 
@@ -875,10 +958,12 @@ class ManifestLoader:
         reparse_reason = None
 
         if os.path.exists(path):
+            manifest: Optional[Manifest] = None
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
+                # Nodes and files are only deserialized when they're used
+                manifest = load_partial_parse_manifest(path)
+                if manifest.metadata.dbt_version == __version__:
+                    self.saved_macro_calls = manifest._macro_calls
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
@@ -894,6 +979,9 @@ class ManifestLoader:
                     ParsedFileLoadFailed(path=path, exc=str(exc), exc_info=traceback.format_exc())
                 )
                 reparse_reason = ReparseReason.load_file_failure
+            if manifest is not None:
+                # the saved manifest isn't used, so don't keep its file mapped
+                close_partial_parse_manifest(manifest)
         else:
             fire_event(
                 UnableToPartialParse(reason="saved manifest not found. Starting full parse.")
@@ -911,6 +999,7 @@ class ManifestLoader:
         mli = ManifestLoaderInfo(
             is_partial_parse_enabled=flags.PARTIAL_PARSE,
             is_static_analysis_enabled=flags.STATIC_PARSER,
+            parse_workers=getattr(flags, "PARSE_WORKERS", None),
         )
         for project in self.all_projects.values():
             project_info = ProjectLoaderInfo(
@@ -1265,10 +1354,22 @@ class ManifestLoader:
                 )
 
     def write_perf_info(self, target_path: str):
+        self._perf_info.slowest_files = self._file_perf_info[:SLOWEST_FILES_COUNT]
         path = os.path.join(target_path, PERF_INFO_FILE_NAME)
         write_file(path, json.dumps(self._perf_info, cls=dbt.utils.JSONEncoder, indent=4))
         fire_event(ParsePerfInfoPath(path=path))
 
+        if self._file_perf_info:
+            # A list of every file, slowest first, with the time spent in each phase
+            files_path = os.path.join(target_path, FILE_PERF_INFO_FILE_NAME)
+            files = [info.to_dict() for info in self._file_perf_info]
+            write_file(files_path, json.dumps(files, cls=dbt.utils.JSONEncoder, indent=4))
+            fire_event(ParsePerfInfoPath(path=files_path))
+            slowest = "\n".join(
+                f"  {info.elapsed:.3f}s {info.file_id}" for info in self._perf_info.slowest_files
+            )
+            fire_event(Note(msg=f"Slowest files to parse:\n{slowest}"))
+
 
 def invalid_target_fail_unless_test(
     node,
@@ -1376,7 +1477,7 @@ DocsContextCallback = Callable[[ResultNode], Dict[str, Any]]
 
 # node and column descriptions
 def _process_docs_for_node(
-    context: Dict[str, Any],
+    context: Mapping[str, Any],
     node: ManifestNode,
 ):
     node.description = get_rendered(node.description, context)
@@ -1386,7 +1487,7 @@ def _process_docs_for_node(
 
 # source and table descriptions, column descriptions
 def _process_docs_for_source(
-    context: Dict[str, Any],
+    context: Mapping[str, Any],
     source: SourceDefinition,
 ):
     table_description = source.description
@@ -1403,23 +1504,23 @@ def _process_docs_for_source(
 
 
 # macro argument descriptions
-def _process_docs_for_macro(context: Dict[str, Any], macro: Macro) -> None:
+def _process_docs_for_macro(context: Mapping[str, Any], macro: Macro) -> None:
     macro.description = get_rendered(macro.description, context)
     for arg in macro.arguments:
         arg.description = get_rendered(arg.description, context)
 
 
 # exposure descriptions
-def _process_docs_for_exposure(context: Dict[str, Any], exposure: Exposure) -> None:
+def _process_docs_for_exposure(context: Mapping[str, Any], exposure: Exposure) -> None:
     exposure.description = get_rendered(exposure.description, context)
 
 
-def _process_docs_for_metrics(context: Dict[str, Any], metric: Metric) -> None:
+def _process_docs_for_metrics(context: Mapping[str, Any], metric: Metric) -> None:
     metric.description = get_rendered(metric.description, context)
 
 
 def _process_docs_for_semantic_model(
-    context: Dict[str, Any], semantic_model: SemanticModel
+    context: Mapping[str, Any], semantic_model: SemanticModel
 ) -> None:
     if semantic_model.description:
         semantic_model.description = get_rendered(semantic_model.description, context)
@@ -1734,6 +1835,7 @@ def write_semantic_manifest(manifest: Manifest, target_path: str) -> None:
     semantic_manifest.write_json_to_file(path)
 
 
+@traced("write manifest", "artifacts")
 def write_manifest(manifest: Manifest, target_path: str):
     path = os.path.join(target_path, MANIFEST_FILE_NAME)
     manifest.write(path)
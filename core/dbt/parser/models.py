@@ -7,6 +7,7 @@ from dbt.events.functions import fire_event_if_test
 from dbt.flags import get_flags
 from dbt.node_types import NodeType, ModelLanguage
 from dbt.parser.base import SimpleSQLParser
+from dbt.parser.perf import STATIC_PARSE, time_phase, timed_phase
 from dbt.parser.search import FileBlock
 from dbt.clients.jinja import get_rendered
 import dbt.tracking as tracking
@@ -167,6 +168,11 @@ def verify_python_model_code(node):
 
 
 class ModelParser(SimpleSQLParser[ModelNode]):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # raw_code -> static parser result, filled in by extract_statically
+        self._static_results: Dict[str, Union[str, Dict[str, List[Any]]]] = {}
+
     def parse_from_dict(self, dct, validate=True) -> ModelNode:
         if validate:
             ModelNode.validate(dct)
@@ -392,9 +398,13 @@ class ModelParser(SimpleSQLParser[ModelNode]):
                     }
                 )
 
+    @timed_phase(STATIC_PARSE)
     def run_static_parser(self, node: ModelNode) -> Optional[Union[str, Dict[str, List[Any]]]]:
+        # results from extract_statically were only computed after the project passed
+        # the banned macro check, so that check doesn't need to run again for them.
+        statically_parsed = self._static_results.pop(node.raw_code, None)
         # if any banned macros have been overridden by the user, we cannot use the static parser.
-        if self._has_banned_macro(node):
+        if statically_parsed is None and self._has_banned_macro(node):
             # this log line is used for integration testing. If you change
             # the code at the beginning of the line change the tests in
             # test/integration/072_experimental_parser_tests/test_all_experimental_parser.py
@@ -406,24 +416,45 @@ class ModelParser(SimpleSQLParser[ModelNode]):
             )
             return "has_banned_macro"
 
-        # run the stable static parser and return the results
-        try:
-            statically_parsed = py_extract_from_source(node.raw_code)
+        # run the stable static parser, unless it already ran in extract_statically,
+        # and return the results
+        if statically_parsed is None:
+            statically_parsed = _extract_from_source(node.raw_code)
+        if isinstance(statically_parsed, dict):
             fire_event_if_test(
                 lambda: Note(msg=f"1699: static parser successfully parsed {node.path}"),
                 EventLevel.DEBUG,
             )
-            return _shift_sources(statically_parsed)
-        # if we want information on what features are barring the static
-        # parser from reading model files, this is where we would add that
-        # since that information is stored in the `ExtractionError`.
-        except ExtractionError:
+        else:
             fire_event_if_test(
                 lambda: Note(msg=f"1603: static parser failed on {node.path}"),
                 EventLevel.DEBUG,
             )
-            return "cannot_parse"
+        return statically_parsed
 
+    def extract_statically(self, file_ids: List[str]) -> None:
+        """Run the stable static parser on the SQL models in 'file_ids' in
+        one pass, before they are parsed. Parsing a model then only has to
+        apply the result, or fall back to jinja rendering if it failed.
+        """
+        flags = get_flags()
+        if not flags.STATIC_PARSER or flags.USE_EXPERIMENTAL_PARSER:
+            return
+        # every model in the project has the same banned macros in scope, so the
+        # check runs once here instead of once per model in run_static_parser
+        if self._has_banned_macro_in_package(self.project.project_name):
+            return
+        for file_id in file_ids:
+            source_file = self.manifest.files[file_id]
+            raw_code = source_file.contents
+            if raw_code is None or not source_file.path.relative_path.endswith(".sql"):
+                continue
+            # results are used once, a model with the same code as another is parsed again
+            if raw_code not in self._static_results:
+                with time_phase(STATIC_PARSE, file_id):
+                    self._static_results[raw_code] = _extract_from_source(raw_code)
+
+    @timed_phase(STATIC_PARSE)
     def run_experimental_parser(
         self, node: ModelNode
     ) -> Optional[Union[str, Dict[str, List[Any]]]]:
@@ -463,9 +494,11 @@ class ModelParser(SimpleSQLParser[ModelNode]):
 
     # checks for banned macros
     def _has_banned_macro(self, node: ModelNode) -> bool:
+        return self._has_banned_macro_in_package(node.package_name)
+
+    def _has_banned_macro_in_package(self, project_name: str) -> bool:
         # first check if there is a banned macro defined in scope for this model file
         root_project_name = self.root_project.project_name
-        project_name = node.package_name
         banned_macros = ["ref", "source", "config"]
 
         all_banned_macro_keys: Iterator[str] = chain.from_iterable(
@@ -523,9 +556,21 @@ def _get_config_call_dict(static_parser_result: Dict[str, Any]) -> Dict[str, Any
     return config_call_dict
 
 
+# runs the stable static parser on 'raw_code'. Returns "cannot_parse" if it fails.
+def _extract_from_source(raw_code: str) -> Union[str, Dict[str, List[Any]]]:
+    try:
+        return _shift_sources(py_extract_from_source(raw_code))
+    # if we want information on what features are barring the static
+    # parser from reading model files, this is where we would add that
+    # since that information is stored in the `ExtractionError`.
+    except ExtractionError:
+        return "cannot_parse"
+
+
 # TODO if we format sources in the extractor to match this type, we won't need this function.
 def _shift_sources(static_parser_result: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
-    shifted_result = deepcopy(static_parser_result)
+    # the extractor returns a new result for every call, so it's not copied deeply
+    shifted_result = dict(static_parser_result)
     source_calls = []
 
     for s in static_parser_result["sources"]:
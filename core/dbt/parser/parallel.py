@@ -0,0 +1,182 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Type
+
+from dbt.clients.jinja_static import StaticMacroCall, extract_macro_calls
+from dbt.contracts.files import AnySourceFile
+from dbt.contracts.graph.manifest import Manifest, ParsingInfo
+from dbt.contracts.graph.nodes import GraphMemberNode, ManifestNode
+from dbt.events.base_types import EventLevel
+from dbt.events.functions import fire_event
+from dbt.events.types import Note
+from dbt.parser.analysis import AnalysisParser
+from dbt.parser.base import Parser
+from dbt.parser.models import ModelParser
+from dbt.parser.perf import FileParseInfo, get_parse_timer, time_file
+from dbt.parser.search import FileBlock
+from dbt.parser.snapshots import SnapshotParser
+
+
+# Parsers whose files can be rendered independently of each other. The nodes
+# they produce only depend on the macros (which have already been loaded) and
+# the project configs, so they can be rendered in any order and merged back.
+PARALLEL_PARSER_TYPES: Tuple[Type[Parser], ...] = (
+    ModelParser,
+    SnapshotParser,
+    AnalysisParser,
+)
+
+# Don't bother starting processes for a handful of files
+MIN_FILES_FOR_PARALLEL_PARSE = 2
+
+# Extracting the calls from a macro is much quicker than parsing a file
+MIN_MACROS_FOR_PARALLEL_EXTRACT = 100
+
+
+@dataclass
+class ParsedFileResult:
+    """The manifest changes produced by parsing one file in a worker process"""
+
+    file_id: str
+    source_file: Optional[AnySourceFile] = None
+    nodes: List[ManifestNode] = field(default_factory=list)
+    disabled: List[GraphMemberNode] = field(default_factory=list)
+    env_vars: Dict[str, str] = field(default_factory=dict)
+    parsing_info: ParsingInfo = field(default_factory=ParsingInfo)
+    # The time spent parsing the file, if per-file timing is enabled
+    timing: Optional[FileParseInfo] = None
+    # The worker couldn't parse the file. It is re-parsed in the main process,
+    # so that errors are raised with the usual exception types and messages.
+    failed: bool = False
+
+
+# The parser used by worker processes. It's set in the main process before the
+# pool is created, and inherited by the (forked) workers along with the
+# manifest, the macros and the adapter.
+_worker_parser: Optional[Parser] = None
+
+
+def parallel_parse_supported() -> bool:
+    # Workers rely on inheriting the loaded macros and adapter from the main
+    # process, so this is only possible with 'fork'.
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _parse_file_in_worker(file_id: str) -> ParsedFileResult:
+    parser = _worker_parser
+    assert parser is not None
+    manifest = parser.manifest
+
+    # Swap in empty containers so we only collect what this file adds
+    saved = (manifest.nodes, manifest.disabled, manifest.env_vars, manifest._parsing_info)
+    manifest.nodes, manifest.disabled, manifest.env_vars = {}, {}, {}
+    manifest._parsing_info = ParsingInfo()
+    # The timer (if any) is a copy of the main process's, which already has
+    # the time spent reading the file. Only send back the time spent here.
+    timer = get_parse_timer()
+    if timer is not None:
+        timer.files.pop(file_id, None)
+    try:
+        source_file = manifest.files[file_id]
+        with time_file(file_id, source_file.parse_file_type):
+            parser.parse_file(FileBlock(source_file))
+        return ParsedFileResult(
+            file_id=file_id,
+            source_file=source_file,
+            nodes=list(manifest.nodes.values()),
+            disabled=[node for nodes in manifest.disabled.values() for node in nodes],
+            env_vars=dict(manifest.env_vars),
+            parsing_info=manifest._parsing_info,
+            timing=timer.files.pop(file_id) if timer is not None else None,
+        )
+    except Exception:
+        return ParsedFileResult(file_id=file_id, failed=True)
+    finally:
+        manifest.nodes, manifest.disabled, manifest.env_vars, manifest._parsing_info = saved
+
+
+def merge_parsed_file(manifest: Manifest, parser: Parser, result: ParsedFileResult) -> None:
+    if result.failed:
+        source_file = manifest.files[result.file_id]
+        with time_file(result.file_id, source_file.parse_file_type):
+            parser.parse_file(FileBlock(source_file))
+        return
+
+    assert result.source_file is not None
+    # The source file already has the unique_ids and env_vars added by the worker
+    manifest.files[result.file_id] = result.source_file
+    for node in result.nodes:
+        manifest.add_node_nofile(node)
+    for disabled_node in result.disabled:
+        manifest.add_disabled_nofile(disabled_node)
+    manifest.env_vars.update(result.env_vars)
+    timer = get_parse_timer()
+    if timer is not None and result.timing is not None:
+        timer.record(result.timing)
+    manifest._parsing_info.static_analysis_path_count += (
+        result.parsing_info.static_analysis_path_count
+    )
+    manifest._parsing_info.static_analysis_parsed_path_count += (
+        result.parsing_info.static_analysis_parsed_path_count
+    )
+
+
+def parse_files_in_parallel(parser: Parser, file_ids: List[str], workers: int) -> None:
+    """Render the given files in a pool of worker processes and merge the
+    resulting nodes into the parser's manifest. Results are merged in the
+    order of 'file_ids', so the manifest is the same as after a serial parse.
+    """
+    global _worker_parser
+
+    workers = min(workers, len(file_ids))
+    chunksize = max(1, len(file_ids) // (workers * 4))
+    fire_event(
+        Note(
+            msg=f"Parsing {len(file_ids)} files with {parser.__class__.__name__} "
+            f"in {workers} processes"
+        ),
+        level=EventLevel.DEBUG,
+    )
+
+    _worker_parser = parser
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            results = executor.map(_parse_file_in_worker, file_ids, chunksize=chunksize)
+            for result in results:
+                merge_parsed_file(parser.manifest, parser, result)
+    finally:
+        _worker_parser = None
+
+
+def _extract_macro_calls_in_worker(macro_sql: str) -> Optional[List[StaticMacroCall]]:
+    try:
+        return extract_macro_calls(macro_sql)
+    except Exception:
+        # extracted again in the main process to raise the error
+        return None
+
+
+def extract_macro_calls_in_parallel(
+    macro_sqls: List[str], workers: int
+) -> List[List[StaticMacroCall]]:
+    """Return the calls found by extract_macro_calls in each of 'macro_sqls',
+    in the same order, using a pool of worker processes."""
+    workers = min(workers, len(macro_sqls))
+    chunksize = max(1, len(macro_sqls) // (workers * 4))
+    fire_event(
+        Note(msg=f"Extracting macro calls from {len(macro_sqls)} macros in {workers} processes"),
+        level=EventLevel.DEBUG,
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        results = list(
+            executor.map(_extract_macro_calls_in_worker, macro_sqls, chunksize=chunksize)
+        )
+    return [
+        calls if calls is not None else extract_macro_calls(macro_sql)
+        for macro_sql, calls in zip(macro_sqls, results)
+    ]
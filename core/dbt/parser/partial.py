@@ -16,6 +16,7 @@ from dbt.events.types import (
 )
 from dbt.constants import DEFAULT_ENV_PLACEHOLDER
 from dbt.node_types import NodeType
+from dbt.parser.partial_store import saved_file_summary
 
 
 mssat_files = (
@@ -108,11 +109,14 @@ class PartialParsing:
         # separate out deleted schema files
         deleted_schema_files = []
         deleted = []
+        # Use the saved files' summaries, so that unchanged files in a lazily
+        # loaded manifest don't need to be deserialized
         for file_id in deleted_all_files:
-            if self.saved_files[file_id].parse_file_type == ParseFileType.Schema:
+            saved_file = saved_file_summary(self.saved_files, file_id)
+            if saved_file.parse_file_type == ParseFileType.Schema:
                 deleted_schema_files.append(file_id)
             else:
-                if self.saved_files[file_id].parse_file_type in mg_files:
+                if saved_file.parse_file_type in mg_files:
                     changed_or_deleted_macro_file = True
                 deleted.append(file_id)
 
@@ -120,17 +124,18 @@ class PartialParsing:
         changed_schema_files = []
         unchanged = []
         for file_id in common:
-            if self.saved_files[file_id].checksum == self.new_files[file_id].checksum:
+            saved_file = saved_file_summary(self.saved_files, file_id)
+            if saved_file.checksum == self.new_files[file_id].checksum:
                 unchanged.append(file_id)
             else:
                 # separate out changed schema files
-                if self.saved_files[file_id].parse_file_type == ParseFileType.Schema:
+                if saved_file.parse_file_type == ParseFileType.Schema:
                     sf = self.saved_files[file_id]
                     if type(sf).__name__ != "SchemaSourceFile":
                         raise Exception(f"Serialization failure for {file_id}")
                     changed_schema_files.append(file_id)
                 else:
-                    if self.saved_files[file_id].parse_file_type in mg_files:
+                    if saved_file.parse_file_type in mg_files:
                         changed_or_deleted_macro_file = True
                     changed.append(file_id)
 
@@ -975,10 +980,10 @@ class PartialParsing:
         # a list of vars.
         # Create a list of file_ids for source_files that need to be reparsed, and
         # a dictionary of file_ids to yaml_keys to names.
-        for source_file in self.saved_files.values():
-            file_id = source_file.file_id
-            if not source_file.env_vars:
+        for file_id in self.saved_files:
+            if not saved_file_summary(self.saved_files, file_id).has_env_vars:
                 continue
+            source_file = self.saved_files[file_id]
             if source_file.parse_file_type == ParseFileType.Schema:
                 for yaml_key in source_file.env_vars.keys():
                     for name in source_file.env_vars[yaml_key].keys():
@@ -0,0 +1,585 @@
+"""Reading and writing the partial parsing file (target/partial_parse.msgpack)
+
+The file is laid out so that it can be memory-mapped and deserialized on
+demand, instead of unpacking the whole manifest before we know whether
+anything has changed:
+
+    MAGIC | index offset | entry, entry, ... | index
+
+Every node, source, macro, file, etc. is packed on its own as an 'entry'.
+The index is a msgpack map holding the small parts of the manifest (metadata,
+state check, env vars, selectors) and, for each of the large manifest
+dictionaries, a list of [key, offset, length, ...] for its entries. File
+entries also carry their checksum, parse file type and whether they use env
+vars, so that partial parsing can compute the file diff without loading them.
+
+Entries are unpacked and converted to objects the first time they're looked
+up in their LazyMapping. Entries that were never loaded can't have changed,
+so they are copied to the new file as raw bytes when it's written.
+
+When the manifest is saved to the file it was loaded from, the file is
+updated in place instead: entries that are unchanged keep their location,
+changed and new entries are appended, followed by a new index, and finally
+the index offset in the header is updated. Until that last write the old
+index remains valid. Replaced entries and old indexes are left behind as
+garbage, and once they make up too much of the file it is compacted by
+writing a new copy of it.
+"""
+import datetime
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import msgpack
+
+from dbt.contracts.files import AnySourceFile, FileHash, ParseFileType
+from dbt.contracts.graph.manifest import Manifest, ManifestMetadata, ManifestStateCheck
+from dbt.contracts.graph.nodes import (
+    Documentation,
+    Exposure,
+    GraphMemberNode,
+    Group,
+    Macro,
+    ManifestNode,
+    Metric,
+    SemanticModel,
+    SourceDefinition,
+)
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.events.base_types import EventLevel
+from dbt.events.functions import fire_event
+from dbt.events.types import Note
+from dbt.exceptions import DbtInternalError
+
+
+PARTIAL_PARSE_FILE_MAGIC = b"DBTPP\x00\x00\x01"
+_INDEX_OFFSET = struct.Struct("<Q")
+_HEADER_SIZE = len(PARTIAL_PARSE_FILE_MAGIC) + _INDEX_OFFSET.size
+
+# Compact the file when more than this fraction of it is garbage
+PARTIAL_PARSE_COMPACTION_RATIO = 0.5
+
+
+def extended_mashumaro_encoder(data):
+    return msgpack.packb(data, default=extended_msgpack_encoder, use_bin_type=True)
+
+
+def extended_msgpack_encoder(obj):
+    if type(obj) is datetime.date:
+        date_bytes = msgpack.ExtType(1, obj.isoformat().encode())
+        return date_bytes
+    elif type(obj) is datetime.datetime:
+        datetime_bytes = msgpack.ExtType(2, obj.isoformat().encode())
+        return datetime_bytes
+
+    return obj
+
+
+def extended_mashumuro_decoder(data):
+    return msgpack.unpackb(data, ext_hook=extended_msgpack_decoder, raw=False)
+
+
+def extended_msgpack_decoder(code, data):
+    if code == 1:
+        d = datetime.date.fromisoformat(data.decode())
+        return d
+    elif code == 2:
+        dt = datetime.datetime.fromisoformat(data.decode())
+        return dt
+    else:
+        return msgpack.ExtType(code, data)
+
+
+# These wrap a single manifest value, so that entries are serialized and
+# deserialized with the same (union) types as the Manifest fields.
+@dataclass
+class NodeEntry(dbtClassMixin):
+    value: ManifestNode
+
+
+@dataclass
+class SourceEntry(dbtClassMixin):
+    value: SourceDefinition
+
+
+@dataclass
+class MacroEntry(dbtClassMixin):
+    value: Macro
+
+
+@dataclass
+class DocEntry(dbtClassMixin):
+    value: Documentation
+
+
+@dataclass
+class ExposureEntry(dbtClassMixin):
+    value: Exposure
+
+
+@dataclass
+class MetricEntry(dbtClassMixin):
+    value: Metric
+
+
+@dataclass
+class GroupEntry(dbtClassMixin):
+    value: Group
+
+
+@dataclass
+class FileEntry(dbtClassMixin):
+    value: AnySourceFile
+
+
+@dataclass
+class DisabledEntry(dbtClassMixin):
+    value: List[GraphMemberNode]
+
+
+@dataclass
+class SemanticModelEntry(dbtClassMixin):
+    value: SemanticModel
+
+
+# Manifest attributes that are stored as separate entries
+ENTRY_SECTIONS: Dict[str, Type[dbtClassMixin]] = {
+    "nodes": NodeEntry,
+    "sources": SourceEntry,
+    "macros": MacroEntry,
+    "docs": DocEntry,
+    "exposures": ExposureEntry,
+    "metrics": MetricEntry,
+    "groups": GroupEntry,
+    "files": FileEntry,
+    "disabled": DisabledEntry,
+    "semantic_models": SemanticModelEntry,
+}
+
+
+class Unloaded(NamedTuple):
+    """The location of an entry that hasn't been deserialized yet"""
+
+    offset: int
+    length: int
+    extra: Tuple[Any, ...] = ()
+
+
+class SavedFileSummary(NamedTuple):
+    """What partial parsing needs to know about a saved file to decide
+    whether it has changed"""
+
+    checksum: FileHash
+    parse_file_type: Optional[ParseFileType]
+    has_env_vars: bool
+
+    @classmethod
+    def from_source_file(cls, source_file: AnySourceFile) -> "SavedFileSummary":
+        return cls(
+            checksum=source_file.checksum,
+            parse_file_type=source_file.parse_file_type,
+            has_env_vars=bool(source_file.env_vars),
+        )
+
+    @classmethod
+    def from_index(cls, extra: Tuple[Any, ...]) -> "SavedFileSummary":
+        hash_name, checksum, parse_file_type, has_env_vars = extra
+        return cls(
+            checksum=FileHash(name=hash_name, checksum=checksum),
+            parse_file_type=ParseFileType(parse_file_type) if parse_file_type else None,
+            has_env_vars=has_env_vars,
+        )
+
+    def to_index(self) -> List[Any]:
+        return [
+            self.checksum.name,
+            self.checksum.checksum,
+            self.parse_file_type,
+            self.has_env_vars,
+        ]
+
+
+class LazyMapping(MutableMapping[str, Any]):
+    """A dictionary whose values are deserialized from a PartialParseFile
+    the first time they are looked up. Keys keep the order of the saved file.
+    """
+
+    def __init__(self, store: "PartialParseFile", section: str, data: Dict[str, Any]) -> None:
+        self._store = store
+        self._section = section
+        # values are either deserialized objects or Unloaded locations
+        self._data = data
+        # where the entries were saved, whether or not they've been loaded
+        self._saved: Dict[str, Unloaded] = dict(data)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if type(value) is Unloaded:
+            with self._store.lock:
+                value = self._data[key]
+                if type(value) is Unloaded:
+                    value = self._store.load_entry(self._section, value)
+                    self._data[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._section}, {len(self._data)} entries)"
+
+    # Copies and pickles are ordinary dictionaries, because the memory map
+    # can't be shared.
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __reduce__(self):
+        return (dict, (list(self.items()),))
+
+    @property
+    def store(self) -> "PartialParseFile":
+        return self._store
+
+    def get_unloaded(self, key: str) -> Optional[Unloaded]:
+        value = self._data[key]
+        return value if type(value) is Unloaded else None
+
+    def get_saved(self, key: str) -> Optional[Unloaded]:
+        return self._saved.get(key)
+
+    def set_saved(self, entries: List[List[Any]]) -> None:
+        """Record where the entries were saved when the file was appended to"""
+        self._saved = {
+            key: Unloaded(offset, length, tuple(extra)) for key, offset, length, *extra in entries
+        }
+
+    def unloaded_count(self) -> int:
+        return sum(1 for value in self._data.values() if type(value) is Unloaded)
+
+    def load_all(self) -> None:
+        for key in self._data:
+            self[key]
+
+
+class LazySourceFiles(LazyMapping):
+    def summary(self, file_id: str) -> SavedFileSummary:
+        unloaded = self.get_unloaded(file_id)
+        if unloaded is not None:
+            return SavedFileSummary.from_index(unloaded.extra)
+        return SavedFileSummary.from_source_file(self[file_id])
+
+
+def saved_file_summary(files: Mapping[str, AnySourceFile], file_id: str) -> SavedFileSummary:
+    if isinstance(files, LazySourceFiles):
+        return files.summary(file_id)
+    return SavedFileSummary.from_source_file(files[file_id])
+
+
+class PartialParseFile:
+    """A memory-mapped partial parsing file. The mapping stays open for as
+    long as there are LazyMappings that haven't been fully loaded.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.RLock()
+        with open(path, "rb") as fp:
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self._stat = os.fstat(fp.fileno())
+        if self._mmap[: len(PARTIAL_PARSE_FILE_MAGIC)] != PARTIAL_PARSE_FILE_MAGIC:
+            self.close()
+            raise DbtInternalError(f"{path} is not a partial parsing file")
+        (index_offset,) = _INDEX_OFFSET.unpack_from(self._mmap, len(PARTIAL_PARSE_FILE_MAGIC))
+        self.index: Dict[str, Any] = extended_mashumuro_decoder(self._mmap[index_offset:])
+        self.mappings: List[LazyMapping] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._mmap is not None
+
+    def is_current(self, path: str) -> bool:
+        """Whether 'path' is still the file this was read from, as it was
+        when it was read (or when we last appended to it)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return (stat.st_dev, stat.st_ino, stat.st_size) == (
+            self._stat.st_dev,
+            self._stat.st_ino,
+            self._stat.st_size,
+        )
+
+    def remap(self, fp: BinaryIO) -> None:
+        """Map the file again after appending to it through 'fp', so that the
+        appended entries can be read"""
+        with self.lock:
+            self.close()
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self._stat = os.fstat(fp.fileno())
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def read_entry(self, unloaded: Unloaded) -> bytes:
+        if self._mmap is None:
+            raise DbtInternalError(f"Partial parsing file {self.path} has been closed")
+        return self._mmap[unloaded.offset : unloaded.offset + unloaded.length]
+
+    def load_entry(self, section: str, unloaded: Unloaded) -> Any:
+        data = extended_mashumuro_decoder(self.read_entry(unloaded))
+        return ENTRY_SECTIONS[section].from_dict({"value": data}).value  # type: ignore
+
+    def release(self) -> None:
+        """Load every remaining entry and close the memory map"""
+        with self.lock:
+            for mapping in self.mappings:
+                mapping.load_all()
+            self.close()
+
+    def build_mapping(self, section: str) -> LazyMapping:
+        data: Dict[str, Any] = {
+            key: Unloaded(offset, length, tuple(extra))
+            for key, offset, length, *extra in self.index["sections"].get(section, [])
+        }
+        mapping_cls = LazySourceFiles if section == "files" else LazyMapping
+        mapping = mapping_cls(self, section, data)
+        self.mappings.append(mapping)
+        return mapping
+
+    def build_manifest(self) -> Manifest:
+        header = self.index["header"]
+        sections = {section: self.build_mapping(section) for section in ENTRY_SECTIONS}
+        manifest = Manifest(
+            metadata=ManifestMetadata.from_dict(header["metadata"]),
+            state_check=ManifestStateCheck.from_dict(header["state_check"]),
+            selectors=header["selectors"],
+            env_vars=header["env_vars"],
+            flat_graph=header["flat_graph"],
+            **sections,  # type: ignore
+        )
+        manifest._macro_calls = header.get("macro_calls", {})
+        return manifest
+
+
+def is_partial_parse_file(path: str) -> bool:
+    with open(path, "rb") as fp:
+        return fp.read(len(PARTIAL_PARSE_FILE_MAGIC)) == PARTIAL_PARSE_FILE_MAGIC
+
+
+def load_partial_parse_manifest(path: str) -> Manifest:
+    """Return the manifest saved at 'path'. Files written by older versions
+    of dbt, which are a single msgpack document, are read in full.
+    """
+    if not is_partial_parse_file(path):
+        with open(path, "rb") as fp:
+            manifest_mp = fp.read()
+        return Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
+    return PartialParseFile(path).build_manifest()
+
+
+def close_partial_parse_manifest(manifest: Manifest) -> None:
+    """Close the file that a manifest returned by load_partial_parse_manifest
+    was read from, when the manifest won't be used"""
+    if isinstance(manifest.files, LazyMapping):
+        manifest.files.store.close()
+
+
+def _index_extra(section: str, value: Any) -> List[Any]:
+    if section == "files":
+        return SavedFileSummary.from_source_file(value).to_index()
+    return []
+
+
+class _EntryWriter:
+    """Writes entries to 'fp' starting at 'offset'. If 'base' is the
+    PartialParseFile being appended to, entries that are unchanged since it
+    was read are not written again, they keep their location in it.
+    """
+
+    def __init__(
+        self, fp: BinaryIO, offset: int = _HEADER_SIZE, base: Optional[PartialParseFile] = None
+    ) -> None:
+        self.fp = fp
+        self.offset = offset
+        self.base = base
+        self.stores: List[PartialParseFile] = []
+        # the number of bytes used by the entries in the index
+        self.live_bytes = 0
+        # section -> the entries in the index
+        self.sections: Dict[str, List[List[Any]]] = {}
+
+    def write(self, data: bytes) -> Tuple[int, int]:
+        offset = self.offset
+        self.fp.write(data)
+        self.offset += len(data)
+        return offset, len(data)
+
+    def write_section(self, section: str, values: Mapping[str, Any]) -> List[List[Any]]:
+        entry_cls = ENTRY_SECTIONS[section]
+        lazy = values if isinstance(values, LazyMapping) else None
+        if lazy is not None and lazy.store not in self.stores:
+            self.stores.append(lazy.store)
+        entries = []
+        for key in values:
+            unloaded = lazy.get_unloaded(key) if lazy is not None else None
+            if unloaded is not None:
+                assert lazy is not None
+                # never loaded, so it's unchanged since it was saved
+                if lazy.store is self.base:
+                    offset, length = unloaded.offset, unloaded.length
+                else:
+                    offset, length = self.write(lazy.store.read_entry(unloaded))
+                extra = list(unloaded.extra)
+            else:
+                value = values[key]
+                dct = entry_cls(value=value).to_dict()["value"]  # type: ignore
+                data = extended_mashumaro_encoder(dct)
+                saved = self.saved_location(lazy, key)
+                if saved is not None and self.base.read_entry(saved) == data:  # type: ignore
+                    # loaded, but not modified
+                    offset, length = saved.offset, saved.length
+                else:
+                    offset, length = self.write(data)
+                extra = _index_extra(section, value)
+            self.live_bytes += length
+            entries.append([key, offset, length, *extra])
+        return entries
+
+    def saved_location(self, lazy: Optional[LazyMapping], key: str) -> Optional[Unloaded]:
+        if lazy is None or self.base is None or lazy.store is not self.base:
+            return None
+        if not self.base.is_open:
+            return None
+        return lazy.get_saved(key)
+
+    def write_manifest(self, manifest: Manifest) -> Tuple[int, int]:
+        """Write the manifest's entries and index. Returns the offset of the
+        index and the number of garbage bytes before it."""
+        self.sections = sections = {
+            section: self.write_section(section, getattr(manifest, section))
+            for section in ENTRY_SECTIONS
+        }
+        garbage = self.offset - _HEADER_SIZE - self.live_bytes
+        index = {
+            "header": {
+                "metadata": manifest.metadata.to_dict(),
+                "state_check": manifest.state_check.to_dict(),
+                "selectors": manifest.selectors,
+                "env_vars": manifest.env_vars,
+                "flat_graph": manifest.flat_graph,
+                "macro_calls": manifest._macro_calls,
+            },
+            "sections": sections,
+        }
+        index_offset, _ = self.write(extended_mashumaro_encoder(index))
+        return index_offset, garbage
+
+
+def _rewrite_partial_parse_file(manifest: Manifest, path: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as fp:
+        fp.write(PARTIAL_PARSE_FILE_MAGIC)
+        fp.write(_INDEX_OFFSET.pack(0))
+        writer = _EntryWriter(fp)
+        index_offset, _ = writer.write_manifest(manifest)
+        fp.seek(len(PARTIAL_PARSE_FILE_MAGIC))
+        fp.write(_INDEX_OFFSET.pack(index_offset))
+
+    # A mapped file can't be replaced on Windows, so load everything we still
+    # need from the old file first. Elsewhere the old mapping stays valid.
+    if os.name == "nt":
+        for store in writer.stores:
+            store.release()
+    os.replace(tmp_path, path)
+
+
+def _append_partial_parse_file(manifest: Manifest, store: PartialParseFile) -> Tuple[int, int]:
+    """Update the file 'store' was read from in place. Returns the size of
+    the file and the number of garbage bytes in it."""
+    with open(store.path, "r+b") as fp:
+        fp.seek(0, os.SEEK_END)
+        writer = _EntryWriter(fp, offset=fp.tell(), base=store)
+        index_offset, garbage = writer.write_manifest(manifest)
+        # Make sure the new entries and index are on disk before switching
+        # the header to them, so that the file is never left unreadable.
+        fp.flush()
+        os.fsync(fp.fileno())
+        fp.seek(len(PARTIAL_PARSE_FILE_MAGIC))
+        fp.write(_INDEX_OFFSET.pack(index_offset))
+        fp.flush()
+        store.remap(fp)
+
+    # Later writes compare entries with the ones just written, not the ones
+    # that were first loaded, so they're only appended again if they change
+    for section, entries in writer.sections.items():
+        mapping = getattr(manifest, section)
+        if isinstance(mapping, LazyMapping) and mapping.store is store:
+            mapping.set_saved(entries)
+    return writer.offset, garbage
+
+
+def _appendable_store(manifest: Manifest, path: str) -> Optional[PartialParseFile]:
+    # Growing a mapped file isn't reliable on Windows
+    if os.name == "nt" or not isinstance(manifest.files, LazyMapping):
+        return None
+    store = manifest.files.store
+    if not store.is_open or not store.is_current(path):
+        return None
+    return store
+
+
+def compact_partial_parse_file(path: str) -> None:
+    """Rewrite the partial parsing file at 'path' without its garbage. This
+    only copies bytes, entries aren't deserialized."""
+    store = PartialParseFile(path)
+    try:
+        _rewrite_partial_parse_file(store.build_manifest(), path)
+    finally:
+        store.close()
+
+
+def write_partial_parse_file(manifest: Manifest, path: str) -> None:
+    # serialization won't work with anything except an empty source_patches
+    manifest.source_patches = {}
+    store = _appendable_store(manifest, path)
+    if store is None:
+        _rewrite_partial_parse_file(manifest, path)
+        return
+
+    size, garbage = _append_partial_parse_file(manifest, store)
+    if garbage > size * PARTIAL_PARSE_COMPACTION_RATIO:
+        fire_event(
+            Note(msg=f"Compacting partial parsing file ({garbage} of {size} bytes unused)"),
+            level=EventLevel.DEBUG,
+        )
+        compact_partial_parse_file(path)
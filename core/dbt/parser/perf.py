@@ -0,0 +1,178 @@
+import functools
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, TypeVar
+
+from dbt.dataclass_schema import dbtClassMixin
+
+
+# The phases of parsing a file that are timed separately. Each one is recorded
+# in the '<phase>_elapsed' field of FileParseInfo.
+READ = "read"
+YAML_LOAD = "yaml_load"
+RENDER = "render"
+STATIC_PARSE = "static_parse"
+PATCH = "patch"
+CONFIG = "config"
+
+PARSE_PHASES = (READ, YAML_LOAD, RENDER, STATIC_PARSE, PATCH, CONFIG)
+
+
+# Part of saved performance info
+@dataclass
+class FileParseInfo(dbtClassMixin):
+    file_id: str
+    parse_file_type: Optional[str] = None
+    elapsed: float = 0.0
+    read_elapsed: float = 0.0
+    yaml_load_elapsed: float = 0.0
+    render_elapsed: float = 0.0
+    static_parse_elapsed: float = 0.0
+    patch_elapsed: float = 0.0
+    config_elapsed: float = 0.0
+
+    def add(self, other: "FileParseInfo") -> None:
+        if other.parse_file_type and not self.parse_file_type:
+            self.parse_file_type = other.parse_file_type
+        self.elapsed += other.elapsed
+        for phase in PARSE_PHASES:
+            field_name = f"{phase}_elapsed"
+            setattr(self, field_name, getattr(self, field_name) + getattr(other, field_name))
+
+
+class ParseTimer:
+    """Collects the time spent parsing each file, split by phase.
+
+    Phases are exclusive: when a phase starts inside another one (config
+    rendering while patching a node, say), the time is only counted for the
+    inner phase. Phases are recorded against the file being parsed with
+    'time_file', or against an explicit file_id when they happen outside of
+    it (reading and loading yaml happen before any file is parsed). In the
+    latter case the time is also added to the file's total elapsed time.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, FileParseInfo] = {}
+        self._file_stack: List[FileParseInfo] = []
+        # [info, field name, start of the current slice] for each running phase
+        self._phase_stack: List[List[Any]] = []
+
+    def get_info(self, file_id: str, parse_file_type: Optional[str] = None) -> FileParseInfo:
+        info = self.files.get(file_id)
+        if info is None:
+            info = FileParseInfo(file_id=file_id, parse_file_type=parse_file_type)
+            self.files[file_id] = info
+        elif parse_file_type and not info.parse_file_type:
+            info.parse_file_type = parse_file_type
+        return info
+
+    def record(self, info: FileParseInfo) -> None:
+        # add timings collected elsewhere, i.e. in a worker process
+        self.get_info(info.file_id).add(info)
+
+    def slowest(self, count: Optional[int] = None) -> List[FileParseInfo]:
+        files = sorted(self.files.values(), key=lambda info: info.elapsed, reverse=True)
+        return files if count is None else files[:count]
+
+    @contextmanager
+    def time_file(
+        self, file_id: str, parse_file_type: Optional[str] = None
+    ) -> Iterator[FileParseInfo]:
+        info = self.get_info(file_id, parse_file_type)
+        self._file_stack.append(info)
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            info.elapsed += time.perf_counter() - start
+            self._file_stack.pop()
+
+    @contextmanager
+    def time_phase(
+        self, phase: str, file_id: Optional[str] = None, parse_file_type: Optional[str] = None
+    ) -> Iterator[None]:
+        if phase not in PARSE_PHASES:
+            raise ValueError(f"Unknown parse phase: {phase}")
+        if file_id is not None:
+            info = self.get_info(file_id, parse_file_type)
+        elif self._file_stack:
+            info = self._file_stack[-1]
+        else:
+            # nothing to attribute the time to
+            yield
+            return
+
+        start = time.perf_counter()
+        outermost = not self._phase_stack
+        if not outermost:
+            self._pause(self._phase_stack[-1], start)
+        entry = [info, f"{phase}_elapsed", start]
+        self._phase_stack.append(entry)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._pause(self._phase_stack.pop(), end)
+            if self._phase_stack:
+                # resume the outer phase
+                self._phase_stack[-1][2] = end
+            if outermost and not any(f is info for f in self._file_stack):
+                info.elapsed += end - start
+
+    def _pause(self, entry: List[Any], now: float) -> None:
+        info, field_name, slice_start = entry
+        setattr(info, field_name, getattr(info, field_name) + now - slice_start)
+
+
+# The timer in use while loading the manifest, if per-file timing is enabled
+_timer: Optional[ParseTimer] = None
+
+_NOT_TIMED: ContextManager = nullcontext()
+
+
+def get_parse_timer() -> Optional[ParseTimer]:
+    return _timer
+
+
+@contextmanager
+def parse_timing() -> Iterator[ParseTimer]:
+    """Enable per-file timing for the duration of the block"""
+    global _timer
+    saved = _timer
+    _timer = ParseTimer()
+    try:
+        yield _timer
+    finally:
+        _timer = saved
+
+
+def time_file(file_id: str, parse_file_type: Optional[str] = None) -> ContextManager:
+    if _timer is None:
+        return _NOT_TIMED
+    return _timer.time_file(file_id, parse_file_type)
+
+
+def time_phase(
+    phase: str, file_id: Optional[str] = None, parse_file_type: Optional[str] = None
+) -> ContextManager:
+    if _timer is None:
+        return _NOT_TIMED
+    return _timer.time_phase(phase, file_id, parse_file_type)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def timed_phase(phase: str) -> Callable[[F], F]:
+    """Decorator to time a parser method as 'phase' of the current file"""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with time_phase(phase):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -15,6 +15,7 @@ from dbt.config import Project
 from dbt.dataclass_schema import dbtClassMixin
 from dbt.parser.schemas import yaml_from_file, schema_file_keys
 from dbt.exceptions import ParsingError
+from dbt.parser.perf import READ, time_phase
 from dbt.parser.search import filesystem_search
 from typing import Optional, Dict, List, Mapping, MutableMapping
 from dbt.events.types import InputFileDiffError
@@ -135,8 +136,10 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files, ig
     # file block list
     fb_list = []
     for fp in fp_list:
+        file_id = f"{project.project_name}://{fp.original_file_path}"
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
+            with time_phase(READ, file_id, parse_file_type):
+                fb_list.append(load_seed_source_file(fp, project.project_name))
         # singular tests live in /tests but only generic tests live
         # in /tests/generic so we want to skip those
         else:
@@ -144,7 +147,8 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files, ig
                 path = pathlib.Path(fp.relative_path)
                 if path.parts[0] == "generic":
                     continue
-            file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
+            with time_phase(READ, file_id, parse_file_type):
+                file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
             # only append the list if it has contents. added to fix #3568
             if file:
                 fb_list.append(file)
@@ -5,6 +5,7 @@ import os
 from typing import List, Dict, Optional, Union, Any
 from dbt.parser.base import SimpleParser
 from dbt.parser.generic_test_builders import TestBuilder
+from dbt.parser.perf import RENDER, time_phase, timed_phase
 from dbt.parser.search import FileBlock
 from dbt.context.providers import RefArgs, generate_test_context
 from dbt.parser.common import (
@@ -295,12 +296,13 @@ class SchemaGenericTestParser(SimpleParser):
                     config,
                     self.macro_resolver,
                 )
-                # update with rendered test kwargs (which collects any refs)
-                # Note: This does not actually update the kwargs with the rendered
-                # values. That happens in compilation.
-                add_rendered_test_kwargs(context, node, capture_macros=True)
-                # the parsed node is not rendered in the native context.
-                get_rendered(node.raw_code, context, node, capture_macros=True)
+                with time_phase(RENDER):
+                    # update with rendered test kwargs (which collects any refs)
+                    # Note: This does not actually update the kwargs with the rendered
+                    # values. That happens in compilation.
+                    add_rendered_test_kwargs(context, node, capture_macros=True)
+                    # the parsed node is not rendered in the native context.
+                    get_rendered(node.raw_code, context, node, capture_macros=True)
                 self.update_parsed_node_config(node, config)
                 # env_vars should have been updated in the context env_var method
             except ValidationError as exc:
@@ -337,6 +339,7 @@ class SchemaGenericTestParser(SimpleParser):
         else:
             self.manifest.add_disabled(block.file, node, test_from)
 
+    @timed_phase(RENDER)
     def render_with_context(
         self,
         node: GenericTestNode,
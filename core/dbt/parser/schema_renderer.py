@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Any, Mapping
 
 from dbt.config.renderer import BaseRenderer, Keypath
 
@@ -12,7 +12,7 @@ from dbt.config.renderer import BaseRenderer, Keypath
 # Keyword args are finally rendered at compilation time.
 # Descriptions are not rendered until 'process_docs'.
 class SchemaYamlRenderer(BaseRenderer):
-    def __init__(self, context: Dict[str, Any], key: str) -> None:
+    def __init__(self, context: Mapping[str, Any], key: str) -> None:
         super().__init__(context)
         self.key = key
 
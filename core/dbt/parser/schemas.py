@@ -54,6 +54,7 @@ from dbt.events.types import (
 )
 from dbt.node_types import NodeType, AccessType
 from dbt.parser.base import SimpleParser
+from dbt.parser.perf import PATCH, YAML_LOAD, time_phase
 from dbt.parser.search import FileBlock
 from dbt.parser.common import (
     YamlBlock,
@@ -113,7 +114,8 @@ def yaml_from_file(source_file: SchemaSourceFile) -> Dict[str, Any]:
     """If loading the yaml fails, raise an exception."""
     try:
         # source_file.contents can sometimes be None
-        return load_yaml_text(source_file.contents or "", source_file.path)
+        with time_phase(YAML_LOAD, source_file.file_id):
+            return load_yaml_text(source_file.contents or "", source_file.path)
     except DbtValidationError as e:
         raise YamlLoadError(
             project_name=source_file.project_name, path=source_file.path.relative_path, exc=e
@@ -439,7 +441,8 @@ class PatchParser(YamlReader, Generic[NonSourceTarget, Parsed]):
                 refs = ParserRef()
 
             # There's no unique_id on the node yet so cannot add to disabled dict
-            self.parse_patch(node_block, refs)
+            with time_phase(PATCH):
+                self.parse_patch(node_block, refs)
 
         return ParseResult(test_blocks, versioned_test_blocks)
 
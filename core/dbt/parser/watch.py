@@ -0,0 +1,180 @@
+"""Support for 'dbt parse --watch'
+
+The manifest stays in memory between parses. The watcher polls the root
+project's resource paths, and when files have been added, deleted or their
+contents have changed, it builds a FileDiff that is passed to the
+ManifestLoader along with the resident manifest. Partial parsing then only
+reparses the changed files, without re-reading and re-hashing every file in
+the project or reading partial_parse.msgpack.
+"""
+import datetime
+import os
+import time
+from dataclasses import fields
+from typing import Dict, List, Mapping, Optional
+
+from dbt.clients.system import load_file_contents
+from dbt.config import RuntimeConfig
+from dbt.contracts.files import AnySourceFile, FileHash
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.base_types import EventLevel
+from dbt.events.functions import fire_event
+from dbt.events.types import Note
+from dbt.flags import get_flags
+from dbt.parser.manifest import ManifestLoader, write_manifest
+from dbt.parser.partial_store import saved_file_summary
+from dbt.parser.read_files import (
+    FileDiff,
+    InputFile,
+    generate_dbt_ignore_spec,
+    get_file_types_for_project,
+)
+from dbt.parser.search import filesystem_search
+
+
+class ProjectFileWatcher:
+    """Finds the files in a project that have changed since the last poll.
+
+    Files are found the same way ReadFilesFromFileSystem finds them. Only
+    files whose modification time has changed are read, and they are only
+    reported as changed if their contents no longer match the checksum in
+    the manifest.
+    """
+
+    def __init__(self, config: RuntimeConfig) -> None:
+        self.config = config
+        self.file_types = get_file_types_for_project(config)
+        self.ignore_spec = generate_dbt_ignore_spec(config.project_root)
+        # project relative path -> modification time
+        self.mtimes: Dict[str, float] = self.scan()
+
+    def scan(self) -> Dict[str, float]:
+        mtimes: Dict[str, float] = {}
+        for file_type_info in self.file_types.values():
+            for extension in file_type_info["extensions"]:
+                for file_path in filesystem_search(
+                    self.config, file_type_info["paths"], extension, self.ignore_spec
+                ):
+                    mtimes[file_path.original_file_path] = file_path.modification_time
+        return mtimes
+
+    def file_id(self, path: str) -> str:
+        return f"{self.config.project_name}://{path}"
+
+    def read_input_file(self, path: str) -> InputFile:
+        # contents are stripped before hashing, as they are for a full read
+        content = load_file_contents(os.path.join(self.config.project_root, path), strip=True)
+        return InputFile(path=path, content=content, modification_time=self.mtimes[path])
+
+    def poll(self, files: Optional[Mapping[str, AnySourceFile]]) -> Optional[FileDiff]:
+        """Return the changes since the last poll, relative to the manifest
+        'files', or None if nothing has changed. Without 'files', every file
+        that was touched is reported."""
+        previous_mtimes, self.mtimes = self.mtimes, self.scan()
+
+        changed: List[InputFile] = []
+        added: List[InputFile] = []
+        for path, mtime in list(self.mtimes.items()):
+            if previous_mtimes.get(path) == mtime:
+                continue
+            try:
+                input_file = self.read_input_file(path)
+            except FileNotFoundError:
+                # deleted since the scan
+                del self.mtimes[path]
+                continue
+            file_id = self.file_id(path)
+            if files is None or file_id not in files:
+                # includes files that exist but weren't parsed, like empty yaml files
+                added.append(input_file)
+            elif saved_file_summary(files, file_id).checksum != FileHash.from_contents(
+                input_file.content
+            ):
+                changed.append(input_file)
+
+        deleted: List[str] = [
+            path
+            for path in previous_mtimes
+            if path not in self.mtimes and (files is None or self.file_id(path) in files)
+        ]
+        if not (deleted or changed or added):
+            return None
+        return FileDiff(deleted=deleted, changed=changed, added=added)
+
+
+def _resident_manifest(manifest: Manifest) -> Manifest:
+    # The lookups and maps built for the last parse are out of date once
+    # partial parsing changes the manifest, so only keep the contents. This
+    # is the same state a manifest read from partial_parse.msgpack is in.
+    manifest.metadata.generated_at = datetime.datetime.utcnow()
+    resident = Manifest(
+        **{
+            f.name: getattr(manifest, f.name)
+            for f in fields(Manifest)
+            if not f.name.startswith("_")
+        }
+    )
+    resident._macro_calls = manifest._macro_calls
+    return resident
+
+
+def _load_manifest(
+    config: RuntimeConfig,
+    saved_manifest: Optional[Manifest] = None,
+    file_diff: Optional[FileDiff] = None,
+) -> Manifest:
+    manifest = ManifestLoader.get_full_manifest(
+        config,
+        file_diff=file_diff,
+        saved_manifest=saved_manifest,
+        reset=True,
+        write_perf_info=True,
+    )
+    if get_flags().write_json:
+        write_manifest(manifest, config.project_target_path)
+    return manifest
+
+
+def watch_project(config: RuntimeConfig, manifest: Manifest, interval: float) -> Manifest:
+    """Reparse the project whenever its files change, until interrupted.
+    Returns the manifest of the project when it was interrupted."""
+    watcher = ProjectFileWatcher(config)
+    # Partial parsing modifies the resident manifest, which shares its nodes,
+    # files, etc. with the last manifest that was returned by a parse. After
+    # a failed parse neither can be used again, and the next parse starts
+    # from scratch.
+    resident: Optional[Manifest] = manifest
+    fire_event(Note(msg=f"Watching {config.project_root} for changes. Press Ctrl-C to stop."))
+    try:
+        while True:
+            time.sleep(interval)
+            file_diff = watcher.poll(resident.files if resident is not None else None)
+            if file_diff is None:
+                continue
+
+            fire_event(
+                Note(
+                    msg=f"Detected {len(file_diff.added)} added, {len(file_diff.changed)} "
+                    f"changed and {len(file_diff.deleted)} deleted files"
+                ),
+                level=EventLevel.DEBUG,
+            )
+            start = time.perf_counter()
+            try:
+                if resident is not None and get_flags().PARTIAL_PARSE:
+                    resident = _load_manifest(config, _resident_manifest(resident), file_diff)
+                else:
+                    resident = _load_manifest(config)
+            except Exception as exc:
+                resident = None
+                fire_event(Note(msg=f"Encountered an error while parsing:\n{exc}"))
+                continue
+            manifest = resident
+            fire_event(Note(msg=f"Parsed project in {time.perf_counter() - start:.2f}s"))
+    except KeyboardInterrupt:
+        pass
+    if resident is None:
+        # the last parse failed, and may have left 'manifest' half modified
+        fire_event(Note(msg="Parsing the project again, since the last parse failed"))
+        manifest = _load_manifest(config)
+    return manifest
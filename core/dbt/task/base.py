@@ -48,6 +48,7 @@ from dbt.flags import get_flags
 from dbt.graph import Graph
 from dbt.logger import log_manager
 from dbt.task.printer import print_run_result_error
+from dbt.tracing import span
 
 
 class NoneConfig:
@@ -305,7 +306,9 @@ class BaseRunner(metaclass=ABCMeta):
                     node_info=ctx.node.node_info,
                 )
             )
-            with collect_timing_info("compile", ctx.timing.append):
+            with collect_timing_info("compile", ctx.timing.append), span(
+                "compile", "node", unique_id=self.node.unique_id
+            ):
                 # if we fail here, we still have a compiled node to return
                 # this has the benefit of showing a build path for the errant
                 # model
@@ -319,7 +322,9 @@ class BaseRunner(metaclass=ABCMeta):
                         node_info=ctx.node.node_info,
                     )
                 )
-                with collect_timing_info("execute", ctx.timing.append):
+                with collect_timing_info("execute", ctx.timing.append), span(
+                    "execute", "node", unique_id=self.node.unique_id
+                ):
                     result = self.run(ctx.node, manifest)
                     ctx.node = result.node
 
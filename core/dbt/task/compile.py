@@ -1,6 +1,8 @@
+import os
 import threading
 from typing import AbstractSet, Optional
 
+from dbt.constants import COMPILE_CACHE_FILE_NAME
 from dbt.contracts.graph.manifest import WritableManifest
 from dbt.contracts.results import RunStatus, RunResult
 from dbt.events.base_types import EventLevel
@@ -11,6 +13,7 @@ from dbt.exceptions import (
     DbtInternalError,
     Exception as DbtException,
 )
+from dbt.flags import get_flags
 
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import NodeType
@@ -121,6 +124,58 @@ class CompileTask(GraphRunnableTask):
         # TODO: is it wrong to write the manifest here? I think it's right...
         write_manifest(self.manifest, self.config.project_target_path)
 
+    # The number of worker processes to use for rendering the selected nodes.
+    # 1 means that nodes are rendered by the runners, in this process.
+    def get_compile_workers(self) -> int:
+        from dbt.compilation import parallel_compile_supported
+
+        compile_workers = getattr(self.args, "compile_workers", None) or 1
+        if compile_workers > 1 and not parallel_compile_supported():
+            fire_event(
+                Note(msg="Parallel compilation is not supported on this platform"),
+                level=EventLevel.DEBUG,
+            )
+            return 1
+        return compile_workers
+
+    def before_run(self, adapter, selected_uids: AbstractSet[str]):
+        from dbt.compilation import (
+            MIN_NODES_FOR_PARALLEL_COMPILE,
+            nodes_to_render,
+            render_nodes_in_parallel,
+        )
+
+        super().before_run(adapter, selected_uids)
+        # Rendering is CPU bound, so the compile threads barely run in
+        # parallel. Render the nodes in worker processes up front, and the
+        # runners only inject the ctes and write the compiled files.
+        compile_workers = self.get_compile_workers()
+        if compile_workers > 1 and self.manifest is not None:
+            unique_ids = nodes_to_render(self.manifest, sorted(selected_uids))
+            if len(unique_ids) >= MIN_NODES_FOR_PARALLEL_COMPILE:
+                render_nodes_in_parallel(
+                    adapter.get_compiler(), self.manifest, unique_ids, compile_workers
+                )
+
+    def execute_with_hooks(self, selected_uids: AbstractSet[str]):
+        from dbt.compilation import CompiledCodeCache
+
+        compiled_code_cache = None
+        if self.manifest is not None and getattr(get_flags(), "COMPILE_CACHE", False):
+            compiled_code_cache = CompiledCodeCache.load(
+                os.path.join(self.config.project_target_path, COMPILE_CACHE_FILE_NAME)
+            )
+            self.manifest._compiled_code_cache = compiled_code_cache
+        try:
+            return super().execute_with_hooks(selected_uids)
+        finally:
+            if self.manifest is not None:
+                # don't leave renders behind for nodes that weren't compiled
+                self.manifest._rendered_nodes.clear()
+                self.manifest._compiled_code_cache = None
+                if compiled_code_cache is not None:
+                    compiled_code_cache.write(self.manifest)
+
     def _runtime_initialize(self):
         if getattr(self.args, "inline", None):
             try:
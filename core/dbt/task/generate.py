@@ -1,7 +1,8 @@
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
+from itertools import chain
+from typing import AbstractSet, Dict, Iterable, List, Any, Optional, Tuple, Set, Union
 import agate
 
 from dbt.dataclass_schema import ValidationError
@@ -9,6 +10,7 @@ from dbt.clients.system import load_file_contents
 
 from .compile import CompileTask
 
+from dbt.adapters.base.impl import AdapterFeature
 from dbt.adapters.factory import get_adapter
 from dbt.contracts.graph.nodes import ResultNode
 from dbt.contracts.graph.manifest import Manifest
@@ -23,8 +25,9 @@ from dbt.contracts.results import (
     StatsDict,
     ColumnMetadata,
     CatalogArtifact,
+    RunResultsArtifact,
 )
-from dbt.exceptions import DbtInternalError, AmbiguousCatalogMatchError
+from dbt.exceptions import DbtInternalError, DbtRuntimeError, AmbiguousCatalogMatchError
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import NodeType
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
@@ -34,8 +37,10 @@ from dbt.events.types import (
     CatalogWritten,
     CannotGenerateDocs,
     BuildingCatalog,
+    Note,
 )
 from dbt.parser.manifest import write_manifest
+from dbt.task.runnable import RESULT_FILE_NAME
 import dbt.utils
 import dbt.compilation
 import dbt.exceptions
@@ -45,6 +50,9 @@ from dbt.constants import (
 
 CATALOG_FILENAME = "catalog.json"
 
+# The commands whose results in run_results.json can change relations
+BUILD_COMMANDS = ("build", "clone", "run", "seed", "snapshot", "test")
+
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
     """Go through the source, extracting every key/value pair where the key starts
@@ -73,7 +81,7 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         for col in columns:
             self.add_column(col)
 
-    def get_table(self, data: PrimitiveDict) -> CatalogTable:
+    def get_key(self, data: PrimitiveDict) -> CatalogKey:
         database = data.get("table_database")
         if database is None:
             dkey: Optional[str] = None
@@ -81,7 +89,7 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             dkey = str(database)
 
         try:
-            key = CatalogKey(
+            return CatalogKey(
                 dkey,
                 str(data["table_schema"]),
                 str(data["table_name"]),
@@ -90,6 +98,11 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
             raise dbt.exceptions.CompilationError(
                 "Catalog information missing required key {} (got {})".format(exc, data)
             )
+
+    def get_table(self, data: PrimitiveDict) -> CatalogTable:
+        return self._get_table(self.get_key(data), data)
+
+    def _get_table(self, key: CatalogKey, data: PrimitiveDict) -> CatalogTable:
         table: CatalogTable
         if key in self:
             table = self[key]
@@ -99,7 +112,10 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         return table
 
     def add_column(self, data: PrimitiveDict):
-        table = self.get_table(data)
+        self._add_column(self.get_key(data), data)
+
+    def _add_column(self, key: CatalogKey, data: PrimitiveDict) -> None:
+        table = self._get_table(key, data)
         column_data = get_stripped_prefix(data, "column_")
         # the index should really never be that big so it's ok to end up
         # serializing this to JSON (2^53 is the max safe value there)
@@ -108,6 +124,20 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         column = ColumnMetadata.from_dict(column_data)
         table.columns[column.name] = column
 
+    def add_rows(self, catalog_table: agate.Table) -> List[CatalogTable]:
+        """Add the columns in the results of a catalog query, and return the
+        tables that weren't in the catalog before.
+        """
+        new_tables: List[CatalogTable] = []
+        column_names = catalog_table.column_names
+        for row in catalog_table:
+            data = dict(zip(column_names, map(dbt.utils._coerce_decimal, row)))
+            key = self.get_key(data)
+            if key not in self:
+                new_tables.append(self._get_table(key, data))
+            self._add_column(key, data)
+        return new_tables
+
     def make_unique_id_map(
         self, manifest: Manifest
     ) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
@@ -115,26 +145,75 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
         sources: Dict[str, CatalogTable] = {}
 
         node_map, source_map = get_unique_id_mapping(manifest)
-        table: CatalogTable
-        for table in self.values():
-            key = table.key()
-            if key in node_map:
-                unique_id = node_map[key]
-                nodes[unique_id] = table.replace(unique_id=unique_id)
-
-            unique_ids = source_map.get(table.key(), set())
-            for unique_id in unique_ids:
-                if unique_id in sources:
-                    raise AmbiguousCatalogMatchError(
-                        unique_id,
-                        sources[unique_id].to_dict(omit_none=True),
-                        table.to_dict(omit_none=True),
-                    )
-                else:
-                    sources[unique_id] = table.replace(unique_id=unique_id)
+        add_unique_ids(self.values(), node_map, source_map, nodes, sources)
         return nodes, sources
 
 
+def add_unique_ids(
+    tables: Iterable[CatalogTable],
+    node_map: Dict[CatalogKey, str],
+    source_map: Dict[CatalogKey, Set[str]],
+    nodes: Dict[str, CatalogTable],
+    sources: Dict[str, CatalogTable],
+) -> None:
+    """Add each table to 'nodes' and 'sources' under the unique_ids of the
+    nodes and sources it's the relation of.
+    """
+    table: CatalogTable
+    for table in tables:
+        key = table.key()
+        if key in node_map:
+            unique_id = node_map[key]
+            nodes[unique_id] = table.replace(unique_id=unique_id)
+
+        unique_ids = source_map.get(key, set())
+        for unique_id in unique_ids:
+            if unique_id in sources:
+                raise AmbiguousCatalogMatchError(
+                    unique_id,
+                    sources[unique_id].to_dict(omit_none=True),
+                    table.to_dict(omit_none=True),
+                )
+            else:
+                sources[unique_id] = table.replace(unique_id=unique_id)
+
+
+class CatalogBuilder:
+    """Builds the catalog's nodes and sources from the results of each
+    catalog query as it completes, so that the results don't have to be
+    merged and kept until all the queries are done.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.catalog = Catalog([])
+        self.node_map, self.source_map = get_unique_id_mapping(manifest)
+        self.nodes: Dict[str, CatalogTable] = {}
+        self.sources: Dict[str, CatalogTable] = {}
+
+    def add(self, catalog_table: agate.Table) -> None:
+        # Tables that get more columns from later results share their columns
+        # with the ones already mapped, so only new tables need to be mapped
+        new_tables = self.catalog.add_rows(catalog_table)
+        add_unique_ids(new_tables, self.node_map, self.source_map, self.nodes, self.sources)
+
+    def add_previous(self, previous: CatalogResults, refreshed: Set[CatalogKey]) -> None:
+        """Add the tables from a previous catalog, other than the refreshed
+        ones and the ones already in the catalog. Tables whose nodes and
+        sources are gone are left out by the mapping.
+        """
+        seen = refreshed | {table.key() for table in self.catalog.values()}
+        tables: List[CatalogTable] = []
+        for table in chain(previous.nodes.values(), previous.sources.values()):
+            key = table.key()
+            if key in seen:
+                continue
+            seen.add(key)
+            table = table.replace(unique_id=None)
+            self.catalog[key] = table
+            tables.append(table)
+        add_unique_ids(tables, self.node_map, self.source_map, self.nodes, self.sources)
+
+
 def format_stats(stats: PrimitiveDict) -> StatsDict:
     """Given a dictionary following this layout:
 
@@ -206,6 +285,11 @@ def get_unique_id_mapping(
 
 class GenerateTask(CompileTask):
     def run(self) -> CatalogArtifact:
+        # run_results.json is overwritten when compiling, so it's read first
+        previous: Optional[Tuple[CatalogArtifact, Set[str]]] = None
+        if getattr(self.args, "INCREMENTAL_CATALOG", False) and not self.args.empty_catalog:
+            previous = self.read_previous_catalog()
+
         compile_results = None
         if self.args.compile:
             compile_results = CompileTask.run(self)
@@ -240,28 +324,50 @@ class GenerateTask(CompileTask):
         if self.manifest is None:
             raise DbtInternalError("self.manifest was None in run!")
 
-        if self.args.empty_catalog:
-            catalog_table: agate.Table = agate.Table([])
-            exceptions: List[Exception] = []
-        else:
+        builder = CatalogBuilder(self.manifest)
+        exceptions: List[Exception] = []
+        if not self.args.empty_catalog:
+            refreshed: Set[str] = set()
+            if previous is not None:
+                refreshed = self.get_refreshed_relations(previous[0], previous[1], selected_nodes)
+                fire_event(Note(msg=f"Refreshing {len(refreshed)} relations in the catalog"))
+
             adapter = get_adapter(self.config)
             with adapter.connection_named("generate_catalog"):
                 fire_event(BuildingCatalog())
-                # This generates the catalog as an agate.Table
-                catalog_table, exceptions = adapter.get_catalog(self.manifest, selected_nodes)
-
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
+                catalog_results: Iterable[Union[agate.Table, Exception]] = []
+                if previous is None:
+                    catalog_results = adapter.iter_catalog(self.manifest, selected_nodes)
+                elif refreshed:
+                    catalog_results = adapter.iter_catalog(
+                        self.manifest, refreshed, by_relations=True
+                    )
+                # Add the results of each catalog query as it completes
+                for result in catalog_results:
+                    if isinstance(result, Exception):
+                        exceptions.append(result)
+                    else:
+                        builder.add(result)
+
+            if previous is not None:
+                # Refreshed relations that weren't found were dropped, unless
+                # a query failed, in which case their previous tables are kept
+                manifest = self.manifest
+                refreshed_keys: Set[CatalogKey] = set()
+                if not exceptions:
+                    refreshed_keys = {
+                        mapping_key(manifest.nodes[unique_id])
+                        if unique_id in manifest.nodes
+                        else mapping_key(manifest.sources[unique_id])
+                        for unique_id in refreshed
+                    }
+                builder.add_previous(previous[0], refreshed_keys)
 
         errors: Optional[List[str]] = None
         if exceptions:
             errors = [str(e) for e in exceptions]
 
-        nodes, sources = catalog.make_unique_id_map(self.manifest)
+        nodes, sources = builder.nodes, builder.sources
         results = self.get_catalog_results(
             nodes=nodes,
             sources=sources,
@@ -298,6 +404,73 @@ class GenerateTask(CompileTask):
         fire_event(CatalogWritten(path=os.path.abspath(catalog_path)))
         return results
 
+    def read_previous_catalog(self) -> Optional[Tuple[CatalogArtifact, Set[str]]]:
+        """Read the previous catalog and the unique_ids of the nodes built by
+        the command in run_results.json, to update the catalog with only those.
+        Returns None if the whole catalog has to be generated.
+        """
+        adapter = get_adapter(self.config)
+        if not adapter.has_feature(AdapterFeature.CatalogByRelations):
+            fire_event(
+                Note(
+                    msg=f"The {adapter.type()} adapter can't get the catalog of specific "
+                    "relations, so the whole catalog will be generated"
+                )
+            )
+            return None
+
+        target_path = self.config.project_target_path
+        try:
+            previous_catalog = CatalogArtifact.read_and_check_versions(
+                os.path.join(target_path, CATALOG_FILENAME)
+            )
+            run_results = RunResultsArtifact.read_and_check_versions(
+                os.path.join(target_path, RESULT_FILE_NAME)
+            )
+        except (DbtRuntimeError, ValidationError) as exc:
+            fire_event(
+                Note(
+                    msg=f"Could not read the previous catalog, generating the whole catalog: {exc}"
+                )
+            )
+            return None
+
+        built: Set[str] = set()
+        if run_results.args.get("which") in BUILD_COMMANDS:
+            built = {
+                result.unique_id
+                for result in run_results.results
+                if result.status != NodeStatus.Skipped
+            }
+        return previous_catalog, built
+
+    def get_refreshed_relations(
+        self,
+        previous_catalog: CatalogArtifact,
+        built: Set[str],
+        selected_nodes: Optional[AbstractSet[str]],
+    ) -> Set[str]:
+        """The selected nodes and sources with relations that were built since
+        the previous catalog, or aren't in it.
+        """
+        if self.manifest is None:
+            raise DbtInternalError("manifest was None in get_refreshed_relations")
+        manifest = self.manifest
+        cataloged = previous_catalog.nodes.keys() | previous_catalog.sources.keys()
+
+        def has_relation(unique_id: str) -> bool:
+            if unique_id in manifest.nodes:
+                node = manifest.nodes[unique_id]
+                return node.is_relational and not node.is_ephemeral_model
+            return unique_id in manifest.sources
+
+        candidates: Iterable[str] = selected_nodes or chain(manifest.nodes, manifest.sources)
+        return {
+            unique_id
+            for unique_id in candidates
+            if (unique_id in built or unique_id not in cataloged) and has_relation(unique_id)
+        }
+
     def get_node_selector(self) -> ResourceTypeSelector:
         if self.manifest is None or self.graph is None:
             raise DbtInternalError("manifest and graph must be set to perform node selection")
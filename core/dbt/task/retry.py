@@ -113,10 +113,14 @@ class RetryTask(ConfiguredTask):
         class TaskWrapper(self.task_class):
             def get_graph_queue(self):
                 new_graph = self.graph.get_subset_graph(unique_ids)
+                concurrency_limits = self.get_node_selector().get_concurrency_limits(
+                    unique_ids, getattr(self.args, "CONCURRENCY_LIMITS", None) or {}
+                )
                 return GraphQueue(
                     new_graph.graph,
                     self.manifest,
                     unique_ids,
+                    concurrency_limits=concurrency_limits,
                 )
 
         task = TaskWrapper(
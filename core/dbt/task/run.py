@@ -18,7 +18,7 @@ from dbt.adapters.base import BaseRelation
 from dbt.clients.jinja import MacroGenerator
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.model_config import Hook
-from dbt.contracts.graph.nodes import HookNode, ResultNode
+from dbt.contracts.graph.nodes import HookNode, ResultNode, SeedNode
 from dbt.contracts.results import NodeStatus, RunResult, RunStatus, RunningStatus, BaseResult
 from dbt.exceptions import (
     CompilationError,
@@ -50,6 +50,8 @@ from dbt.graph import ResourceTypeSelector
 from dbt.hooks import get_hook_dict
 from dbt.node_types import NodeType, RunHookType
 
+from .seed_state import SeedLoads
+
 
 class Timer:
     def __init__(self) -> None:
@@ -305,6 +307,8 @@ class RunTask(CompileTask):
         super().__init__(args, config, manifest)
         self.ran_hooks: List[HookNode] = []
         self._total_executed = 0
+        self.seed_loads: Optional[SeedLoads] = None
+        self._unchanged_seeds: Set[str] = set()
 
     def index_offset(self, value: int) -> int:
         return self._total_executed + value
@@ -447,8 +451,36 @@ class RunTask(CompileTask):
             self.populate_adapter_cache(adapter, required_schemas)
             self.defer_to_manifest(adapter, selected_uids)
             self.safe_run_hooks(adapter, RunHookType.Start, {})
+            self.find_unchanged_seeds(adapter, selected_uids)
+
+    def find_unchanged_seeds(self, adapter, selected_uids: AbstractSet[str]) -> None:
+        if self.manifest is None:
+            raise DbtInternalError("manifest was None in find_unchanged_seeds")
+        seeds = [
+            node
+            for node in self.manifest.nodes.values()
+            if node.unique_id in selected_uids and isinstance(node, SeedNode)
+        ]
+        if not seeds:
+            return
+        self.seed_loads = SeedLoads.from_config(self.config)
+        self._unchanged_seeds = self.seed_loads.start(
+            adapter,
+            seeds,
+            skip_unchanged=getattr(self.args, "SKIP_UNCHANGED_SEEDS", False),
+            full_refresh=getattr(self.args, "FULL_REFRESH", False),
+        )
+
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        if node.unique_id in self._unchanged_seeds:
+            runner.unchanged = True
+        return runner
 
     def after_run(self, adapter, results) -> None:
+        if self.seed_loads is not None:
+            self.seed_loads.finish(results)
+
         # in on-run-end hooks, provide the value 'database_schemas', which is a
         # list of unique (database, schema) pairs that successfully executed
         # models were in. For backwards compatibility, include the old
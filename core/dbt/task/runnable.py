@@ -55,6 +55,7 @@ from dbt.logger import (
 )
 from dbt.parser.manifest import write_manifest
 from dbt.task.base import ConfiguredTask, BaseRunner
+from dbt.tracing import traced
 from .printer import (
     print_run_result_error,
     print_run_end_messages,
@@ -137,7 +138,11 @@ class GraphRunnableTask(ConfiguredTask):
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(
+            spec,
+            concurrency_limits=getattr(self.args, "CONCURRENCY_LIMITS", None),
+            critical_path=getattr(self.args, "CRITICAL_PATH_SCHEDULING", False),
+        )
 
     def _runtime_initialize(self):
         self.compile_manifest()
@@ -266,8 +271,10 @@ class GraphRunnableTask(ConfiguredTask):
                 raise DbtInternalError("Got to run_queue callback with no job queue set")
             self.job_queue.mark_done(result.node.unique_id)
 
-        while not self.job_queue.empty():
+        while True:
             node = self.job_queue.get()
+            if node is None:
+                break
             self._raise_set_error()
             runner = self.get_runner(node)
             # we finally know what we're running! Make sure we haven't decided
@@ -338,6 +345,7 @@ class GraphRunnableTask(ConfiguredTask):
 
         pool.join()
 
+    @traced("execute nodes", "run")
     def execute_nodes(self):
         num_threads = self.config.threads
         target_name = self.config.target_name
@@ -1,11 +1,12 @@
 import random
+import threading
 
 from .run import ModelRunner, RunTask
 from .printer import (
     print_run_end_messages,
 )
 
-from dbt.contracts.results import RunStatus
+from dbt.contracts.results import RunResult, RunStatus
 from dbt.exceptions import DbtInternalError
 from dbt.graph import ResourceTypeSelector
 from dbt.logger import TextOnly
@@ -22,6 +23,11 @@ from dbt.contracts.results import NodeStatus
 
 
 class SeedRunner(ModelRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes) -> None:
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set when the seed is unchanged since it was last loaded, so it isn't loaded again
+        self.unchanged = False
+
     def describe_node(self):
         return "seed file {}".format(self.get_node_representation())
 
@@ -44,6 +50,22 @@ class SeedRunner(ModelRunner):
     def compile(self, manifest):
         return self.node
 
+    def execute(self, model, manifest):
+        if not self.unchanged:
+            return super().execute(model, manifest)
+        # the seed succeeds without being loaded, so 'dbt retry' and
+        # 'result:skipped' don't select it again
+        return RunResult(
+            node=model,
+            status=RunStatus.Success,
+            timing=[],
+            thread_id=threading.current_thread().name,
+            execution_time=0,
+            message="NO CHANGES",
+            adapter_response={},
+            failures=None,
+        )
+
     def print_result_line(self, result):
         model = result.node
         level = EventLevel.ERROR if result.status == NodeStatus.Error else EventLevel.INFO
@@ -108,5 +130,6 @@ class SeedTask(RunTask):
 
     def show_tables(self, results):
         for result in results:
-            if result.status != RunStatus.Error:
+            # unchanged seeds aren't loaded, so there is no table to show
+            if result.status != RunStatus.Error and result.agate_table is not None:
                 self.show_table(result)
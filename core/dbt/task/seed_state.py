@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import dbt.utils
+from dbt.adapters.base import BaseAdapter
+from dbt.config import RuntimeConfig
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.nodes import SeedNode
+from dbt.contracts.results import NodeStatus, RunResult
+from dbt.contracts.util import Readable, Writable
+from dbt.dataclass_schema import dbtClassMixin, ValidationError
+from dbt.events.base_types import EventLevel
+from dbt.events.functions import fire_event
+from dbt.events.types import Note
+from dbt.exceptions import DbtRuntimeError
+
+SEED_STATE_FILE_NAME = "seed_state.json"
+
+# The size of the reads when hashing a seed that was too large to checksum
+HASH_READ_SIZE = 1024 * 1024
+
+
+@dataclass
+class LoadedSeed(dbtClassMixin):
+    unique_id: str
+    target_name: str
+    checksum: str
+    config_hash: str
+
+
+@dataclass
+class SeedState(dbtClassMixin, Writable, Readable):
+    # The seed last loaded into each relation, by the relation's name
+    relations: Dict[str, LoadedSeed] = field(default_factory=dict)
+
+
+def seed_checksum(node: SeedNode) -> str:
+    """The checksum of the seed's file. Seeds over the size limit are only
+    checksummed by their path when the project is parsed, so they're hashed
+    here, a block at a time.
+    """
+    if node.checksum.name != "path":
+        return f"{node.checksum.name}:{node.checksum.checksum}"
+
+    assert node.root_path
+    hasher = hashlib.sha256()
+    with open(os.path.join(node.root_path, node.original_file_path), "rb") as fp:
+        for data in iter(lambda: fp.read(HASH_READ_SIZE), b""):
+            hasher.update(data)
+    return f"sha256_bytes:{hasher.hexdigest()}"
+
+
+def seed_config_hash(node: SeedNode) -> str:
+    # Any change to the seed's config or columns (column types, quoting,
+    # grants, persisted docs, ...) reloads it
+    data = {
+        "config": node.config.to_dict(omit_none=True),
+        "columns": {name: column.to_dict(omit_none=True) for name, column in node.columns.items()},
+    }
+    return FileHash.from_contents(
+        json.dumps(data, sort_keys=True, cls=dbt.utils.JSONEncoder)
+    ).checksum
+
+
+class SeedLoads:
+    """The seeds that have been loaded into each relation, saved in
+    target/seed_state.json. A seed whose file and config are the same as the
+    ones last loaded into its relation is unchanged, and can be skipped.
+
+    Only loads by dbt seed and dbt build are recorded, so changes made to the
+    tables some other way aren't seen, except when the table was dropped.
+    """
+
+    def __init__(self, path: str, target_name: str) -> None:
+        self.path = path
+        self.target_name = target_name
+        self.state = self._read()
+        # the relation name and entry of each seed being loaded
+        self._loading: Dict[str, Tuple[str, LoadedSeed]] = {}
+
+    @classmethod
+    def from_config(cls, config: RuntimeConfig) -> "SeedLoads":
+        return cls(
+            os.path.join(config.project_target_path, SEED_STATE_FILE_NAME),
+            config.target_name,
+        )
+
+    def _read(self) -> SeedState:
+        if not os.path.exists(self.path):
+            return SeedState()
+        try:
+            return SeedState.read(self.path)
+        except (DbtRuntimeError, ValidationError) as exc:
+            fire_event(
+                Note(msg=f"Could not read the state of loaded seeds, reloading them: {exc}"),
+                level=EventLevel.DEBUG,
+            )
+            return SeedState()
+
+    def start(
+        self,
+        adapter: BaseAdapter,
+        seeds: Iterable[SeedNode],
+        skip_unchanged: bool,
+        full_refresh: bool,
+    ) -> Set[str]:
+        """Find the seeds that are unchanged since they were loaded, if
+        'skip_unchanged' is set, and return their unique_ids. The others will
+        be loaded, so they're removed from the saved state until they've
+        loaded successfully. Must be called with a connection, to look up the
+        relations.
+        """
+        unchanged: Set[str] = set()
+        removed = False
+        for node in seeds:
+            relation = adapter.Relation.create_from(adapter.config, node)
+            name = str(relation)
+            loaded = LoadedSeed(
+                unique_id=node.unique_id,
+                target_name=self.target_name,
+                checksum=seed_checksum(node),
+                config_hash=seed_config_hash(node),
+            )
+            node_full_refresh = node.config.full_refresh
+            if (
+                skip_unchanged
+                and not (full_refresh if node_full_refresh is None else node_full_refresh)
+                and self.state.relations.get(name) == loaded
+                and self._table_exists(adapter, relation)
+            ):
+                unchanged.add(node.unique_id)
+                fire_event(
+                    Note(msg=f"Seed {node.unique_id} is unchanged since it was loaded"),
+                    level=EventLevel.DEBUG,
+                )
+                continue
+
+            self._loading[node.unique_id] = (name, loaded)
+            if self.state.relations.pop(name, None) is not None:
+                removed = True
+
+        if removed:
+            self.state.write(self.path)
+        return unchanged
+
+    def _table_exists(self, adapter: BaseAdapter, relation) -> bool:
+        existing = adapter.get_relation(relation.database, relation.schema, relation.identifier)
+        return existing is not None and existing.is_table
+
+    def finish(self, results: Iterable[RunResult]) -> None:
+        """Save the seeds that were loaded successfully"""
+        loaded = False
+        for result in results:
+            node = getattr(result, "node", None)
+            if node is None or result.status != NodeStatus.Success:
+                continue
+            entry: Optional[Tuple[str, LoadedSeed]] = self._loading.pop(node.unique_id, None)
+            if entry is not None:
+                name, loaded_seed = entry
+                self.state.relations[name] = loaded_seed
+                loaded = True
+
+        if loaded:
+            self.state.write(self.path)
@@ -12,6 +12,7 @@ from dbt.adapters.factory import Adapter
 from dbt.cli.main import dbtRunner
 from dbt.logger import log_manager
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.partial_store import load_partial_parse_manifest
 from dbt.events.functions import (
     fire_event,
     capture_stdout_logs,
@@ -152,9 +153,7 @@ def get_logging_events(log_output, event_name):
 def get_manifest(project_root) -> Optional[Manifest]:
     path = os.path.join(project_root, "target", "partial_parse.msgpack")
     if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+        manifest: Manifest = load_partial_parse_manifest(path)
         return manifest
     else:
         return None
@@ -0,0 +1,166 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Generator, List, Optional, TypeVar
+
+import dbt.utils
+from dbt.clients.system import write_file
+
+
+@dataclass
+class Span:
+    """A timed section of the invocation, on one thread. Spans on the same
+    thread nest by time. The thread_start and thread_end times are from the
+    thread's CPU clock, so the wall time minus the thread time of a span is
+    the time the thread spent waiting, i.e. on the warehouse.
+    """
+
+    name: str
+    category: str
+    thread_id: int
+    start: float
+    thread_start: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    end: Optional[float] = None
+    thread_end: Optional[float] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.spans: List[Span] = []
+        self.thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes: Any) -> Generator[Span, None, None]:
+        current_span = Span(
+            name=name,
+            category=category,
+            thread_id=threading.get_ident(),
+            start=time.perf_counter(),
+            thread_start=time.thread_time(),
+            attributes=attributes,
+        )
+        try:
+            yield current_span
+        except BaseException as exc:
+            current_span.set_attribute("error", type(exc).__name__)
+            raise
+        finally:
+            current_span.thread_end = time.thread_time()
+            current_span.end = time.perf_counter()
+            with self._lock:
+                self.spans.append(current_span)
+                if current_span.thread_id not in self.thread_names:
+                    self.thread_names[current_span.thread_id] = threading.current_thread().name
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans in the Chrome trace event format, which can be
+        loaded in chrome://tracing or https://ui.perfetto.dev
+        """
+        pid = os.getpid()
+
+        def micros(seconds: float) -> float:
+            return round(seconds * 1e6, 3)
+
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in self.thread_names.items()
+        ]
+        for span in sorted(self.spans, key=lambda s: s.start):
+            assert span.end is not None and span.thread_end is not None
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "ts": micros(span.start - self.start),
+                    "dur": micros(span.end - span.start),
+                    "tts": micros(span.thread_start),
+                    "tdur": micros(span.thread_end - span.thread_start),
+                    "args": span.attributes,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        write_file(path, json.dumps(self.to_chrome_trace(), cls=dbt.utils.JSONEncoder))
+
+
+# The tracer for this invocation, if tracing is enabled
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+@contextmanager
+def tracing(enable: bool, outfile: str, name: str = "invocation") -> Generator[Any, None, None]:
+    """Record spans while in the block and write them to 'outfile' as a
+    Chrome trace. The whole block is recorded as a span called 'name'.
+    """
+    global _tracer
+    if not enable:
+        yield
+        return
+
+    tracer = Tracer()
+    _tracer = tracer
+    try:
+        with tracer.span(name, "dbt"):
+            yield
+    finally:
+        _tracer = None
+        tracer.write(outfile)
+
+
+def span(name: str, category: str = "dbt", **attributes: Any) -> ContextManager[Optional[Span]]:
+    """Record a span, if tracing is enabled. Yields the Span, or None when
+    tracing is disabled.
+    """
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.span(name, category, **attributes)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def traced(
+    name: str,
+    category: str = "dbt",
+    attributes: Optional[Callable[..., Dict[str, Any]]] = None,
+) -> Callable[[F], F]:
+    """Decorator to record each call of a function as a span. 'attributes'
+    is called with the function's arguments to get the span's attributes.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            span_attributes = attributes(*args, **kwargs) if attributes else {}
+            with _tracer.span(name, category, **span_attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
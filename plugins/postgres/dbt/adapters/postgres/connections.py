@@ -1,3 +1,5 @@
+import io
+import time
 from contextlib import contextmanager
 
 import psycopg2
@@ -6,18 +8,26 @@ from psycopg2.extensions import string_types
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.connection import AdapterResponse, Connection
 from dbt.events import AdapterLogger
+from dbt.events.contextvars import get_node_info
+from dbt.events.functions import fire_event
+from dbt.events.types import SQLQuery, SQLQueryStatus
+from dbt.tracing import span
+from dbt.utils import cast_to_str
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Iterator, Optional, Tuple
 from typing_extensions import Annotated
 from mashumaro.jsonschema.annotations import Maximum, Minimum
 
 
 logger = AdapterLogger("Postgres")
 
+# The size of the reads psycopg2 makes from the data of a copy
+COPY_READ_SIZE = 65536
+
 
 @dataclass
 class PostgresCredentials(Credentials):
@@ -189,6 +199,36 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         logger.debug("Cancel query '{}': {}".format(connection_name, res))
 
+    def copy_from(self, sql: str, chunks: Iterator[str]) -> Tuple[Connection, Any]:
+        """Run a 'copy ... from stdin' statement, sending the data from
+        'chunks' as it's produced instead of building it all in memory.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name), sql=sql, node_info=get_node_info()
+                )
+            )
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            with span("query", "warehouse", connection=connection.name):
+                cursor.copy_expert(sql, _CopyStream(chunks), size=COPY_READ_SIZE)
+
+            fire_event(
+                SQLQueryStatus(
+                    status=str(self.get_response(cursor)),
+                    elapsed=round((time.time() - pre)),
+                    node_info=get_node_info(),
+                )
+            )
+
+            return connection, cursor
+
     @classmethod
     def get_credentials(cls, credentials):
         return credentials
@@ -205,3 +245,23 @@ class PostgresConnectionManager(SQLConnectionManager):
     @classmethod
     def data_type_code_to_name(cls, type_code: int) -> str:
         return string_types[type_code].name
+
+
+class _CopyStream:
+    """A file-like object for cursor.copy_expert, which reads the data from
+    an iterator of strings
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._current = io.StringIO()
+
+    def read(self, size: int = -1) -> str:
+        while True:
+            data = self._current.read(size)
+            if data:
+                return data
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return ""
+            self._current = io.StringIO(chunk)
@@ -1,6 +1,10 @@
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, Set, List, Any
+from decimal import Decimal
+from typing import Optional, Set, List, Any, Sequence
+
+import agate
+import pytz
 
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.impl import AdapterConfig, AdapterFeature, ConstraintSupport
@@ -8,6 +12,7 @@ from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres.column import PostgresColumn
 from dbt.adapters.postgres import PostgresRelation
+from dbt.clients import agate_helper
 from dbt.dataclass_schema import dbtClassMixin, ValidationError
 from dbt.contracts.graph.nodes import ConstraintType
 from dbt.exceptions import (
@@ -22,6 +27,9 @@ import dbt.utils
 
 GET_RELATIONS_MACRO_NAME = "postgres__get_relations"
 
+# The number of seed rows formatted at a time for 'copy ... from stdin'
+COPY_BATCH_SIZE = 10000
+
 
 @dataclass
 class PostgresIndexConfig(dbtClassMixin):
@@ -95,6 +103,26 @@ class PostgresAdapter(SQLAdapter):
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
 
+    @available.parse_none
+    def load_seed_rows(
+        self, relation: PostgresRelation, column_list: str, agate_table: agate.Table
+    ) -> Optional[str]:
+        time_zone = None
+        if any(isinstance(t, agate.data_types.DateTime) for t in agate_table.column_types):
+            # Inserting a datetime with a time zone into a timestamp column
+            # converts it to the session's time zone, but copy ignores the
+            # time zone. Convert them here, so the rows are the same.
+            _, result = self.execute("select current_setting('TimeZone')", fetch=True)
+            try:
+                time_zone = pytz.timezone(result[0][0])
+            except pytz.UnknownTimeZoneError:
+                return None
+
+        sql = f"copy {relation} ({column_list}) from stdin"
+        batches = agate_helper.iter_row_batches(agate_table, COPY_BATCH_SIZE)
+        self.connections.copy_from(sql, (_copy_text(batch, time_zone) for batch in batches))
+        return sql
+
     def _link_cached_database_relations(self, schemas: Set[str]):
         """
         :param schemas: The set of schemas that should have links added.
@@ -151,3 +179,29 @@ class PostgresAdapter(SQLAdapter):
     @classmethod
     def has_feature(cls, feature: AdapterFeature) -> bool:
         return feature in cls.SUPPORTED_FEATURES
+
+
+def _copy_text(rows: Sequence[Sequence[Any]], time_zone: Optional[Any]) -> str:
+    """Format rows in the text format of 'copy ... from stdin'"""
+    return "".join(
+        "\t".join(_copy_value(value, time_zone) for value in row) + "\n" for row in rows
+    )
+
+
+def _copy_value(value: Any, time_zone: Optional[Any]) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, Decimal):
+        # no exponent, which integer columns don't accept
+        return format(value.normalize(), "f")
+    if isinstance(value, datetime) and value.tzinfo is not None and time_zone is not None:
+        value = value.astimezone(time_zone).replace(tzinfo=None)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
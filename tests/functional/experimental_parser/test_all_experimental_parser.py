@@ -4,15 +4,14 @@ from dbt.tests.util import run_dbt, run_dbt_and_capture
 
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import RefArgs
+from dbt.parser.partial_store import load_partial_parse_manifest
 import os
 
 
 def get_manifest():
     path = "./target/partial_parse.msgpack"
     if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+        manifest: Manifest = load_partial_parse_manifest(path)
         return manifest
     else:
         return None
@@ -225,3 +225,112 @@ class TestAgateHelper(unittest.TestCase):
 
         for i, row in enumerate(tbl):
             self.assertEqual(list(row), expected[i])
+
+    def _write_seed(self, data):
+        path = os.path.join(self.tempdir, "input.csv")
+        with open(path, "wb") as fp:
+            fp.write(data.encode("utf-8"))
+        return path
+
+    def test_from_csv_sample(self):
+        lines = ["id,name,amount,created_at,flag"]
+        for i in range(50):
+            lines.append(f"{i},name_{i},{i}.5,2023-01-{i % 28 + 1:02d},{i % 2 == 0}")
+        # the widest values are at the end of the file
+        lines.append("50,a much longer name than the others,12345.125,1999-12-31,")
+        lines.append("51,short,-7,2099-01-01,False")
+        path = self._write_seed("\n".join(lines))
+
+        full = agate_helper.from_csv(path, ())
+        sample = agate_helper.from_csv_sample(path, (), sample_size=10)
+
+        self.assertEqual(sample.column_names, full.column_names)
+        self.assertEqual(
+            [type(t) for t in sample.column_types], [type(t) for t in full.column_types]
+        )
+        self.assertLess(len(sample.rows), len(full.rows))
+        self.assertEqual(list(sample.rows[0]), list(full.rows[0]))
+        for name in ("id", "amount", "created_at"):
+            for aggregation in (agate.Min, agate.Max):
+                self.assertEqual(
+                    sample.aggregate(aggregation(name)), full.aggregate(aggregation(name))
+                )
+        self.assertTrue(sample.aggregate(agate.HasNulls("flag")))
+        self.assertEqual(sample.aggregate(agate.MaxLength("name")), 34)
+        self.assertEqual(sample.aggregate(agate.MaxPrecision("amount")), 3)
+
+        self.assertEqual(sample.row_count, 52)
+        self.assertEqual(full.row_count, 52)
+        batches = list(sample.row_batches(20))
+        self.assertEqual([len(b) for b in batches], [20, 20, 12])
+        self.assertEqual(
+            [list(row) for batch in batches for row in batch], [list(row) for row in full]
+        )
+        self.assertEqual(
+            [len(b) for b in agate_helper.iter_row_batches(full, 50)],
+            [50, 2],
+        )
+
+    def test_bom_from_csv_sample(self):
+        path = self._write_seed(SAMPLE_CSV_BOM_DATA)
+        tbl = agate_helper.from_csv_sample(path, ())
+        self.assertEqual(tbl.column_names, tuple("abcdefg"))
+        self.assertEqual([list(row) for row in tbl], EXPECTED)
+        self.assertEqual([list(row) for row in next(tbl.row_batches(10))], EXPECTED)
+
+    def test_from_csv_sample_text_columns(self):
+        path = self._write_seed(SAMPLE_CSV_DATA)
+        tbl = agate_helper.from_csv_sample(path, tuple("abcdefg"))
+        self.assertEqual([list(row) for row in tbl], EXPECTED_STRINGS)
+
+    def test_from_csv_sample_row_too_long(self):
+        path = self._write_seed("a,b\n1,2\n3,4,5")
+        with self.assertRaises(ValueError):
+            agate_helper.from_csv_sample(path, ())
+
+    def test_table_from_rows(self):
+        rows = [
+            [1, "1", True, None, "null"],
+            [True, "2", False, None, ""],
+            [3, "x", None],
+        ]
+        tbl = agate_helper.table_from_rows(rows, ["a", "b", "c", "d", "e"])
+        # 1 and True are not the same value
+        assert isinstance(tbl.column_types[0], agate.data_types.Text)
+        assert isinstance(tbl.column_types[1], agate.data_types.Text)
+        assert isinstance(tbl.column_types[2], agate.data_types.Boolean)
+        assert isinstance(tbl.column_types[3], agate_helper.Integer)
+        self.assertEqual(
+            [list(row) for row in tbl],
+            [
+                ["1", "1", True, None, None],
+                ["True", "2", False, None, None],
+                ["3", "x", None, None, None],
+            ],
+        )
+
+        tbl = agate_helper.table_from_rows(rows[:2], ["a", "b", "c", "d", "e"], ["b", "e"])
+        self.assertEqual([list(row) for row in tbl.select(["b", "e"])], [["1", "null"], ["2", ""]])
+
+        with self.assertRaises(ValueError):
+            agate_helper.table_from_rows([[1, 2, 3]], ["a", "b"])
+
+    def test_table_from_rows_of_table(self):
+        tbl = agate_helper.table_from_data_flat(
+            [{"a": 1, "b": "2"}, {"a": 2, "b": "003"}], ["a", "b"]
+        )
+        retyped = agate_helper.table_from_rows(tbl.rows, tbl.column_names)
+        assert isinstance(retyped.column_types[0], agate_helper.Integer)
+        assert isinstance(retyped.column_types[1], agate_helper.Number)
+        self.assertEqual([list(row) for row in retyped], [[1, Decimal(2)], [2, Decimal(3)]])
+
+    def test_merge_reordered(self):
+        t1 = agate_helper.table_from_rows([(1, "a"), (2, "b")], ("a", "b"))
+        t2 = agate_helper.table_from_rows([("c", 3)], ("b", "a"))
+        t3 = agate_helper.table_from_rows([(None, 4)], ("c", "a"))
+        result = agate_helper.merge_tables([t1, t2, t3])
+        self.assertEqual(result.column_names, ("a", "b", "c"))
+        self.assertEqual(
+            [list(row) for row in result],
+            [[1, "a", None], [2, "b", None], [3, "c", None], [4, None, None]],
+        )
@@ -8,7 +8,8 @@ import pytest
 
 from dbt.adapters import postgres
 from dbt.adapters import factory
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import MacroStack, get_rendered
+from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import (
     ModelNode,
     NodeConfig,
@@ -133,6 +134,27 @@ class TestParseWrapper(unittest.TestCase):
         self.assertEqual(found, None)
         self.responder.get_relation.assert_not_called()
 
+    def test_dispatch_skips_missing_packages(self):
+        def get_from_package(package_name, name):
+            if package_name == "root":
+                raise dbt.exceptions.PackageNotFoundForMacroError(package_name)
+            return f"{package_name}.{name}" if name.startswith("default__") else None
+
+        self.namespace.get_from_package.side_effect = get_from_package
+        with mock.patch.object(
+            self.wrapper, "_get_search_packages", return_value=["root", "dbt"]
+        ), mock.patch.object(
+            self.wrapper, "_get_adapter_macro_prefixes", return_value=["postgres", "default"]
+        ):
+            for _ in range(3):
+                self.assertEqual(self.wrapper.dispatch("my_macro", "dbt"), "dbt.default__my_macro")
+        # the missing package is only looked up once
+        self.assertEqual(
+            [call.args for call in self.namespace.get_from_package.call_args_list],
+            [("root", "postgres__my_macro")]
+            + [("dbt", "postgres__my_macro"), ("dbt", "default__my_macro")] * 3,
+        )
+
 
 class TestRuntimeWrapper(unittest.TestCase):
     def setUp(self):
@@ -447,6 +469,68 @@ def test_model_runtime_context(config_postgres, manifest_fx, get_adapter, get_in
     assert_has_keys(REQUIRED_MODEL_KEYS, MAYBE_KEYS, ctx)
 
 
+def test_model_runtime_context_is_lazy(
+    config_postgres, manifest_fx, get_adapter, get_include_paths
+):
+    ctx = providers.generate_runtime_model_context(
+        model=mock_model(),
+        config=config_postgres,
+        manifest=manifest_fx,
+    )
+    # members and macros are created when they're looked up, then cached
+    assert not ctx._values
+    assert ctx["context"] is ctx
+    assert ctx["ref"] is ctx["builtins"]["ref"]
+    assert ctx["macro_a"] is ctx["macro_a"]
+    assert ctx["macro_a"].macro is manifest_fx.macros["macro.root.macro_a"]
+    assert "not_a_key" not in ctx
+    with pytest.raises(KeyError):
+        ctx["not_a_key"]
+
+    ctx["ref"] = "overridden"
+    assert ctx["ref"] == "overridden"
+    del ctx["ref"]
+    assert "ref" not in ctx
+    assert "ref" not in set(ctx)
+
+    # rendering only looks up the names that the template uses
+    ctx = providers.generate_runtime_model_context(
+        model=mock_model(),
+        config=config_postgres,
+        manifest=manifest_fx,
+    )
+    assert get_rendered("{{ macro_a is defined }} {{ target.name }}", ctx) == "True test"
+    assert set(ctx._values) == {"macro_a", "target"}
+
+    # errors are raised as usual, without looking up every name
+    with pytest.raises(dbt.exceptions.CompilationError):
+        get_rendered("{{ not_a_macro() }}", ctx)
+    assert set(ctx._values) == {"macro_a", "target"}
+
+
+def test_load_csv_rows_streams(config_postgres, postgres_adapter, get_include_paths):
+    config_postgres.dependencies = {}
+
+    def streams(*macros):
+        manifest = Manifest(macros={})
+        for name, package_name in macros:
+            macro = mock_macro(name, package_name)
+            manifest.macros[macro.unique_id] = macro
+        ctx = providers.generate_runtime_model_context(
+            model=mock_model(),
+            config=config_postgres,
+            manifest=manifest,
+        )
+        return ctx._context._load_csv_rows_streams()
+
+    dbt_macros = [("load_csv_rows", "dbt"), ("default__load_csv_rows", "dbt")]
+    assert streams(*dbt_macros)
+    # overrides of either macro may read all of the table's rows
+    assert not streams(*dbt_macros, ("postgres__load_csv_rows", "dbt_postgres"))
+    assert not streams(*dbt_macros, ("default__load_csv_rows", "root"))
+    assert not streams(*dbt_macros, ("load_csv_rows", "root"))
+
+
 def test_docs_runtime_context(config_postgres):
     ctx = docs.generate_runtime_docs_context(config_postgres, mock_model(), [], "root")
     assert_has_keys(REQUIRED_DOCS_KEYS, MAYBE_KEYS, ctx)
@@ -454,14 +538,14 @@ def test_docs_runtime_context(config_postgres):
 
 def test_macro_namespace_duplicates(config_postgres, manifest_fx):
     mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
-    mn.add_macros(manifest_fx.macros.values(), {})
+    mn.add_macros(manifest_fx.macros.values())
 
     # same pkg, same name: error
     with pytest.raises(dbt.exceptions.CompilationError):
-        mn.add_macro(mock_macro("macro_a", "root"), {})
+        mn.add_macro(mock_macro("macro_a", "root"))
 
     # different pkg, same name: no error
-    mn.add_macros(mock_macro("macro_a", "dbt"), {})
+    mn.add_macros(mock_macro("macro_a", "dbt"))
 
 
 def test_macro_namespace(config_postgres, manifest_fx):
@@ -494,6 +578,39 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result["some_macro"].macro is package_macro
 
 
+def test_macro_namespace_layout_is_shared(config_postgres):
+    manifest = Manifest(macros={})
+    for name in ["macro_a", "macro_b"]:
+        macro = mock_macro(name, "root")
+        manifest.macros[macro.unique_id] = macro
+
+    def build(ctx):
+        mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
+        return mn.build_manifest_namespace(manifest, ctx)
+
+    first_ctx, second_ctx = {}, {}
+    first = build(first_ctx)
+    second = build(second_ctx)
+    assert len(manifest._macro_namespace_layouts) == 1
+    assert first["macro_a"] is not second["macro_a"]
+    assert first["macro_a"].macro is second["macro_a"].macro
+    assert first["macro_a"].context is first_ctx
+    assert second["macro_a"].context is second_ctx
+    # the root package namespace shares the generators
+    assert first["root"]["macro_a"] is first["macro_a"]
+    assert set(first) == {"macro_a", "macro_b", "root", "dbt"}
+    # generators are only created when they're looked up
+    assert build({}).global_namespace.macros.generators == [None, None]
+
+    # adding a macro clears the layouts, removing one is detected by the count
+    source_file = mock.MagicMock(macros=[])
+    manifest.add_macro(source_file, mock_macro("macro_c", "root"))
+    assert not manifest._macro_namespace_layouts
+    assert "macro_c" in build({})
+    del manifest.macros["macro.root.macro_a"]
+    assert "macro_a" not in build({})
+
+
 def test_dbt_metadata_envs(
     monkeypatch, config_postgres, manifest_fx, get_adapter, get_include_paths
 ):
@@ -1,8 +1,24 @@
+from datetime import datetime
 from decimal import Decimal
 from unittest import mock
+import json
+import os
+import tempfile
 import unittest
 
+import agate
+
+from dbt.clients.agate_helper import table_from_rows
+from dbt.contracts.results import (
+    RunResultOutput,
+    RunResultsArtifact,
+    RunResultsMetadata,
+    RunStatus,
+    TestStatus,
+)
+from dbt.exceptions import AmbiguousCatalogMatchError
 from dbt.task import generate
+from dbt.utils import JSONEncoder
 
 
 class GenerateTest(unittest.TestCase):
@@ -329,3 +345,224 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+    def make_catalog_table(self, rows):
+        column_names = [
+            "table_database",
+            "table_schema",
+            "table_name",
+            "table_type",
+            "column_name",
+            "column_index",
+            "column_type",
+        ]
+        return table_from_rows(rows, column_names, text_only_columns=["column_type"])
+
+    def test__builder_adds_each_result(self):
+        self.mock_get_unique_id_mapping.return_value = (
+            {
+                generate.CatalogKey("db", "schema", "a"): "model.test.a",
+                generate.CatalogKey("db", "schema", "b"): "model.test.b",
+            },
+            {generate.CatalogKey("db", "schema", "a"): {"source.test.src.a"}},
+        )
+        builder = generate.CatalogBuilder(self.manifest)
+        builder.add(
+            self.make_catalog_table(
+                [
+                    ("db", "schema", "a", "BASE TABLE", "id", 1, "integer"),
+                    ("db", "schema", "b", "VIEW", "id", 1, "integer"),
+                ]
+            )
+        )
+        # the rest of a table's columns in a later result are still added
+        builder.add(self.make_catalog_table([("db", "schema", "b", "VIEW", "name", 2, "text")]))
+        builder.add(agate.Table([]))
+
+        self.assertEqual(list(builder.nodes), ["model.test.a", "model.test.b"])
+        self.assertEqual(list(builder.nodes["model.test.b"].columns), ["id", "name"])
+        self.assertEqual(builder.nodes["model.test.b"].unique_id, "model.test.b")
+        self.assertEqual(list(builder.sources), ["source.test.src.a"])
+        self.assertEqual(builder.sources["source.test.src.a"].metadata.name, "a")
+
+        # a source can only match one table
+        self.mock_get_unique_id_mapping.return_value = (
+            {},
+            {
+                generate.CatalogKey("db", "schema", "a"): {"source.test.src.a"},
+            },
+        )
+        builder = generate.CatalogBuilder(self.manifest)
+        builder.add(self.make_catalog_table([("db", "schema", "a", "VIEW", "id", 1, "int")]))
+        with self.assertRaises(AmbiguousCatalogMatchError):
+            builder.add(self.make_catalog_table([("DB", "Schema", "A", "VIEW", "id", 1, "int")]))
+
+    def test__write_catalog(self):
+        self.map_uids(
+            [("db", "schema", "a", "model.test.a"), ("db", "schema", "b", "model.test.b")]
+        )
+        builder = generate.CatalogBuilder(self.manifest)
+        builder.add(
+            self.make_catalog_table(
+                [
+                    ("db", "schema", "a", "BASE TABLE", "id", 1, "integer"),
+                    ("db", "schema", "b", "VIEW", "id", 1, "integer"),
+                ]
+            )
+        )
+        for errors in (None, ["bad"]):
+            results = generate.CatalogArtifact.from_results(
+                generated_at=datetime(2023, 1, 1),
+                nodes=builder.nodes,
+                sources=builder.sources,
+                compile_results=None,
+                errors=errors,
+            )
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "catalog.json")
+                results.write(path)
+                with open(path) as fp:
+                    written = fp.read()
+            # the same as serializing the whole catalog at once
+            self.assertEqual(
+                written, json.dumps(results.to_dict(omit_none=False), cls=JSONEncoder)
+            )
+            self.assertEqual(
+                generate.CatalogArtifact.from_dict(json.loads(written)).nodes, results.nodes
+            )
+
+
+class IncrementalCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.task = mock.MagicMock()
+        self.task.config.project_target_path = self.tempdir.name
+
+        self.task.manifest.nodes = {
+            "model.test.a": self.make_node("a"),
+            "model.test.b": self.make_node("b"),
+            "model.test.ephemeral": self.make_node("ephemeral", is_ephemeral_model=True),
+            "test.test.not_null": self.make_node("not_null", is_relational=False),
+        }
+        self.task.manifest.sources = {"source.test.src.c": self.make_node("c")}
+        self.previous_catalog = self.make_catalog(
+            nodes=["model.test.a", "model.test.b"], sources=["source.test.src.c"]
+        )
+
+    def make_node(self, name, is_relational=True, is_ephemeral_model=False):
+        return mock.MagicMock(
+            database="db",
+            schema="schema",
+            identifier=name,
+            is_relational=is_relational,
+            is_ephemeral_model=is_ephemeral_model,
+        )
+
+    def make_table(self, name, unique_id=None):
+        return generate.CatalogTable(
+            metadata=generate.TableMetadata(
+                type="BASE TABLE", schema="schema", name=name, database="db"
+            ),
+            columns={},
+            stats={},
+            unique_id=unique_id,
+        )
+
+    def make_catalog(self, nodes=(), sources=()):
+        return generate.CatalogArtifact.from_results(
+            generated_at=datetime(2023, 1, 1),
+            nodes={uid: self.make_table(uid.split(".")[-1], uid) for uid in nodes},
+            sources={uid: self.make_table(uid.split(".")[-1], uid) for uid in sources},
+            compile_results=None,
+            errors=None,
+        )
+
+    def write_run_results(self, which, statuses):
+        results = [
+            RunResultOutput(
+                unique_id=unique_id,
+                status=status,
+                timing=[],
+                thread_id="Thread-1",
+                execution_time=0.0,
+                adapter_response={},
+                message=None,
+                failures=None,
+                compiled=True,
+                compiled_code=None,
+                relation_name=None,
+            )
+            for unique_id, status in statuses.items()
+        ]
+        RunResultsArtifact(
+            metadata=RunResultsMetadata(),
+            results=results,
+            elapsed_time=1.0,
+            args={"which": which},
+        ).write(os.path.join(self.tempdir.name, "run_results.json"))
+
+    @mock.patch("dbt.task.generate.get_adapter")
+    def test_read_previous_catalog(self, get_adapter):
+        self.assertIsNone(generate.GenerateTask.read_previous_catalog(self.task))
+
+        self.previous_catalog.write(os.path.join(self.tempdir.name, "catalog.json"))
+        self.write_run_results(
+            "build",
+            {
+                "model.test.a": RunStatus.Success,
+                "model.test.b": RunStatus.Skipped,
+                "test.test.not_null": TestStatus.Pass,
+            },
+        )
+        previous_catalog, built = generate.GenerateTask.read_previous_catalog(self.task)
+        self.assertEqual(previous_catalog.nodes, self.previous_catalog.nodes)
+        self.assertEqual(built, {"model.test.a", "test.test.not_null"})
+
+        # compiling doesn't change any relations
+        self.write_run_results("compile", {"model.test.a": RunStatus.Success})
+        self.assertEqual(generate.GenerateTask.read_previous_catalog(self.task)[1], set())
+
+        get_adapter.return_value.has_feature.return_value = False
+        self.assertIsNone(generate.GenerateTask.read_previous_catalog(self.task))
+
+    def test_get_refreshed_relations(self):
+        refreshed = generate.GenerateTask.get_refreshed_relations(
+            self.task, self.make_catalog(nodes=["model.test.b"]), {"model.test.b"}, None
+        )
+        self.assertEqual(refreshed, {"model.test.a", "model.test.b", "source.test.src.c"})
+
+        refreshed = generate.GenerateTask.get_refreshed_relations(
+            self.task, self.previous_catalog, {"model.test.b", "test.test.not_null"}, None
+        )
+        self.assertEqual(refreshed, {"model.test.b"})
+
+        refreshed = generate.GenerateTask.get_refreshed_relations(
+            self.task, self.previous_catalog, {"model.test.b"}, {"model.test.a"}
+        )
+        self.assertEqual(refreshed, set())
+
+    @mock.patch("dbt.task.generate.get_unique_id_mapping")
+    def test_add_previous(self, get_unique_id_mapping):
+        key_a = generate.CatalogKey("db", "schema", "a")
+        key_b = generate.CatalogKey("db", "schema", "b")
+        key_c = generate.CatalogKey("db", "schema", "c")
+        # the table of model.test.b was dropped
+        get_unique_id_mapping.return_value = (
+            {key_a: "model.test.a", key_b: "model.test.b"},
+            {key_c: {"source.test.src.c"}},
+        )
+        builder = generate.CatalogBuilder(self.task.manifest)
+        refreshed_a = self.make_table("A")
+        builder.catalog[generate.CatalogKey("db", "schema", "A")] = refreshed_a
+        generate.add_unique_ids(
+            [refreshed_a], builder.node_map, builder.source_map, builder.nodes, builder.sources
+        )
+
+        builder.add_previous(self.previous_catalog, {key_a, key_b})
+        self.assertEqual(builder.nodes["model.test.a"].metadata.name, "A")
+        self.assertNotIn("model.test.b", builder.nodes)
+        self.assertEqual(
+            builder.sources["source.test.src.c"],
+            self.previous_catalog.sources["source.test.src.c"],
+        )
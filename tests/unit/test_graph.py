@@ -1,4 +1,8 @@
+import multiprocessing
 import os
+import subprocess
+import sys
+import tempfile
 
 from argparse import Namespace
 import unittest
@@ -367,3 +371,171 @@ class GraphTest(unittest.TestCase):
         manifest.metadata.dbt_version = "99999.99.99"
         is_partial_parsable, _ = loader.is_partial_parsable(manifest)
         self.assertFalse(is_partial_parsable)
+
+    @unittest.skipUnless(
+        dbt.compilation.parallel_compile_supported(), "requires the 'fork' start method"
+    )
+    def test__render_nodes_in_parallel(self):
+        self.use_models(
+            {
+                "base": "{{ config(materialized='ephemeral') }} select 1 as id",
+                "middle": "{{ config(materialized='ephemeral') }} select * from {{ ref('base') }}",
+                "model_one": "select * from {{ ref('middle') }}",
+                "model_two": "select * from {{ ref('base') }} join {{ ref('middle') }} using (id)",
+                "model_three": "select * from {{ ref('model_one') }}",
+                "broken": "select {{ undefined_macro() }}",
+            }
+        )
+        config = self.get_config()
+        manifest = self.load_manifest(config)
+        compiler = self.get_compiler(config)
+        selected = [
+            "model.test_models_compile.model_one",
+            "model.test_models_compile.model_two",
+            "model.test_models_compile.model_three",
+            "model.test_models_compile.broken",
+        ]
+        unique_ids = dbt.compilation.nodes_to_render(manifest, selected)
+        # the ephemeral models are rendered after the first node that needs them
+        self.assertEqual(
+            unique_ids,
+            selected[:1]
+            + ["model.test_models_compile.middle", "model.test_models_compile.base"]
+            + selected[1:],
+        )
+
+        serial = manifest.deepcopy()
+        dbt.compilation.render_nodes_in_parallel(compiler, manifest, unique_ids, workers=2)
+        # the broken node is rendered again, by the compile threads
+        self.assertEqual(set(manifest._rendered_nodes), set(unique_ids) - {selected[-1]})
+        self.assertTrue(all(not node.compiled for node in manifest.nodes.values()))
+
+        for unique_id in selected[:-1]:
+            compiled = compiler.compile_node(manifest.nodes[unique_id], manifest, write=False)
+            expected = compiler.compile_node(serial.nodes[unique_id], serial, write=False)
+            self.assertEqual(compiled.compiled_code, expected.compiled_code)
+            self.assertEqual(compiled.extra_ctes, expected.extra_ctes)
+        self.assertIn("__dbt__cte__base as", manifest.nodes[selected[0]].compiled_code)
+        self.assertEqual(manifest._rendered_nodes, {})
+        with self.assertRaises(dbt.exceptions.CompilationError):
+            compiler.compile_node(manifest.nodes[selected[-1]], manifest, write=False)
+
+    def test__compiled_code_cache(self):
+        self.use_models(
+            {
+                "model_one": "select 1 as id",
+                "model_two": "select * from {{ ref('model_one') }}",
+                "model_three": "select {{ run_query('select 1') }}",
+            }
+        )
+        config = self.get_config()
+        manifest = self.load_manifest(config)
+        compiler = self.get_compiler(config)
+        unique_ids = [
+            "model.test_models_compile.model_one",
+            "model.test_models_compile.model_two",
+            "model.test_models_compile.model_three",
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "compile_cache.json")
+            cache = dbt.compilation.CompiledCodeCache.load(path)
+            manifest._compiled_code_cache = cache
+            model_two = manifest.nodes[unique_ids[1]]
+            compiler._compile_code(model_two, manifest)
+            # nodes that run queries aren't cached
+            model_three = manifest.nodes[unique_ids[2]]
+            self.assertIsNone(cache.fingerprint(model_three, manifest, config, []))
+            cache.write(manifest)
+
+            cache = dbt.compilation.CompiledCodeCache.load(path)
+            self.assertEqual(list(cache.entries), [unique_ids[1]])
+            model_two.compiled_code = None
+            rendered = cache.get(model_two, manifest, config)
+            self.assertEqual(rendered.compiled_code, 'select * from "dbt"."dbt_test"."model_one"')
+
+            # the relation that a ref resolves to is part of the fingerprint
+            manifest.nodes[unique_ids[0]].relation_name = '"dbt"."other"."model_one"'
+            self.assertIsNone(cache.get(model_two, manifest, config))
+
+
+_INVOCATION_KEY_SCRIPT = """
+import sys
+from types import SimpleNamespace
+
+from dbt.cli.flags import Flags
+from dbt.cli.types import Command
+from dbt.compilation import CompiledCodeCache
+from dbt.flags import set_flags
+
+set_flags(Flags.from_dict(Command.RUN, {"profiles_dir": sys.argv[1]}))
+config = SimpleNamespace(
+    credentials=SimpleNamespace(type="postgres"),
+    to_target_dict=lambda: {"name": "test", "schema": "dbt_test"},
+    vars=SimpleNamespace(to_dict=lambda: {}),
+    cli_vars={},
+    quoting={},
+    dispatch=[],
+)
+manifest = SimpleNamespace(macros={"macro.test.a": None})
+print(CompiledCodeCache("compile_cache.json").invocation_key(config, manifest))
+"""
+
+
+class CompiledCodeCacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(dbt.flags.set_flags, dbt.flags.get_flags())
+
+    def invocation_key(self, **flags):
+        dbt.flags.set_from_args(Namespace(**flags), None)
+        config = MagicMock(cli_vars={}, quoting={}, dispatch=[])
+        config.credentials.type = "postgres"
+        config.to_target_dict.return_value = {"name": "test"}
+        config.vars.to_dict.return_value = {}
+        manifest = MagicMock(macros={})
+        return dbt.compilation.CompiledCodeCache("compile_cache.json").invocation_key(
+            config, manifest
+        )
+
+    def test_invocation_key_is_the_same_across_processes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            keys = [
+                subprocess.run(
+                    [sys.executable, "-c", _INVOCATION_KEY_SCRIPT, tmpdir],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.strip()
+                for _ in range(2)
+            ]
+        self.assertEqual(len(keys[0]), 64)
+        self.assertEqual(keys[0], keys[1])
+
+    def test_invocation_key_flags(self):
+        key = self.invocation_key(which="run", select=None, threads=1)
+        # the command, selection and process don't change how nodes render
+        self.assertEqual(
+            self.invocation_key(
+                which="compile",
+                select=("model_a",),
+                threads=8,
+                invocation_command="dbt compile -s model_a",
+                mp_context=multiprocessing.get_context("spawn"),
+            ),
+            key,
+        )
+        self.assertNotEqual(self.invocation_key(which="run", full_refresh=True), key)
+
+    def test_templates_reading_other_flags_are_not_cached(self):
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ flags.WHICH }}"))
+        # flags that aren't set when dbt.compilation is imported, or don't exist
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ flags.EMPTY }}"))
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ flags.THREADS }}"))
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ flags . SELECT }}"))
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ flags.FULL_REFRESHED }}"))
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ flags['FULL_REFRESH'] }}"))
+        self.assertTrue(dbt.compilation._is_nondeterministic("{% set f = flags %}"))
+        self.assertTrue(dbt.compilation._is_nondeterministic("{{ invocation_args_dict }}"))
+        self.assertFalse(dbt.compilation._is_nondeterministic("{{ flags.FULL_REFRESH }}"))
+        self.assertFalse(
+            dbt.compilation._is_nondeterministic("{{ flags.DEFER and flags.STORE_FAILURES }}")
+        )
@@ -0,0 +1,194 @@
+import random
+import threading
+from queue import Empty
+from unittest import mock
+
+import networkx as nx
+import pytest
+
+from dbt.graph.queue import ConcurrencyLimit, GraphQueue
+
+
+def _make_queue(graph, execution_times=None, concurrency_limits=()):
+    manifest = mock.MagicMock()
+    manifest.expect.side_effect = lambda unique_id: unique_id
+    return GraphQueue(
+        graph,
+        manifest,
+        set(graph.nodes()),
+        execution_times=execution_times,
+        concurrency_limits=concurrency_limits,
+    )
+
+
+def _chain_graph():
+    # a long chain of slow nodes next to a wide set of shallow cheap nodes
+    graph = nx.DiGraph([("slow_1", "slow_2"), ("slow_2", "slow_3")])
+    graph.add_edges_from(("cheap", f"cheap_child_{idx}") for idx in range(3))
+    return graph
+
+
+def _drain(queue):
+    order = []
+    while not queue.empty():
+        node = queue.get(block=False)
+        order.append(node)
+        queue.mark_done(node)
+    return order
+
+
+def test_depth_scores_without_history():
+    queue = _make_queue(_chain_graph())
+    assert queue._scores["slow_1"] == queue._scores["cheap"] == 0
+    assert queue._scores["slow_3"] == 2
+    assert _drain(queue)[:2] == ["cheap", "slow_1"]
+
+
+def test_depth_scores_without_history_for_graph():
+    queue = _make_queue(_chain_graph(), execution_times={"model.pkg.other": 10.0})
+    assert queue._scores["slow_3"] == 2
+
+
+def test_critical_path_scores():
+    execution_times = {"slow_1": 10.0, "slow_2": 10.0, "slow_3": 10.0, "cheap": 1.0}
+    queue = _make_queue(_chain_graph(), execution_times=execution_times)
+    assert queue._scores["slow_1"] == -30.0
+    assert queue._scores["slow_3"] == -10.0
+    # the children of 'cheap' have no history and count as the mean of the known times
+    assert queue._scores["cheap"] == -(1.0 + 7.75)
+    assert queue._scores["cheap_child_0"] == -7.75
+    assert _drain(queue)[:4] == ["slow_1", "slow_2", "slow_3", "cheap"]
+
+
+def test_get_returns_none_when_everything_was_handed_out():
+    queue = _make_queue(nx.DiGraph([("a", "b")]))
+    assert queue.get() == "a"
+    assert len(queue) == 1
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+    queue.mark_done("a")
+    assert queue.get() == "b"
+    # 'b' is still in progress, but there is nothing left to hand out
+    assert queue.empty()
+    assert queue.get() is None
+    with pytest.raises(Empty):
+        queue.get(block=False)
+    queue.mark_done("b")
+    queue.join()
+    assert queue.unfinished_tasks == 0
+    assert queue.wait_until_something_was_done() == 0
+
+
+def test_concurrent_consumers():
+    rng = random.Random(7)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(500))
+    for child in range(1, 500):
+        for _ in range(2):
+            graph.add_edge(rng.randrange(child), child)
+    queue = _make_queue(graph)
+    done = set()
+    handed_out = []
+    errors = []
+
+    def consume():
+        while True:
+            node = queue.get()
+            if node is None:
+                return
+            handed_out.append(node)
+            if not all(parent in done for parent in graph.predecessors(node)):
+                errors.append(node)
+            done.add(node)
+            queue.mark_done(node)
+
+    threads = [threading.Thread(target=consume) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    queue.join()
+    assert not errors
+    assert sorted(handed_out) == list(range(500))
+
+
+def test_concurrency_limits():
+    graph = nx.DiGraph()
+    graph.add_nodes_from(["snapshot_a", "snapshot_b", "snapshot_c", "table_a", "table_b"])
+    snapshots = ConcurrencyLimit(
+        name="resource_type:snapshot", limit=1, nodes={"snapshot_a", "snapshot_b", "snapshot_c"}
+    )
+    heavy = ConcurrencyLimit(name="tag:heavy", limit=2, nodes={"snapshot_c", "table_a", "table_b"})
+    queue = _make_queue(graph, concurrency_limits=[snapshots, heavy])
+
+    assert queue.get(block=False) == "snapshot_a"
+    # the other snapshots are over the limit, but tables aren't
+    assert queue.get(block=False) == "table_a"
+    assert queue.get(block=False) == "table_b"
+    with pytest.raises(Empty):
+        queue.get(block=False)
+    assert len(queue) == 2
+
+    queue.mark_done("snapshot_a")
+    assert queue.get(block=False) == "snapshot_b"
+    queue.mark_done("snapshot_b")
+    # snapshot_c is no longer over the snapshot limit, but two heavy nodes are in progress
+    with pytest.raises(Empty):
+        queue.get(block=False)
+    queue.mark_done("table_a")
+    assert queue.get(block=False) == "snapshot_c"
+    assert queue.get() is None
+
+
+def test_concurrency_limits_node_released_into_another_full_limit():
+    graph = nx.DiGraph()
+    graph.add_nodes_from(["snapshot_a", "snapshot_b", "snapshot_c", "table"])
+    snapshots = ConcurrencyLimit(
+        name="resource_type:snapshot", limit=1, nodes={"snapshot_a", "snapshot_b", "snapshot_c"}
+    )
+    heavy = ConcurrencyLimit(name="tag:heavy", limit=1, nodes={"snapshot_b", "table"})
+    queue = _make_queue(graph, concurrency_limits=[snapshots, heavy])
+
+    assert queue.get(block=False) == "snapshot_a"
+    assert queue.get(block=False) == "table"
+    queue.mark_done("snapshot_a")
+    # snapshot_b is released by the snapshot limit, but the heavy limit is
+    # full, so the free snapshot slot goes to snapshot_c
+    assert queue.get(block=False) == "snapshot_c"
+    with pytest.raises(Empty):
+        queue.get(block=False)
+    queue.mark_done("table")
+    queue.mark_done("snapshot_c")
+    assert queue.get(block=False) == "snapshot_b"
+    assert queue.get() is None
+
+
+def test_concurrency_limits_with_concurrent_consumers():
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(200))
+    limited = ConcurrencyLimit(name="even", limit=3, nodes=set(range(0, 200, 2)))
+    queue = _make_queue(graph, concurrency_limits=[limited])
+    lock = threading.Lock()
+    running = set()
+    max_running = []
+
+    def consume():
+        while True:
+            node = queue.get()
+            if node is None:
+                return
+            with lock:
+                running.add(node)
+                max_running.append(len(running & limited.nodes))
+            with lock:
+                running.discard(node)
+            queue.mark_done(node)
+
+    threads = [threading.Thread(target=consume) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    queue.join()
+    assert len(max_running) == 200
+    assert max(max_running) <= 3
@@ -0,0 +1,146 @@
+import random
+
+import networkx as nx
+import pytest
+
+import dbt.exceptions
+from dbt.graph.graph import Graph, IndexedGraph
+
+
+def _random_dag(node_count=200, edge_count=600, seed=42):
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(f"model.pkg.m{idx}" for idx in range(node_count))
+    for _ in range(edge_count):
+        first, second = sorted(rng.sample(range(node_count), 2))
+        if rng.random() < 0.2:
+            graph.add_edge(f"model.pkg.m{first}", f"model.pkg.m{second}", edge_type="parent_test")
+        else:
+            graph.add_edge(f"model.pkg.m{first}", f"model.pkg.m{second}")
+    return graph
+
+
+def _expected_descendants(graph, node, max_depth=None, reverse=False):
+    filtered = nx.subgraph_view(
+        graph,
+        filter_edge=lambda a, b: graph.get_edge_data(a, b).get("edge_type") != "parent_test",
+    )
+    return {
+        child for _, child in nx.bfs_edges(filtered, node, reverse=reverse, depth_limit=max_depth)
+    }
+
+
+@pytest.fixture
+def nx_graph():
+    return _random_dag()
+
+
+def test_csr_layout():
+    graph = nx.DiGraph()
+    graph.add_edge("a", "b")
+    graph.add_edge("a", "c", edge_type="parent_test")
+    graph.add_edge("b", "c")
+    indexed = IndexedGraph(graph)
+    assert indexed.unique_ids == ["a", "b", "c"]
+    assert len(indexed) == 3
+    assert "b" in indexed
+    assert indexed.edge_type_codes == {None: 0, "parent_test": 1}
+    assert indexed.successors("a") == ["b", "c"]
+    assert indexed.successors("c") == []
+    assert indexed.reachable(["c"], reverse=True) == {"a", "b"}
+    assert indexed.reachable(["a"], edge_mask=indexed.edge_mask(["parent_test"]), max_depth=1) == {
+        "b"
+    }
+
+
+@pytest.mark.parametrize("max_depth", [None, 0, 1, 3])
+def test_traversals_match_networkx(nx_graph, max_depth):
+    graph = Graph(nx_graph)
+    for node in list(nx_graph)[::7]:
+        assert graph.descendants(node, max_depth) == _expected_descendants(
+            nx_graph, node, max_depth
+        )
+        assert graph.ancestors(node, max_depth) == _expected_descendants(
+            nx_graph, node, max_depth, reverse=True
+        )
+
+
+@pytest.mark.parametrize("max_depth", [None, 1, 2])
+def test_multi_source_traversals_match_networkx(nx_graph, max_depth):
+    graph = Graph(nx_graph)
+    # includes nodes that are descendants and ancestors of each other
+    selected = set(list(nx_graph)[40:80:3])
+    expected_children = set()
+    expected_parents = set()
+    for node in selected:
+        expected_children |= _expected_descendants(nx_graph, node, max_depth)
+        expected_parents |= _expected_descendants(nx_graph, node, max_depth, reverse=True)
+    assert selected & expected_children
+    assert graph.select_children(selected, max_depth) == expected_children
+    assert graph.select_parents(selected, max_depth) == expected_parents
+    children = graph.select_children(selected) | selected
+    assert graph.select_childrens_parents(selected) == (
+        set().union(*(_expected_descendants(nx_graph, node, reverse=True) for node in children))
+        | children
+    )
+
+
+def test_selection_matches_networkx(nx_graph):
+    graph = Graph(nx_graph)
+    selected = set(list(nx_graph)[:20])
+    assert graph.select_successors(selected) == {
+        successor for node in selected for successor in nx_graph.successors(node)
+    }
+    assert graph.get_dependent_nodes("model.pkg.m3") == nx.descendants(nx_graph, "model.pkg.m3")
+
+
+def test_subgraph_view(nx_graph):
+    nodes = list(nx_graph)[50:150]
+    graph = Graph(nx_graph).subgraph(nodes)
+    node = nodes[0]
+    assert graph.descendants(node) == _expected_descendants(nx_graph.subgraph(nodes), node)
+
+
+def test_missing_node(nx_graph):
+    with pytest.raises(dbt.exceptions.DbtInternalError):
+        Graph(nx_graph).descendants("model.pkg.missing")
+
+
+def _expected_subset_edges(graph, selected):
+    # an edge for every path whose intermediate nodes are all unselected
+    edges = set()
+    for node in selected:
+        stack = list(graph.successors(node))
+        seen = set(stack)
+        while stack:
+            target = stack.pop()
+            if target in selected:
+                edges.add((node, target))
+                continue
+            for successor in graph.successors(target):
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+    return edges
+
+
+@pytest.mark.parametrize("seed,size", [(1, 5), (2, 25), (3, 25), (4, 100), (5, 190)])
+def test_get_subset_graph(nx_graph, seed, size):
+    rng = random.Random(seed)
+    selected = set(rng.sample(list(nx_graph), size))
+    subset = Graph(nx_graph).get_subset_graph(selected)
+    assert subset.nodes() == selected
+    assert set(subset.edges()) == _expected_subset_edges(nx_graph, selected)
+    for source, target in subset.edges():
+        # attributes of existing edges are kept
+        assert subset.graph.get_edge_data(source, target) == (
+            nx_graph.get_edge_data(source, target) or {}
+        )
+
+
+def test_get_subset_graph_chain():
+    graph = nx.DiGraph([("a", "b"), ("b", "c"), ("c", "d"), ("b", "e"), ("a", "d")])
+    subset = Graph(graph).get_subset_graph(["a", "d", "e"])
+    assert sorted(subset.edges()) == [("a", "d"), ("a", "e")]
+    with pytest.raises(ValueError):
+        Graph(graph).get_subset_graph(["a", "missing"])
@@ -1,5 +1,10 @@
-from dbt.compilation import inject_ctes_into_sql
+from dbt.compilation import (
+    _cte_insert_position,
+    _inject_ctes_with_sqlparse,
+    inject_ctes_into_sql,
+)
 from dbt.contracts.graph.nodes import InjectedCTE
+import pytest
 import re
 
 
@@ -195,3 +200,29 @@ def test_inject_ctes_with_recursive():
     """
     generated_sql = inject_ctes_into_sql(starting_sql, ctes)
     assert norm_whitespace(generated_sql) == norm_whitespace(expected_sql)
+
+
+@pytest.mark.parametrize(
+    "starting_sql,fast",
+    [
+        ("select * from __dbt__cte__base", True),
+        ("\n  -- a comment\nselect * from __dbt__cte__base\n", True),
+        ("/* a comment */ with a as (select 1) select * from a", True),
+        ("WITH\n\nRECURSIVE t(n) as (select 1) select * from t", True),
+        ("with -- a comment\nrecursive t(n) as (select 1) select * from t", True),
+        ("select 'with' from __dbt__cte__base", False),
+        ("insert into t with a as (select 1) select * from a", False),
+        ("select * from __dbt__cte__base; select 2", False),
+    ],
+)
+def test_inject_ctes_matches_sqlparse(starting_sql, fast):
+    ctes = [
+        InjectedCTE(id="model.test.base", sql=" __dbt__cte__base as (\nselect 1\n)"),
+        InjectedCTE(id="model.test.other", sql=" __dbt__cte__other as (\nselect 2\n)"),
+    ]
+    # the start of the statement is enough to find where the ctes go,
+    # unless it has more than one statement or a 'with' further in
+    assert (_cte_insert_position(starting_sql) is not None) == fast
+    assert inject_ctes_into_sql(starting_sql, ctes) == _inject_ctes_with_sqlparse(
+        starting_sql, ctes
+    )
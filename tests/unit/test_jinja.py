@@ -1,8 +1,12 @@
 from contextlib import contextmanager
+import os
 import pytest
 import unittest
+from unittest import mock
 import yaml
 
+import dbt.clients.jinja
+from dbt.clients.jinja import TemplateBytecodeCache, set_template_bytecode_cache
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
@@ -417,6 +421,49 @@ class TestJinja(unittest.TestCase):
         assert value == "1991"
 
 
+@pytest.fixture
+def template_bytecode_cache(tmp_path):
+    set_template_bytecode_cache(str(tmp_path / "template_cache"))
+    yield dbt.clients.jinja.template_bytecode_cache
+    set_template_bytecode_cache(None)
+
+
+def test_template_bytecode_cache(template_bytecode_cache):
+    ctx = {"a_int": 100}
+    assert get_rendered("{{ a_int + 1 }}", ctx) == "101"
+    assert get_rendered("{{ a_int + 1 }}", ctx, native=True) == 101
+    # the text and native environments compile the same source differently
+    assert len(os.listdir(template_bytecode_cache.directory)) == 2
+
+    # a later invocation loads the compiled code instead of compiling again
+    set_template_bytecode_cache(template_bytecode_cache.directory)
+    with mock.patch("jinja2.Environment._generate", side_effect=AssertionError("compiled")):
+        assert get_rendered("{{ a_int + 1 }}", ctx) == "101"
+        assert get_rendered("{{ a_int + 1 }}", ctx, native=True) == 101
+        with pytest.raises(AssertionError):
+            get_rendered("{{ a_int + 2 }}", ctx)
+
+
+def test_template_bytecode_cache_eviction(template_bytecode_cache):
+    get_rendered("{{ 1 }}", {})
+    entry_size = template_bytecode_cache.size
+    cache = TemplateBytecodeCache(template_bytecode_cache.directory, max_size=entry_size * 4)
+    with mock.patch.object(dbt.clients.jinja, "template_bytecode_cache", cache):
+        for idx in range(2, 7):
+            get_rendered(f"{{{{ {idx} }}}}", {})
+            assert cache.size <= cache.max_size
+        # the least recently used templates were removed
+        bucket = cache.get_source_bucket(
+            dbt.clients.jinja.get_environment(), "{{ 6 }}", None, False
+        )
+        assert bucket.code is not None
+        bucket = cache.get_source_bucket(
+            dbt.clients.jinja.get_environment(), "{{ 1 }}", None, False
+        )
+        assert bucket.code is None
+    assert len(os.listdir(cache.directory)) < 6
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
@@ -65,7 +65,7 @@ class LinkerTest(unittest.TestCase):
 
     def assert_would_join(self, queue):
         """test join() without timeout risk"""
-        self.assertEqual(queue.inner.unfinished_tasks, 0)
+        self.assertEqual(queue.unfinished_tasks, 0)
 
     def _get_graph_queue(self, manifest, include=None, exclude=None):
         graph = compilation.Graph(self.linker.graph)
@@ -111,6 +111,24 @@ class LinkerTest(unittest.TestCase):
         self.assert_would_join(queue)
         self.assertTrue(queue.empty())
 
+    def test_critical_path_scheduling_is_opt_in(self):
+        self.linker.dependency("A", "B")
+        self.linker.add_node("Z")
+        previous_state = mock.MagicMock()
+        previous_state.results.results = [
+            mock.MagicMock(unique_id=unique_id, execution_time=execution_time)
+            for unique_id, execution_time in (("A", 1.0), ("B", 1.0), ("Z", 100.0))
+        ]
+        graph = compilation.Graph(self.linker.graph)
+        selector = NodeSelector(graph, _mock_manifest("ABZ"), previous_state=previous_state)
+        spec = parse_difference(None, None, "eager")
+
+        # by depth, unless critical path scheduling is turned on
+        queue = selector.get_graph_queue(spec)
+        self.assertEqual(queue.get(block=False).unique_id, "B")
+        queue = selector.get_graph_queue(spec, critical_path=True)
+        self.assertEqual(queue.get(block=False).unique_id, "Z")
+
     def test_linker_add_disjoint_dependencies(self):
         actual_deps = [("A", "B")]
         additional_node = "Z"
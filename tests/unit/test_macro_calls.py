@@ -1,6 +1,11 @@
 import unittest
+from unittest import mock
 
-from dbt.clients.jinja_static import statically_extract_macro_calls
+from dbt.clients.jinja_static import (
+    extract_macro_calls,
+    resolve_macro_calls,
+    statically_extract_macro_calls,
+)
 from dbt.context.base import generate_base_context
 
 
@@ -42,3 +47,27 @@ class MacroCalls(unittest.TestCase):
             possible_macro_calls = statically_extract_macro_calls(macro_string, ctx)
             self.assertEqual(self.possible_macro_calls[index], possible_macro_calls)
             index += 1
+
+    def test_extracted_calls_are_resolved_later(self):
+        ctx = generate_base_context({})
+        calls = extract_macro_calls(self.macro_strings[7])
+        self.assertEqual(
+            calls,
+            [
+                ["call", "return"],
+                ["dispatch_name", "test_some_kind5"],
+                ["dispatch", "test_some_kind5", "foo_utils5"],
+            ],
+        )
+        self.assertEqual(resolve_macro_calls(calls, ctx), self.possible_macro_calls[7])
+
+        db_wrapper = mock.MagicMock()
+        db_wrapper.dispatch.return_value.macro.package_name = "my_pkg"
+        db_wrapper.dispatch.return_value.macro.name = "default__test_some_kind5"
+        self.assertEqual(
+            resolve_macro_calls(calls, ctx, db_wrapper),
+            ["test_some_kind5", "my_pkg.default__test_some_kind5"],
+        )
+        db_wrapper.dispatch.assert_called_once_with(
+            "test_some_kind5", macro_namespace="foo_utils5"
+        )
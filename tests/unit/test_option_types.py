@@ -1,7 +1,7 @@
 from click import Option, BadParameter
 import pytest
 
-from dbt.cli.option_types import YAML
+from dbt.cli.option_types import YAML, ConcurrencyLimitsType
 
 
 class TestYAML:
@@ -24,3 +24,22 @@ class TestYAML:
         with pytest.raises(BadParameter) as e:
             YAML().convert(invalid_yaml_str, Option(["--vars"]), None)
         assert "--vars" in e.value.format_message()
+
+
+class TestConcurrencyLimitsType:
+    def test_concurrency_limits(self):
+        converted_value = ConcurrencyLimitsType().convert(
+            "{'resource_type:snapshot': 2, 'config.materialized:table': 8}",
+            Option(["--concurrency-limits"]),
+            None,
+        )
+        assert converted_value == {"resource_type:snapshot": 2, "config.materialized:table": 8}
+
+    @pytest.mark.parametrize(
+        "invalid_limits",
+        ["{'resource_type:snapshot': 0}", "{'resource_type:snapshot': two}", "{1: 2}"],
+    )
+    def test_invalid_concurrency_limits(self, invalid_limits):
+        with pytest.raises(BadParameter) as e:
+            ConcurrencyLimitsType().convert(invalid_limits, Option(["--concurrency-limits"]), None)
+        assert "--concurrency-limits" in e.value.format_message()
@@ -7,6 +7,8 @@ from .utils import config_from_parts_or_dicts, normalize
 
 from dbt.contracts.files import SourceFile, FileHash, FilePath
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.contracts.graph.nodes import Macro
+from dbt.node_types import NodeType
 from dbt.parser import manifest
 from dbt.parser.manifest import ManifestLoader
 from dbt.config import RuntimeConfig
@@ -31,6 +33,7 @@ class MismatchedHash(FileHash):
 
 class TestLoader(unittest.TestCase):
     def setUp(self):
+        set_from_args(Namespace(), {})
         profile_data = {
             "target": "test",
             "quoting": {},
@@ -56,7 +59,7 @@ class TestLoader(unittest.TestCase):
         }
 
         self.root_project_config = config_from_parts_or_dicts(
-            project=root_project, profile=profile_data, cli_vars='{"test_schema_name": "foo"}'
+            project=root_project, profile=profile_data, cli_vars={"test_schema_name": "foo"}
         )
         self.parser = mock.MagicMock()
 
@@ -80,6 +83,46 @@ class TestLoader(unittest.TestCase):
             self.root_project_config, {"root": self.root_project_config}
         )
 
+    def _new_macro(self, name, macro_sql, created_at):
+        return Macro(
+            name=name,
+            resource_type=NodeType.Macro,
+            unique_id=f"macro.root.{name}",
+            package_name="root",
+            original_file_path=normalize("macros/macro.sql"),
+            path=normalize("macros/macro.sql"),
+            macro_sql=macro_sql,
+            created_at=created_at,
+        )
+
+    @patch("dbt.parser.manifest.extract_macro_calls")
+    def test_get_macro_calls(self, patched_extract):
+        patched_extract.side_effect = lambda macro_sql: [["call", "extracted"]]
+        started_at = self.loader.started_at
+        macros = [
+            self._new_macro("saved", "{{ saved_call() }}", started_at + 1),
+            self._new_macro("changed", "{{ changed_call() }}", started_at + 1),
+            self._new_macro("old", "{{ old_call() }}", started_at - 1),
+        ]
+        self.loader.manifest.macros = {macro.unique_id: macro for macro in macros}
+        saved_checksum = FileHash.from_contents("{{ saved_call() }}").checksum
+        self.loader.saved_macro_calls = {
+            saved_checksum: [["call", "saved_call"]],
+            FileHash.from_contents("{{ deleted_call() }}").checksum: [["call", "deleted"]],
+        }
+
+        macro_calls = self.loader.get_macro_calls()
+        # only the new macro that wasn't saved is parsed
+        patched_extract.assert_called_once_with("{{ changed_call() }}")
+        self.assertEqual(
+            macro_calls,
+            {
+                saved_checksum: [["call", "saved_call"]],
+                FileHash.from_contents("{{ changed_call() }}").checksum: [["call", "extracted"]],
+            },
+        )
+        self.assertIs(self.loader.manifest._macro_calls, macro_calls)
+
     def _new_manifest(self):
         state_check = ManifestStateCheck(MatchingHash(), MatchingHash, [])
         manifest = Manifest({}, {}, {}, {}, {}, {}, [], {})
@@ -108,16 +151,49 @@ class TestLoader(unittest.TestCase):
 class TestPartialParse(unittest.TestCase):
     @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
     @patch("dbt.parser.manifest.os.path.exists")
-    @patch("dbt.parser.manifest.open")
-    def test_partial_parse_file_path(self, patched_open, patched_os_exist, patched_state_check):
+    @patch("dbt.parser.manifest.load_partial_parse_manifest")
+    def test_partial_parse_file_path(self, patched_load, patched_os_exist, patched_state_check):
         mock_project = MagicMock(RuntimeConfig)
         mock_project.project_target_path = "mock_target_path"
         patched_os_exist.return_value = True
         set_from_args(Namespace(), {})
         ManifestLoader(mock_project, {})
         # by default we use the project_target_path
-        patched_open.assert_called_with("mock_target_path/partial_parse.msgpack", "rb")
+        patched_load.assert_called_with("mock_target_path/partial_parse.msgpack")
         set_from_args(Namespace(partial_parse_file_path="specified_partial_parse_path"), {})
         ManifestLoader(mock_project, {})
         # if specified in flags, we use the specified path
-        patched_open.assert_called_with("specified_partial_parse_path", "rb")
+        patched_load.assert_called_with("specified_partial_parse_path")
+
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    @patch("dbt.parser.manifest.os.path.exists")
+    @patch("dbt.parser.manifest.load_partial_parse_manifest")
+    @patch("dbt.parser.manifest.close_partial_parse_manifest")
+    def test_unused_partial_parse_file_is_closed(
+        self, patched_close, patched_load, patched_os_exist, patched_state_check
+    ):
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_target_path = "mock_target_path"
+        patched_os_exist.return_value = True
+        set_from_args(Namespace(), {})
+        with patch(
+            "dbt.parser.manifest.ManifestLoader.is_partial_parsable",
+            return_value=(False, manifest.ReparseReason.vars_changed),
+        ):
+            ManifestLoader(mock_project, {})
+        patched_close.assert_called_once_with(patched_load.return_value)
+
+        patched_close.reset_mock()
+        with patch(
+            "dbt.parser.manifest.ManifestLoader.is_partial_parsable",
+            side_effect=ValueError("unreadable"),
+        ):
+            ManifestLoader(mock_project, {})
+        patched_close.assert_called_once_with(patched_load.return_value)
+
+        patched_close.reset_mock()
+        with patch(
+            "dbt.parser.manifest.ManifestLoader.is_partial_parsable", return_value=(True, None)
+        ):
+            ManifestLoader(mock_project, {})
+        patched_close.assert_not_called()
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+
+from dbt.parser import perf
+from dbt.parser.perf import (
+    CONFIG,
+    PATCH,
+    READ,
+    RENDER,
+    YAML_LOAD,
+    FileParseInfo,
+    ParseTimer,
+    parse_timing,
+    time_file,
+    time_phase,
+)
+
+
+class TestParseTimer(unittest.TestCase):
+    def setUp(self):
+        # every call to perf_counter advances the clock by one second
+        self.clock = iter(range(1000))
+        patcher = mock.patch.object(perf.time, "perf_counter", lambda: next(self.clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.timer = ParseTimer()
+
+    def test_nested_phases_are_exclusive(self):
+        with self.timer.time_file("pkg://models/schema.yml", "schema"):  # 0
+            with self.timer.time_phase(PATCH):  # 1
+                with self.timer.time_phase(CONFIG):  # 2
+                    pass  # 3
+                with self.timer.time_phase(RENDER):  # 4
+                    pass  # 5
+            # 6
+        # 7
+        info = self.timer.files["pkg://models/schema.yml"]
+        self.assertEqual(info.parse_file_type, "schema")
+        self.assertEqual(info.elapsed, 7)
+        self.assertEqual(info.patch_elapsed, 3)
+        self.assertEqual(info.config_elapsed, 1)
+        self.assertEqual(info.render_elapsed, 1)
+
+    def test_phases_outside_of_a_file(self):
+        with self.timer.time_phase(READ, "pkg://models/schema.yml", "schema"):  # 0
+            with self.timer.time_phase(YAML_LOAD, "pkg://models/schema.yml"):  # 1
+                pass  # 2
+        # 3
+        with self.timer.time_file("pkg://models/schema.yml"):  # 4
+            pass  # 5
+        info = self.timer.files["pkg://models/schema.yml"]
+        self.assertEqual(info.read_elapsed, 2)
+        self.assertEqual(info.yaml_load_elapsed, 1)
+        # reading the file plus parsing it
+        self.assertEqual(info.elapsed, 4)
+
+    def test_phase_without_a_file_is_ignored(self):
+        with self.timer.time_phase(RENDER):
+            pass
+        self.assertEqual(self.timer.files, {})
+
+    def test_record_and_slowest(self):
+        self.timer.get_info("pkg://models/a.sql", "model").elapsed = 1.0
+        self.timer.record(FileParseInfo(file_id="pkg://models/b.sql", elapsed=3.0))
+        self.timer.record(
+            FileParseInfo(file_id="pkg://models/a.sql", elapsed=4.0, render_elapsed=2.0)
+        )
+        slowest = self.timer.slowest(1)
+        self.assertEqual(len(slowest), 1)
+        self.assertEqual(slowest[0].file_id, "pkg://models/a.sql")
+        self.assertEqual(slowest[0].parse_file_type, "model")
+        self.assertEqual(slowest[0].elapsed, 5.0)
+        self.assertEqual(slowest[0].render_elapsed, 2.0)
+
+    def test_unknown_phase(self):
+        with self.assertRaises(ValueError):
+            with self.timer.time_phase("compile", "pkg://models/a.sql"):
+                pass
+
+
+class TestParseTiming(unittest.TestCase):
+    def test_only_timed_when_enabled(self):
+        with time_file("pkg://models/a.sql"), time_phase(RENDER):
+            pass
+        self.assertIsNone(perf.get_parse_timer())
+
+        with parse_timing() as timer:
+            self.assertIs(perf.get_parse_timer(), timer)
+            with time_file("pkg://models/a.sql", "model"), time_phase(RENDER):
+                pass
+        self.assertIsNone(perf.get_parse_timer())
+        self.assertEqual(list(timer.files), ["pkg://models/a.sql"])
+        self.assertGreater(timer.files["pkg://models/a.sql"].elapsed, 0)
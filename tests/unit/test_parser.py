@@ -41,6 +41,8 @@ from dbt.parser.models import (
     _get_stable_sample_result,
     _get_sample_result,
 )
+from dbt.parser.parallel import parallel_parse_supported, parse_files_in_parallel
+from dbt_extractor import py_extract_from_source
 from dbt.parser.schemas import (
     TestablePatchParser,
     ModelPatchParser,
@@ -948,6 +950,45 @@ class ModelParserTest(BaseParserTest):
         with self.assertRaises(CompilationError):
             self.parser.parse_file(block)
 
+    @unittest.skipUnless(parallel_parse_supported(), "requires the 'fork' start method")
+    def test_parse_files_in_parallel(self):
+        blocks = [
+            self.file_block_for(sql_model, "nested/model_1.sql"),
+            self.file_block_for("{{ config(enabled=False) }} select 1", "model_2.sql"),
+            self.file_block_for("select * from {{ ref('model_1') }}", "model_3.sql"),
+        ]
+        for block in blocks:
+            self.parser.manifest.files[block.file.file_id] = block.file
+        file_ids = [block.file.file_id for block in blocks]
+
+        parse_files_in_parallel(self.parser, file_ids, workers=2)
+
+        self.assert_has_manifest_lengths(self.parser.manifest, nodes=2, disabled=1)
+        self.assertEqual(
+            list(self.parser.manifest.nodes), ["model.snowplow.model_1", "model.snowplow.model_3"]
+        )
+        self.assertEqual(
+            self.parser.manifest.nodes["model.snowplow.model_3"].refs,
+            [RefArgs(name="model_1")],
+        )
+        self.assertIn("model.snowplow.model_2", self.parser.manifest.disabled)
+        self.assertEqual(self.parser.manifest.files[file_ids[1]].nodes, ["model.snowplow.model_2"])
+        self.assertEqual(self.parser.manifest._parsing_info.static_analysis_path_count, 3)
+
+    @unittest.skipUnless(parallel_parse_supported(), "requires the 'fork' start method")
+    def test_parse_files_in_parallel_error(self):
+        blocks = [
+            self.file_block_for(sql_model, "nested/model_1.sql"),
+            self.file_block_for(sql_model_parse_error, "model_2.sql"),
+        ]
+        for block in blocks:
+            self.parser.manifest.files[block.file.file_id] = block.file
+        file_ids = [block.file.file_id for block in blocks]
+
+        # failures are re-raised from the main process
+        with self.assertRaises(CompilationError):
+            parse_files_in_parallel(self.parser, file_ids, workers=2)
+
     def test_python_model_parse(self):
         block = self.file_block_for(python_model, "nested/py_model.py")
         self.parser.manifest.files[block.file.file_id] = block.file
@@ -1133,6 +1174,32 @@ class StaticModelParserTest(BaseParserTest):
 
         assert self.parser._has_banned_macro(node)
 
+    def test_extract_statically(self):
+        blocks = [
+            self.file_block_for(sql_model, "nested/model_1.sql"),
+            self.file_block_for("{% if x %}select 1{% endif %}", "nested/model_2.sql"),
+        ]
+        for block in blocks:
+            self.parser.manifest.files[block.file.file_id] = block.file
+        with mock.patch(
+            "dbt.parser.models.py_extract_from_source", wraps=py_extract_from_source
+        ) as extract, mock.patch.object(
+            self.parser, "_has_banned_macro", wraps=self.parser._has_banned_macro
+        ) as has_banned_macro:
+            self.parser.extract_statically([block.file.file_id for block in blocks])
+            self.assertEqual(extract.call_count, 2)
+            self.assertEqual(self.parser._static_results[blocks[1].contents], "cannot_parse")
+            for block in blocks:
+                self.parser.parse_file(block)
+            # the models are parsed with the results of the first pass
+            self.assertEqual(extract.call_count, 2)
+            # and the banned macro check already ran for the whole project
+            has_banned_macro.assert_not_called()
+        self.assertEqual(self.parser._static_results, {})
+        self.assertEqual(self.parser.manifest._parsing_info.static_analysis_parsed_path_count, 1)
+        node = self.parser.manifest.nodes["model.snowplow.model_1"]
+        self.assertEqual(node.config.materialized, "table")
+
 
 # TODO
 class StaticModelParserUnitTest(BaseParserTest):
@@ -0,0 +1,252 @@
+import os
+import pickle
+import tempfile
+import unittest
+from copy import deepcopy
+from unittest import mock
+
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SchemaSourceFile, SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import ModelNode
+from dbt.node_types import NodeType
+from dbt.parser.partial import PartialParsing
+from dbt.parser.partial_store import (
+    LazyMapping,
+    close_partial_parse_manifest,
+    compact_partial_parse_file,
+    extended_mashumaro_encoder,
+    is_partial_parse_file,
+    load_partial_parse_manifest,
+    write_partial_parse_file,
+)
+
+
+def make_model(name, env_vars=None):
+    source_file = SourceFile(
+        path=FilePath(
+            project_root="/users/root",
+            searched_path="models",
+            relative_path=f"{name}.sql",
+            modification_time=1.0,
+        ),
+        checksum=FileHash.from_contents(name),
+        project_name="my_test",
+        parse_file_type=ParseFileType.Model,
+        nodes=[f"model.my_test.{name}"],
+        env_vars=env_vars or [],
+    )
+    node = ModelNode(
+        package_name="my_test",
+        path=f"{name}.sql",
+        original_file_path=f"models/{name}.sql",
+        language="sql",
+        raw_code="select 1",
+        name=name,
+        resource_type=NodeType.Model,
+        unique_id=f"model.my_test.{name}",
+        fqn=["my_test", name],
+        database="test_db",
+        schema="test_schema",
+        alias=name,
+        checksum=FileHash.from_contents(name),
+    )
+    return source_file, node
+
+
+class TestPartialParseStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "partial_parse.msgpack")
+
+        files, nodes = {}, {}
+        for name in ("model_a", "model_b", "model_c"):
+            source_file, node = make_model(name, env_vars=["MY_VAR"] if name == "model_c" else [])
+            files[source_file.file_id] = source_file
+            nodes[node.unique_id] = node
+        schema_file = SchemaSourceFile(
+            path=FilePath(
+                project_root="/users/root",
+                searched_path="models",
+                relative_path="schema.yml",
+                modification_time=1.0,
+            ),
+            checksum=FileHash.from_contents("schema"),
+            project_name="my_test",
+            parse_file_type=ParseFileType.Schema,
+            dfy={"version": 2, "models": [{"name": "model_a"}]},
+        )
+        files[schema_file.file_id] = schema_file
+        self.manifest = Manifest(files=files, nodes=nodes, env_vars={"MY_VAR": "1"})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        self.manifest._macro_calls = {"abc": [["call", "my_macro"]]}
+        write_partial_parse_file(self.manifest, self.path)
+        self.assertTrue(is_partial_parse_file(self.path))
+
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertIsInstance(manifest.nodes, LazyMapping)
+        self.assertEqual(manifest.nodes.unloaded_count(), 3)
+        self.assertEqual(list(manifest.nodes), list(self.manifest.nodes))
+        self.assertEqual(manifest.env_vars, {"MY_VAR": "1"})
+        self.assertEqual(manifest._macro_calls, {"abc": [["call", "my_macro"]]})
+
+        node = manifest.nodes["model.my_test.model_b"]
+        self.assertEqual(manifest.nodes.unloaded_count(), 2)
+        self.assertIs(manifest.nodes["model.my_test.model_b"], node)
+        self.assertEqual(node, self.manifest.nodes["model.my_test.model_b"])
+        self.assertEqual(dict(manifest.files.items()), dict(self.manifest.files.items()))
+        self.assertIsInstance(manifest.files["my_test://models/schema.yml"], SchemaSourceFile)
+
+    def test_unchanged_files_are_not_loaded(self):
+        write_partial_parse_file(self.manifest, self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        new_files = deepcopy(self.manifest.files)
+
+        os.environ["MY_VAR"] = "1"
+        try:
+            partial_parsing = PartialParsing(saved_manifest, new_files)
+        finally:
+            del os.environ["MY_VAR"]
+        self.assertTrue(partial_parsing.skip_parsing())
+        # only the file that uses env vars had to be loaded
+        self.assertEqual(saved_manifest.files.unloaded_count(), 3)
+
+        new_files["my_test://models/model_a.sql"].checksum = FileHash.from_contents("changed")
+        partial_parsing.build_file_diff()
+        self.assertEqual(partial_parsing.file_diff["changed"], ["my_test://models/model_a.sql"])
+
+    def test_rewrite_copies_unloaded_entries(self):
+        write_partial_parse_file(self.manifest, self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        saved_manifest.nodes["model.my_test.model_a"].raw_code = "select 2"
+        del saved_manifest.nodes["model.my_test.model_b"]
+
+        write_partial_parse_file(saved_manifest, self.path)
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(list(manifest.nodes), ["model.my_test.model_a", "model.my_test.model_c"])
+        self.assertEqual(manifest.nodes["model.my_test.model_a"].raw_code, "select 2")
+        self.assertEqual(
+            manifest.nodes["model.my_test.model_c"], self.manifest.nodes["model.my_test.model_c"]
+        )
+        # the manifest read before the rewrite can still load its entries
+        self.assertEqual(
+            saved_manifest.nodes["model.my_test.model_c"],
+            self.manifest.nodes["model.my_test.model_c"],
+        )
+
+    def test_append_changed_entries(self):
+        write_partial_parse_file(self.manifest, self.path)
+        size = os.path.getsize(self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        # loading entries without changing them doesn't rewrite them
+        saved_manifest.nodes.load_all()
+        saved_manifest.nodes["model.my_test.model_a"].raw_code = "select 2"
+        node_entry = saved_manifest.nodes.get_saved("model.my_test.model_a")
+
+        write_partial_parse_file(saved_manifest, self.path)
+        appended = os.path.getsize(self.path) - size
+        # the changed node and a new index
+        self.assertLess(appended, size - node_entry.offset)
+
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(manifest.nodes["model.my_test.model_a"].raw_code, "select 2")
+        self.assertEqual(manifest.nodes.get_saved("model.my_test.model_a").offset, size)
+        self.assertEqual(
+            manifest.nodes.get_saved("model.my_test.model_b"),
+            saved_manifest.nodes.get_saved("model.my_test.model_b"),
+        )
+        self.assertEqual(dict(manifest.files.items()), dict(self.manifest.files.items()))
+
+    def test_append_again(self):
+        write_partial_parse_file(self.manifest, self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        saved_manifest.nodes["model.my_test.model_a"].raw_code = "select 2"
+        write_partial_parse_file(saved_manifest, self.path)
+        size = os.path.getsize(self.path)
+        # the saved location is the one just written
+        node_entry = saved_manifest.nodes.get_saved("model.my_test.model_a")
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(manifest.nodes.get_saved("model.my_test.model_a"), node_entry)
+
+        # as in 'dbt parse --watch', the same manifest is saved again. Only
+        # the entries changed since the last write are appended.
+        saved_manifest.nodes["model.my_test.model_b"].raw_code = "select 3"
+        write_partial_parse_file(saved_manifest, self.path)
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(manifest.nodes.get_saved("model.my_test.model_a"), node_entry)
+        self.assertEqual(manifest.nodes.get_saved("model.my_test.model_b").offset, size)
+        self.assertEqual(manifest.nodes["model.my_test.model_a"].raw_code, "select 2")
+        self.assertEqual(manifest.nodes["model.my_test.model_b"].raw_code, "select 3")
+        # entries that were never loaded can still be read
+        self.assertEqual(
+            saved_manifest.nodes["model.my_test.model_c"],
+            self.manifest.nodes["model.my_test.model_c"],
+        )
+
+    def test_rewrite_when_file_was_replaced(self):
+        write_partial_parse_file(self.manifest, self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        write_partial_parse_file(self.manifest, self.path)
+        size = os.path.getsize(self.path)
+        saved_manifest.nodes["model.my_test.model_a"].raw_code = "select 2"
+
+        write_partial_parse_file(saved_manifest, self.path)
+        self.assertLessEqual(os.path.getsize(self.path), size + 8)
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(manifest.nodes["model.my_test.model_a"].raw_code, "select 2")
+
+    def test_compaction(self):
+        write_partial_parse_file(self.manifest, self.path)
+        size = os.path.getsize(self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        for node in saved_manifest.nodes.values():
+            node.raw_code = "select 2"
+        with mock.patch("dbt.parser.partial_store.PARTIAL_PARSE_COMPACTION_RATIO", 0.2):
+            write_partial_parse_file(saved_manifest, self.path)
+        self.assertLess(os.path.getsize(self.path), size + 32)
+
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual([node.raw_code for node in manifest.nodes.values()], ["select 2"] * 3)
+        self.assertEqual(dict(manifest.files.items()), dict(self.manifest.files.items()))
+
+    def test_compact_partial_parse_file(self):
+        write_partial_parse_file(self.manifest, self.path)
+        saved_manifest = load_partial_parse_manifest(self.path)
+        saved_manifest.nodes["model.my_test.model_a"].raw_code = "select 2"
+        write_partial_parse_file(saved_manifest, self.path)
+        size = os.path.getsize(self.path)
+
+        compact_partial_parse_file(self.path)
+        self.assertLess(os.path.getsize(self.path), size)
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(manifest.nodes.unloaded_count(), 3)
+        self.assertEqual(manifest.nodes["model.my_test.model_a"].raw_code, "select 2")
+        self.assertEqual(
+            manifest.nodes["model.my_test.model_b"], self.manifest.nodes["model.my_test.model_b"]
+        )
+
+    def test_close_partial_parse_manifest(self):
+        write_partial_parse_file(self.manifest, self.path)
+        manifest = load_partial_parse_manifest(self.path)
+        close_partial_parse_manifest(manifest)
+        self.assertFalse(manifest.files.store.is_open)
+        # manifests that weren't read lazily have nothing to close
+        close_partial_parse_manifest(self.manifest)
+
+    def test_copies_are_plain_dictionaries(self):
+        write_partial_parse_file(self.manifest, self.path)
+        manifest = load_partial_parse_manifest(self.path)
+        copied = pickle.loads(pickle.dumps(manifest))
+        self.assertIs(type(copied.nodes), dict)
+        self.assertEqual(copied.nodes, self.manifest.nodes)
+        self.assertIs(type(manifest.deepcopy().files), dict)
+
+    def test_legacy_file(self):
+        with open(self.path, "wb") as fp:
+            fp.write(self.manifest.to_msgpack(extended_mashumaro_encoder))
+        self.assertFalse(is_partial_parse_file(self.path))
+        manifest = load_partial_parse_manifest(self.path)
+        self.assertEqual(manifest.nodes, self.manifest.nodes)
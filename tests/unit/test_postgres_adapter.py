@@ -1,5 +1,6 @@
 import agate
 import decimal
+from datetime import datetime, timezone
 import unittest
 from unittest import mock
 
@@ -8,10 +9,12 @@ from dbt.task.debug import DebugTask
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.adapters.postgres import Plugin as PostgresPlugin
+from dbt.adapters.postgres.connections import _CopyStream
+from dbt.adapters.postgres.impl import _copy_value
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.clients import agate_helper
-from dbt.exceptions import DbtValidationError, DbtConfigError
+from dbt.exceptions import DbtValidationError, DbtConfigError, DbtRuntimeError
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
 
@@ -352,6 +355,56 @@ class TestPostgresAdapter(unittest.TestCase):
         )
         self.assertEqual(exceptions, [])
 
+    @mock.patch.object(PostgresAdapter, "execute_macro")
+    @mock.patch.object(PostgresAdapter, "_get_catalog_relations_by_info_schema")
+    def test_iter_catalog_yields_each_query(self, mock_get_relations, mock_execute):
+        column_names = ["table_database", "table_schema", "table_name"]
+
+        def execute_macro(macro_name, kwargs, **_):
+            database = kwargs["information_schema"].database
+            if database == "broken":
+                raise DbtRuntimeError("no access")
+            return agate.Table(rows=[(database, "foo", "bar")], column_names=column_names)
+
+        mock_execute.side_effect = execute_macro
+        mock_get_relations.return_value = {
+            mock.MagicMock(database=database): [mock.MagicMock(schema="foo")]
+            for database in ("dbt", "other", "broken")
+        }
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {("dbt", "foo"), ("other", "foo")}
+
+        tables, exceptions = [], []
+        for result in self.adapter.iter_catalog(mock_manifest):
+            if isinstance(result, Exception):
+                exceptions.append(result)
+            else:
+                tables.append(result)
+        self.assertEqual(
+            sorted(tuple(row) for table in tables for row in table),
+            [("dbt", "foo", "bar"), ("other", "foo", "bar")],
+        )
+        self.assertEqual(len(tables), 2)
+        self.assertEqual([str(e) for e in exceptions], ["Runtime Error\n  no access"])
+
+    @mock.patch.object(PostgresAdapter, "execute_macro")
+    @mock.patch.object(PostgresAdapter, "_get_catalog_relations_by_info_schema")
+    def test_iter_catalog_by_relations_batches(self, mock_get_relations, mock_execute):
+        mock_execute.return_value = agate.Table(
+            rows=[], column_names=["table_database", "table_schema", "table_name"]
+        )
+        relations = [mock.MagicMock(schema="foo", identifier=str(i)) for i in range(250)]
+        mock_get_relations.return_value = {mock.MagicMock(database="dbt"): relations}
+
+        list(self.adapter.iter_catalog(mock.MagicMock(), {"model.test.a"}, by_relations=True))
+        batches = [call.kwargs["kwargs"]["relations"] for call in mock_execute.call_args_list]
+        self.assertEqual(sorted(len(batch) for batch in batches), [50, 100, 100])
+        self.assertEqual(
+            sorted(relation.identifier for batch in batches for relation in batch),
+            sorted(relation.identifier for relation in relations),
+        )
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -537,6 +590,76 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
         self._adapter = PostgresAdapter(self.config)
         self.adapter.verify_database("postgres")
 
+    def test_load_seed_rows_copies_from_stdin(self):
+        relation = self.adapter.Relation.create(
+            database="postgres",
+            schema="test_schema",
+            identifier="seed",
+            type="table",
+            quote_policy=self.adapter.config.quoting,
+        )
+        table = agate.Table(
+            [(1, "a\tb", True), (2, None, False)],
+            ["id", "name", "flag"],
+            [agate.data_types.Number(), agate.data_types.Text(), agate.data_types.Boolean()],
+        )
+        copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, stream, size: copied.append(
+            stream.read()
+        )
+
+        sql = self.adapter.load_seed_rows(relation, "id, name, flag", table)
+
+        self.assertEqual(sql, 'copy "postgres"."test_schema".seed (id, name, flag) from stdin')
+        self.cursor.copy_expert.assert_called_once_with(sql, mock.ANY, size=mock.ANY)
+        self.assertEqual(copied, ["1\ta\\tb\tt\n2\t\\N\tf\n"])
+        # no query for the time zone without datetime columns
+        self.mock_execute.assert_called_once_with("BEGIN", None)
+
+    def test_load_seed_rows_converts_datetimes(self):
+        relation = self.adapter.Relation.create(
+            database="postgres",
+            schema="test_schema",
+            identifier="seed",
+            type="table",
+            quote_policy=self.adapter.config.quoting,
+        )
+        table = agate.Table(
+            [(datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc),)],
+            ["created_at"],
+            [agate.data_types.DateTime()],
+        )
+        self.cursor.fetchall.return_value = [("America/New_York",)]
+        self.cursor.description = [("current_setting", 25)]
+        copied = []
+        self.cursor.copy_expert.side_effect = lambda sql, stream, size: copied.append(
+            stream.read()
+        )
+
+        self.adapter.load_seed_rows(relation, "created_at", table)
+
+        self.mock_execute.assert_has_calls(
+            [mock.call("/* dbt */\nselect current_setting('TimeZone')", None)]
+        )
+        self.assertEqual(copied, ["2023-01-01 07:00:00\n"])
+
+
+class TestPostgresCopy(unittest.TestCase):
+    def test_copy_value(self):
+        self.assertEqual(_copy_value(None, None), "\\N")
+        self.assertEqual(_copy_value(True, None), "t")
+        self.assertEqual(_copy_value(decimal.Decimal("1E+2"), None), "100")
+        self.assertEqual(_copy_value(decimal.Decimal("1.50"), None), "1.5")
+        self.assertEqual(_copy_value("a\\b\nc\rd", None), "a\\\\b\\nc\\rd")
+
+    def test_copy_stream(self):
+        stream = _CopyStream(iter(["abc", "", "defg"]))
+        self.assertEqual(stream.read(2), "ab")
+        self.assertEqual(stream.read(2), "c")
+        self.assertEqual(stream.read(2), "de")
+        self.assertEqual(stream.read(), "fg")
+        self.assertEqual(stream.read(2), "")
+
 
 class TestPostgresFilterCatalog(unittest.TestCase):
     def test__catalog_filter_table(self):
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from dbt.adapters.postgres import PostgresRelation
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.model_config import SeedConfig
+from dbt.contracts.graph.nodes import SeedNode
+from dbt.contracts.results import RunResult, RunStatus
+from dbt.node_types import NodeType
+from dbt.task.retry import RETRYABLE_STATUSES
+from dbt.task.seed import SeedRunner
+from dbt.task.seed_state import SeedLoads, SeedState, seed_checksum
+
+
+class TestSeedLoads(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.path = os.path.join(self.tempdir.name, "seed_state.json")
+        with open(os.path.join(self.tempdir.name, "seed.csv"), "w") as fp:
+            fp.write("a,b\n1,2\n")
+
+        self.adapter = mock.MagicMock()
+        self.adapter.Relation = PostgresRelation
+        self.adapter.config.quoting = {}
+        self.adapter.config.credentials.database = "dbt"
+        self.table = PostgresRelation.create("dbt", "analytics", "seed", type="table")
+        self.adapter.get_relation.return_value = self.table
+
+    def make_seed(self, checksum=None, **config):
+        return SeedNode(
+            name="seed",
+            database="dbt",
+            schema="analytics",
+            alias="seed",
+            resource_type=NodeType.Seed,
+            unique_id="seed.root.seed",
+            fqn=["root", "seed"],
+            package_name="root",
+            path="seed.csv",
+            original_file_path="seed.csv",
+            root_path=self.tempdir.name,
+            config=SeedConfig(**config),
+            checksum=checksum or FileHash.from_contents("a,b\n1,2\n"),
+        )
+
+    def load(self, node, skip_unchanged=True, full_refresh=False, status=RunStatus.Success):
+        seed_loads = SeedLoads(self.path, "dev")
+        unchanged = seed_loads.start(self.adapter, [node], skip_unchanged, full_refresh)
+        if node.unique_id not in unchanged:
+            seed_loads.finish([RunResult.from_node(node, status, None)])
+        return unchanged
+
+    def test_skips_unchanged_seeds(self):
+        node = self.make_seed()
+        self.assertEqual(self.load(node), set())
+        state = SeedState.read(self.path)
+        self.assertEqual(list(state.relations), ['"dbt"."analytics"."seed"'])
+        self.assertEqual(state.relations['"dbt"."analytics"."seed"'].target_name, "dev")
+
+        self.assertEqual(self.load(node), {"seed.root.seed"})
+        self.assertEqual(self.load(self.make_seed()), {"seed.root.seed"})
+
+    def test_reloads_changed_seeds(self):
+        self.load(self.make_seed())
+        self.assertEqual(self.load(self.make_seed(FileHash.from_contents("a,b\n"))), set())
+        self.assertEqual(
+            self.load(self.make_seed(FileHash.from_contents("a,b\n"))), {"seed.root.seed"}
+        )
+        self.assertEqual(self.load(self.make_seed(delimiter=";")), set())
+
+    def test_reloads_without_skip_unchanged_or_with_full_refresh(self):
+        node = self.make_seed()
+        self.load(node)
+        self.assertEqual(self.load(node, skip_unchanged=False), set())
+        self.assertEqual(self.load(node, full_refresh=True), set())
+        self.assertEqual(self.load(node), {"seed.root.seed"})
+        self.assertEqual(self.load(self.make_seed(full_refresh=True)), set())
+        self.assertEqual(self.load(self.make_seed(full_refresh=True)), set())
+
+    def test_reloads_missing_tables(self):
+        node = self.make_seed()
+        self.load(node)
+        self.adapter.get_relation.return_value = None
+        self.assertEqual(self.load(node), set())
+
+    def test_failed_load_is_forgotten(self):
+        node = self.make_seed()
+        self.load(node)
+        self.assertEqual(self.load(node, skip_unchanged=False, status=RunStatus.Error), set())
+        self.assertEqual(SeedState.read(self.path).relations, {})
+        self.assertEqual(self.load(node), set())
+
+    def test_unreadable_state(self):
+        with open(self.path, "w") as fp:
+            fp.write("{")
+        self.assertEqual(SeedLoads(self.path, "dev").state.relations, {})
+
+    def test_checksum_of_large_seed(self):
+        node = self.make_seed(FileHash.path("seed.csv"))
+        checksum = seed_checksum(node)
+        self.assertTrue(checksum.startswith("sha256_bytes:"))
+        with open(os.path.join(self.tempdir.name, "seed.csv"), "a") as fp:
+            fp.write("3,4\n")
+        self.assertNotEqual(seed_checksum(node), checksum)
+
+    def test_unchanged_seeds_are_not_retried(self):
+        node = self.make_seed()
+        self.load(node)
+        seed_loads = SeedLoads(self.path, "dev")
+        self.assertEqual(seed_loads.start(self.adapter, [node], True, False), {node.unique_id})
+
+        runner = SeedRunner(mock.MagicMock(), self.adapter, node, 1, 1)
+        runner.unchanged = True
+        with mock.patch("dbt.task.run.ModelRunner.execute") as execute:
+            result = runner.execute(node, mock.MagicMock())
+        execute.assert_not_called()
+        self.assertEqual(result.status, RunStatus.Success)
+        self.assertEqual(result.message, "NO CHANGES")
+        # neither 'dbt retry' nor 'result:skipped' select the seed
+        self.assertNotIn(result.status, RETRYABLE_STATUSES)
+        self.assertNotEqual(result.status, "skipped")
+
+        # and it stays unchanged for the next run
+        seed_loads.finish([result])
+        self.assertEqual(self.load(node), {node.unique_id})
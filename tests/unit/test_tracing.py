@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from dbt import tracing
+from dbt.tracing import Tracer, get_tracer, span, traced
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.tracer = Tracer()
+
+    def test_nested_spans_on_threads(self):
+        def run_node():
+            with self.tracer.span("execute", "node", unique_id="model.test.b"):
+                pass
+
+        with self.tracer.span("execute nodes", "run") as outer:
+            outer.set_attribute("threads", 1)
+            thread = threading.Thread(target=run_node, name="Thread-1")
+            thread.start()
+            thread.join()
+
+        trace = self.tracer.to_chrome_trace()
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual([e["name"] for e in events], ["execute nodes", "execute"])
+        outer_event, inner_event = events
+        self.assertEqual(outer_event["cat"], "run")
+        self.assertEqual(outer_event["args"], {"threads": 1})
+        self.assertEqual(inner_event["args"], {"unique_id": "model.test.b"})
+        self.assertNotEqual(outer_event["tid"], inner_event["tid"])
+        # the thread ran within the outer span
+        self.assertGreaterEqual(inner_event["ts"], outer_event["ts"])
+        self.assertLessEqual(
+            inner_event["ts"] + inner_event["dur"], outer_event["ts"] + outer_event["dur"]
+        )
+        for event in events:
+            self.assertGreaterEqual(event["tdur"], 0)
+
+        thread_names = {
+            e["tid"]: e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"
+        }
+        self.assertEqual(thread_names[inner_event["tid"]], "Thread-1")
+        self.assertEqual(thread_names[outer_event["tid"]], threading.current_thread().name)
+
+    def test_span_records_errors(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span("compile", "node"):
+                raise ValueError("bad")
+        self.assertEqual(self.tracer.spans[0].attributes, {"error": "ValueError"})
+        self.assertIsNotNone(self.tracer.spans[0].end)
+
+
+class TestTracing(unittest.TestCase):
+    def test_disabled(self):
+        @traced("double")
+        def double(x):
+            return x * 2
+
+        with span("load manifest") as current_span:
+            self.assertIsNone(current_span)
+        self.assertEqual(double(2), 4)
+        self.assertIsNone(get_tracer())
+
+    def test_write_trace(self):
+        @traced("double", "test", lambda x: {"x": x})
+        def double(x):
+            return x * 2
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.json")
+            with tracing.tracing(enable=True, outfile=path, name="dbt run"):
+                self.assertIsNotNone(get_tracer())
+                self.assertEqual(double(2), 4)
+            self.assertIsNone(get_tracer())
+
+            with open(path) as fp:
+                trace = json.load(fp)
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual([e["name"] for e in events], ["dbt run", "double"])
+        self.assertEqual(events[1]["args"], {"x": 2})
@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SourceFile
+from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.watch import ProjectFileWatcher, _resident_manifest, watch_project
+
+
+class TestProjectFileWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.project_root = self.tmpdir.name
+        os.mkdir(os.path.join(self.project_root, "models"))
+        self.config = mock.MagicMock(
+            project_name="my_test",
+            project_root=self.project_root,
+            model_paths=["models"],
+            macro_paths=["macros"],
+            snapshot_paths=[],
+            analysis_paths=[],
+            test_paths=[],
+            generic_test_paths=[],
+            seed_paths=[],
+            docs_paths=["models"],
+            all_source_paths=["models"],
+        )
+        self.files = {}
+        self.write_file("models/model_a.sql", "select 1")
+        self.write_file("models/model_b.sql", "select 2")
+        self.watcher = ProjectFileWatcher(self.config)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_file(self, path, contents, mtime=1.0):
+        abs_path = os.path.join(self.project_root, path)
+        with open(abs_path, "w") as fp:
+            fp.write(contents)
+        os.utime(abs_path, (mtime, mtime))
+        searched_path, relative_path = path.split("/", 1)
+        source_file = SourceFile(
+            path=FilePath(
+                project_root=self.project_root,
+                searched_path=searched_path,
+                relative_path=relative_path,
+                modification_time=mtime,
+            ),
+            checksum=FileHash.from_contents(contents),
+            project_name="my_test",
+            parse_file_type=ParseFileType.Model,
+        )
+        self.files[source_file.file_id] = source_file
+
+    def test_no_changes(self):
+        self.assertIsNone(self.watcher.poll(self.files))
+
+    def test_touched_file_is_not_changed(self):
+        os.utime(os.path.join(self.project_root, "models/model_a.sql"), (2.0, 2.0))
+        self.assertIsNone(self.watcher.poll(self.files))
+
+    def test_file_diff(self):
+        with open(os.path.join(self.project_root, "models/model_a.sql"), "w") as fp:
+            fp.write("select 3\n")
+        with open(os.path.join(self.project_root, "models/model_c.sql"), "w") as fp:
+            fp.write("select 4")
+        os.remove(os.path.join(self.project_root, "models/model_b.sql"))
+
+        file_diff = self.watcher.poll(self.files)
+        self.assertEqual(file_diff.deleted, ["models/model_b.sql"])
+        self.assertEqual(
+            [(f.path, f.content) for f in file_diff.changed], [("models/model_a.sql", "select 3")]
+        )
+        self.assertEqual(
+            [(f.path, f.content) for f in file_diff.added], [("models/model_c.sql", "select 4")]
+        )
+        self.assertIsNone(self.watcher.poll(self.files))
+
+    def test_all_touched_files_without_manifest(self):
+        os.utime(os.path.join(self.project_root, "models/model_a.sql"), (2.0, 2.0))
+        os.remove(os.path.join(self.project_root, "models/model_b.sql"))
+
+        file_diff = self.watcher.poll(None)
+        self.assertEqual(file_diff.deleted, ["models/model_b.sql"])
+        self.assertEqual([f.path for f in file_diff.added], ["models/model_a.sql"])
+
+    def test_file_deleted_after_scan(self):
+        os.utime(os.path.join(self.project_root, "models/model_a.sql"), (2.0, 2.0))
+        with open(os.path.join(self.project_root, "models/model_c.sql"), "w") as fp:
+            fp.write("select 4")
+
+        read_input_file = self.watcher.read_input_file
+
+        def delete_then_read(path):
+            os.remove(os.path.join(self.project_root, path))
+            return read_input_file(path)
+
+        with mock.patch.object(self.watcher, "read_input_file", side_effect=delete_then_read):
+            file_diff = self.watcher.poll(self.files)
+        self.assertEqual(file_diff.deleted, ["models/model_a.sql"])
+        self.assertEqual(file_diff.changed, [])
+        self.assertEqual(file_diff.added, [])
+        self.assertIsNone(self.watcher.poll(self.files))
+
+    def test_resident_manifest(self):
+        manifest = Manifest(files=self.files)
+        manifest.rebuild_ref_lookup()
+        resident = _resident_manifest(manifest)
+        self.assertIs(resident.files, manifest.files)
+        self.assertIsNone(resident._ref_lookup)
+
+    def watch(self, manifest, parses, polls):
+        # polls 'polls' times, then is interrupted
+        sleeps = [None] * polls + [KeyboardInterrupt()]
+        with mock.patch("dbt.parser.watch.time.sleep", side_effect=sleeps), mock.patch(
+            "dbt.parser.watch.ProjectFileWatcher.poll", return_value=mock.MagicMock()
+        ), mock.patch(
+            "dbt.parser.watch._load_manifest", side_effect=parses
+        ) as load_manifest, mock.patch(
+            "dbt.parser.watch.get_flags", return_value=mock.MagicMock(PARTIAL_PARSE=True)
+        ):
+            return watch_project(self.config, manifest, 0), load_manifest
+
+    def test_watch_returns_last_manifest(self):
+        manifest = Manifest(files=self.files)
+        parsed = Manifest(files=self.files)
+        result, load_manifest = self.watch(manifest, [parsed], polls=1)
+        self.assertIs(result, parsed)
+        self.assertEqual(load_manifest.call_count, 1)
+
+    def test_watch_reparses_after_failed_parse(self):
+        # a failed partial parse can leave the shared contents of the
+        # manifest modified, so it isn't returned
+        manifest = Manifest(files=self.files)
+        reparsed = Manifest(files=self.files)
+        result, load_manifest = self.watch(manifest, [ValueError("boom"), reparsed], polls=1)
+        self.assertIs(result, reparsed)
+        self.assertEqual(load_manifest.call_count, 2)
+        # the project is parsed from scratch on exit
+        self.assertEqual(load_manifest.call_args_list[-1], mock.call(self.config))
@@ -3,6 +3,8 @@ from collections.abc import Sequence
 from typing import Any, Optional, Callable, Iterable, Dict, Union
 
 from . import data_types as data_types
+from . import exceptions as exceptions
+from . import utils as utils
 from .data_types import (
     Text as Text,
     Number as Number,
@@ -80,6 +82,8 @@ class TypeTester:
     def __init__(
         self, force: Any = ..., limit: Optional[Any] = ..., types: Optional[Any] = ...
     ) -> None: ...
+    _force: Dict[str, data_types.DataType]
+    _possible_types: Sequence[data_types.DataType]
     def run(self, rows: Any, column_names: Any): ...
 
 class MaxPrecision:
@@ -0,0 +1,3 @@
+from typing import Any, List, Sequence
+
+def deduplicate(values: Sequence[Any], column_names: bool = ...) -> List[Any]: ...
@@ -1,4 +1,5 @@
 from typing import Tuple
+from . import lexer
 from . import sql
 from . import tokens
 
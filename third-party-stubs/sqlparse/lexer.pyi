@@ -0,0 +1,5 @@
+from typing import Iterator, Tuple
+
+from .tokens import _TokenType
+
+def tokenize(sql: str) -> Iterator[Tuple[_TokenType, str]]: ...
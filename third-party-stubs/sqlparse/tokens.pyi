@@ -1,4 +1,6 @@
 class _TokenType(tuple): ...
 
+Comment: _TokenType = _TokenType()
 Keyword: _TokenType = _TokenType()
 Punctuation: _TokenType = _TokenType()
+Whitespace: _TokenType = _TokenType()